@@ -0,0 +1,173 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import synthetic_class, synthetic_enum, write_schema_bundle, write_schema_tree
+from src.bundle_loader import load_bundle
+from src.compiler import compile_directory
+from src.enum_generator import generate_enum_class, to_java_constant, to_java_constants
+from src.java_method_generator import generate_equals, generate_fields_block, generate_getters_and_setters, \
+    generate_hash_code
+from src.naming import clear_name_caches
+from src.schema_parser import SchemaParser, load_schema
+
+ENUM_VALUES = 10_000
+CLASS_FIELDS = 1_000
+TREE_DEFINITIONS = 10_000
+BUNDLE_DEFINITIONS = 20_000
+BUNDLE_ROOTS = 5
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class Stage:
+    name: str
+    items: int
+    run: Callable[[], object]
+    setup: Optional[Callable[[], None]] = None
+
+
+def build_stages(scale: float, work_dir: Path) -> List[Stage]:
+    enum_class = synthetic_enum(max(1, int(ENUM_VALUES * scale)))
+    java_class = synthetic_class(max(1, int(CLASS_FIELDS * scale)))
+    fields = java_class.fields
+
+    tree_definitions = max(100, int(TREE_DEFINITIONS * scale))
+    schema_dir = work_dir / "schemas"
+    write_schema_tree(schema_dir, tree_definitions)
+    output_dir = work_dir / "java"
+
+    bundle_definitions = max(BUNDLE_ROOTS, int(BUNDLE_DEFINITIONS * scale))
+    bundle_path = work_dir / "bundle.json"
+    # The last definitions are the worst case for the lazy index, which scans only as far as the requested keys.
+    bundle_roots = write_schema_bundle(bundle_path, bundle_definitions)[-BUNDLE_ROOTS:]
+
+    def convert_constants():
+        for value in enum_class.values:
+            to_java_constant(value)
+
+    return [
+        Stage("to_java_constant", len(enum_class.values), convert_constants, clear_name_caches),
+        Stage("to_java_constants", len(enum_class.values), lambda: to_java_constants(enum_class.values),
+              clear_name_caches),
+        Stage("fields_block", len(fields), lambda: generate_fields_block(fields), clear_name_caches),
+        Stage("getters_and_setters", len(fields), lambda: generate_getters_and_setters(fields), clear_name_caches),
+        Stage("equals", len(fields), lambda: generate_equals(java_class.name, fields), clear_name_caches),
+        Stage("hash_code", len(fields), lambda: generate_hash_code(fields), clear_name_caches),
+        Stage("enum_class", len(enum_class.values), lambda: generate_enum_class(enum_class, "ocpp.bench"),
+              clear_name_caches),
+        Stage("file_output", tree_definitions,
+              lambda: compile_directory(schema_dir, output_dir, "ocpp.bench", workers=1, incremental=False),
+              clear_name_caches),
+        Stage("bundle_json_load", bundle_definitions,
+              lambda: SchemaParser().parse_document(str(bundle_path), load_schema(bundle_path), "Bundle")),
+        Stage("bundle_lazy_roots", bundle_definitions,
+              lambda: SchemaParser().parse_roots(str(bundle_path), bundle_roots, load_bundle(bundle_path))),
+    ]
+
+
+def measure(stage: Stage, repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        if stage.setup:
+            stage.setup()
+        start = time.perf_counter()
+        stage.run()
+        timings.append(time.perf_counter() - start)
+
+    if stage.setup:
+        stage.setup()
+    tracemalloc.start()
+    stage.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timings)
+    return {
+        "items": stage.items,
+        "seconds": seconds,
+        "throughput": stage.items / seconds if seconds else float("inf"),
+        "peak_memory_bytes": peak
+    }
+
+
+def run_benchmarks(scale: float = 1.0, repeat: int = DEFAULT_REPEAT, only: Optional[List[str]] = None) -> dict:
+    with tempfile.TemporaryDirectory(prefix="jsonschema2javaclass-bench-") as work_dir:
+        stages = build_stages(scale, Path(work_dir))
+        results = {stage.name: measure(stage, repeat) for stage in stages if not only or stage.name in only}
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "stages": results
+    }
+
+
+def check_regressions(baseline: dict, current: dict, tolerance: float) -> List[str]:
+    regressions = []
+    if baseline.get("scale") != current.get("scale"):
+        regressions.append(f"scale mismatch: baseline {baseline.get('scale')}, current {current.get('scale')}")
+        return regressions
+
+    for name, expected in baseline.get("stages", {}).items():
+        actual = current["stages"].get(name)
+        if actual is None:
+            continue
+        if actual["throughput"] < expected["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {actual['throughput']:.0f}/s "
+                               f"< baseline {expected['throughput']:.0f}/s")
+        if actual["peak_memory_bytes"] > expected["peak_memory_bytes"] * (1 + tolerance):
+            regressions.append(f"{name}: peak memory {actual['peak_memory_bytes']} B "
+                               f"> baseline {expected['peak_memory_bytes']} B")
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{'stage':<22}{'items':>10}{'seconds':>12}{'items/s':>14}{'peak KiB':>12}"]
+    for name, stage in report["stages"].items():
+        lines.append(f"{name:<22}{stage['items']:>10}{stage['seconds']:>12.4f}{stage['throughput']:>14.0f}"
+                     f"{stage['peak_memory_bytes'] / 1024:>12.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Java generators on synthetic OCPP-style schemas.")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplier for the synthetic sizes (10k enum values, 1k fields, 10k definitions, "
+                             "20k bundle definitions)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per stage, best is kept")
+    parser.add_argument("--stage", action="append", dest="stages", help="run only the given stage(s)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--check", metavar="PATH", help="compare the results against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown or memory growth in --check mode")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scale, args.repeat, args.stages)
+    print(format_report(report))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.check:
+        baseline = json.loads(Path(args.check).read_text(encoding="utf-8"))
+        regressions = check_regressions(baseline, report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against '{args.check}' (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_REPEAT = 7
+# A saved budget is the measured time plus this margin: loose enough for run-to-run noise, tight enough that a
+# regression doubling an import fails --check.
+DEFAULT_MARGIN = 0.25
+# Load on a shared machine slows every import for a while, so a module over budget is measured again with this many
+# times the imports before it counts as a regression.
+RECHECK_FACTOR = 3
+DEFAULT_BUDGET = Path(__file__).with_name("import_time_budget.json")
+MODULES = ["src.main", "src.compiler", "src.enum_generator", "src.class_generator"]
+
+# Modules a command must not load: they belong to other commands or to options that were not requested.
+FORBIDDEN_IMPORTS = {
+    "src.main": ["asyncio", "concurrent.futures", "cProfile", "ctypes", "tracemalloc", "src.async_pipeline",
+                 "src.class_generator", "src.compiler", "src.enum_generator", "src.watcher"],
+    "src.compiler": ["asyncio", "concurrent.futures", "cProfile", "src.class_generator", "src.enum_generator",
+                     "src.serializer_generator"],
+    "src.enum_generator": ["src.class_generator", "src.java_method_generator"]
+}
+
+
+def import_time_us(module: str) -> int:
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].rstrip() == f" {module}":
+            return int(fields[1])
+    raise ValueError(f"No import time reported for '{module}'")
+
+
+def loaded_modules(module: str) -> List[str]:
+    completed = subprocess.run([sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+                               stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    return completed.stdout.split()
+
+
+def forbidden_imports(module: str) -> List[str]:
+    loaded = set(loaded_modules(module))
+    return [forbidden for forbidden in FORBIDDEN_IMPORTS.get(module, []) if forbidden in loaded]
+
+
+def run_benchmarks(modules: List[str], repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    return {module: min(import_time_us(module) for _ in range(repeat)) / 1000 for module in modules}
+
+
+def budget_from_timings(timings: Dict[str, float], margin: float = DEFAULT_MARGIN) -> Dict[str, float]:
+    return {module: round(milliseconds * (1 + margin), 1) for module, milliseconds in timings.items()}
+
+
+def check_budget(budget: Dict[str, float], timings: Dict[str, float]) -> List[str]:
+    regressions = []
+    for module, limit_ms in budget.items():
+        actual_ms = timings.get(module)
+        if actual_ms is not None and actual_ms > limit_ms:
+            regressions.append(f"{module}: import takes {actual_ms:.1f} ms > budget {limit_ms:.1f} ms")
+    for module in timings:
+        regressions.extend(f"{module}: imports {forbidden}" for forbidden in forbidden_imports(module))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of the CLI and generator modules.")
+    parser.add_argument("--module", action="append", dest="modules", help="measure only the given module(s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="imports per module, best is kept")
+    parser.add_argument("--save", metavar="PATH", help="write the timings plus --margin as a JSON budget")
+    parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN,
+                        help="fraction added to the timings written by --save (default: %(default)s)")
+    parser.add_argument("--check", metavar="PATH", nargs="?", const=str(DEFAULT_BUDGET),
+                        help="compare the timings against a JSON budget (default: %(const)s)")
+    args = parser.parse_args(argv)
+
+    timings = run_benchmarks(args.modules or MODULES, args.repeat)
+    print(f"{'module':<26}{'import ms':>12}")
+    for module, milliseconds in timings.items():
+        print(f"{module:<26}{milliseconds:>12.1f}")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(budget_from_timings(timings, args.margin), indent=2) + "\n",
+                                   encoding="utf-8")
+
+    if args.check:
+        budget = json.loads(Path(args.check).read_text(encoding="utf-8"))
+        over_budget = [module for module, milliseconds in timings.items()
+                       if module in budget and milliseconds > budget[module]]
+        if over_budget:
+            for module, milliseconds in run_benchmarks(over_budget, args.repeat * RECHECK_FACTOR).items():
+                timings[module] = min(timings[module], milliseconds)
+        regressions = check_budget(budget, timings)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"Within the import time budget of '{args.check}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable, List, Optional
+
+from src.java_model import Field, JavaClass, compact_model
+
+DEFAULT_FIELDS = 100_000
+FIELDS_PER_CLASS = 20
+_TYPES = ["String", "Integer", "Double", "Boolean", "CustomData", "List<String>", "IdToken", "EVSE"]
+
+
+def build_model(field_count: int) -> List[JavaClass]:
+    # Strings are decoded from JSON so they are distinct objects, as they are after json.load.
+    classes = []
+    for class_index in range(field_count // FIELDS_PER_CLASS):
+        fields = []
+        for field_index in range(FIELDS_PER_CLASS):
+            name, type_name, description = json.loads(json.dumps([
+                f"field{field_index}",
+                _TYPES[field_index % len(_TYPES)],
+                f"Shared description of attribute {field_index}."]))
+            fields.append(Field(name=name, type=type_name, description=description))
+        classes.append(JavaClass(name=f"Message{class_index}", fields=fields, description="Message."))
+    return classes
+
+
+def measure_footprint(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    model = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return size
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the memory footprint of dataclass and compact models.")
+    parser.add_argument("--fields", type=int, default=DEFAULT_FIELDS, help="total number of fields in the model")
+    args = parser.parse_args(argv)
+
+    dataclass_bytes = measure_footprint(lambda: build_model(args.fields))
+    compact_bytes = measure_footprint(lambda: [compact_model(java_class) for java_class in build_model(args.fields)])
+
+    print(f"fields:           {args.fields}")
+    print(f"dataclass models: {dataclass_bytes / 1024 / 1024:8.2f} MiB")
+    print(f"compact models:   {compact_bytes / 1024 / 1024:8.2f} MiB")
+    print(f"reduction:        {1 - compact_bytes / dataclass_bytes:8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+from typing import List, Union
+
+from src.java_model import EnumClass, Field, JavaClass
+
+_WORDS = ["Charging", "Station", "Min", "Set", "Max", "EVSE", "Id", "Token", "Reservation", "Status",
+          "Meter", "Value", "Phase", "L2", "Firmware", "Update", "SoC", "Cost", "Tariff", "Connector"]
+_FIELD_TYPES = ["String", "Integer", "Double", "Boolean", "int", "List<String>", "CustomDataType"]
+
+
+def synthetic_enum_values(count: int) -> List[str]:
+    values = []
+    for i in range(count):
+        first = _WORDS[i % len(_WORDS)]
+        second = _WORDS[(i // len(_WORDS)) % len(_WORDS)]
+        separator = ["", "-", "_", "."][i % 4]
+        values.append(f"{first}{separator}{second}{i}")
+    return values
+
+
+def synthetic_enum(count: int) -> EnumClass:
+    return EnumClass(name=f"Synthetic{count}Enum", values=synthetic_enum_values(count),
+                     description=f"Synthetic enumeration with {count} values.")
+
+
+def synthetic_fields(count: int) -> List[Field]:
+    fields = []
+    for i in range(count):
+        word = _WORDS[i % len(_WORDS)]
+        description = f"{word} attribute number {i}." if i % 2 == 0 else None
+        fields.append(Field(name=f"{word[0].lower()}{word[1:]}{i}", type=_FIELD_TYPES[i % len(_FIELD_TYPES)],
+                            description=description))
+    return fields
+
+
+def synthetic_class(count: int) -> JavaClass:
+    return JavaClass(name=f"Synthetic{count}Class", fields=synthetic_fields(count),
+                     description=f"Synthetic class with {count} fields.")
+
+
+def synthetic_message_schema(index: int, definitions: int) -> dict:
+    schema_definitions = {}
+    properties = {}
+    for i in range(definitions):
+        name = f"Message{index}Part{i}"
+        if i % 3 == 0:
+            schema_definitions[f"{name}EnumType"] = {
+                "javaType": f"{name}Enum",
+                "type": "string",
+                "additionalProperties": False,
+                "enum": synthetic_enum_values(8)
+            }
+            properties[f"part{i}"] = {"$ref": f"#/definitions/{name}EnumType"}
+        else:
+            schema_definitions[f"{name}Type"] = {
+                "javaType": name,
+                "description": f"Synthetic data type {i}.\r\n",
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "id": {"type": "integer"},
+                    "label": {"type": "string", "maxLength": 50, "description": "Label.\r\n"},
+                    "values": {"type": "array", "items": {"type": "number"}},
+                    "enabled": {"type": "boolean"}
+                },
+                "required": ["id"]
+            }
+            properties[f"part{i}"] = {"$ref": f"#/definitions/{name}Type"}
+
+    return {
+        "$schema": "http://json-schema.org/draft-06/schema#",
+        "$id": f"urn:OCPP:Cp:2:2020:3:Message{index}Request",
+        "comment": "Synthetic OCPP-style schema",
+        "definitions": schema_definitions,
+        "type": "object",
+        "additionalProperties": False,
+        "properties": properties
+    }
+
+
+def write_schema_tree(directory: Union[str, Path], definitions: int, definitions_per_schema: int = 100) -> int:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    schemas = max(1, definitions // definitions_per_schema)
+    for index in range(schemas):
+        schema = synthetic_message_schema(index, definitions_per_schema)
+        (directory / f"Message{index}Request.json").write_text(json.dumps(schema), encoding="utf-8")
+    return schemas
+
+
+def write_schema_bundle(path: Union[str, Path], definitions: int) -> List[str]:
+    schema = synthetic_message_schema(0, definitions)
+    Path(path).write_text(json.dumps(schema, indent=2), encoding="utf-8")
+    return list(schema["definitions"])
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from src.compiler import CompileResult, RenderUnit, discover_schemas, finish_build, is_up_to_date, \
+    plan_parsed_schemas, record_job_result, render_unit, select_jobs, validate_packages
+from src.manifest import MANIFEST_NAME, Manifest, hash_bytes, hash_options, load_manifest
+from src.options import CLASS_STYLE_BEAN, EQUALS_STANDARD, LOOKUP_MAP, ON_CONFLICT_RENAME
+from src.output_writer import write_if_changed
+from src.schema_parser import SchemaParser, load_schema
+
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_IO_WORKERS = 8
+
+LoadedSchema = Tuple[Path, str, dict]
+RenderedFile = Tuple[str, bytes]
+
+
+async def compile_directory_async(schema_dir: Union[str, Path], output_dir: Union[str, Path], package: str,
+                                  workers: Optional[int] = None, incremental: bool = True,
+                                  shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                                  enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False,
+                                  equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                                  codecs: bool = False, queue_size: int = DEFAULT_QUEUE_SIZE,
+                                  io_workers: int = DEFAULT_IO_WORKERS) -> CompileResult:
+    if queue_size < 1 or io_workers < 1:
+        raise ValueError("queue_size and io_workers must be positive")
+    validate_packages(package, shared_package)
+    schema_dir = Path(schema_dir)
+    output_dir = Path(output_dir)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="jsonschema2javaclass-io") as io_executor:
+        paths = await loop.run_in_executor(io_executor, discover_schemas, schema_dir)
+        loaded = await _read_schemas(loop, io_executor, paths, queue_size)
+
+        options = hash_options(package, shared_package=shared_package, on_conflict=on_conflict,
+                               enum_lookup=enum_lookup, enum_benchmarks=enum_benchmarks, equals_mode=equals_mode,
+                               class_style=class_style, codecs=codecs)
+        schemas = {path.relative_to(schema_dir).as_posix(): content_hash for path, content_hash, _ in loaded}
+        previous = Manifest()
+        if incremental:
+            previous = await loop.run_in_executor(io_executor, load_manifest, output_dir / MANIFEST_NAME)
+        if await loop.run_in_executor(io_executor, is_up_to_date, previous, options, schemas, output_dir):
+            return CompileResult(unchanged=[output_dir / relative for relative in previous.outputs])
+
+        plan = plan_parsed_schemas(*_parse_loaded(schema_dir, loaded), package, shared_package, on_conflict,
+                                   enum_lookup, enum_benchmarks, equals_mode, class_style, codecs)
+        manifest = Manifest(options=options, schemas=schemas)
+        result = CompileResult(conflicts=plan.conflicts, warnings=plan.warnings)
+        jobs = await loop.run_in_executor(io_executor, select_jobs, plan, output_dir, previous, manifest, result)
+
+        def on_written(job_result: Tuple[str, str, bool]) -> None:
+            record_job_result(output_dir, manifest, result, job_result)
+
+        if jobs:
+            with _render_executor(workers) as render_executor:
+                await _render_and_write(loop, render_executor, io_executor, _chunk_jobs(jobs, workers), queue_size,
+                                        io_workers, on_written)
+
+        await loop.run_in_executor(io_executor, finish_build, output_dir, previous, manifest, result)
+    return result
+
+
+def compile_directory_pipelined(*args, **kwargs) -> CompileResult:
+    return asyncio.run(compile_directory_async(*args, **kwargs))
+
+
+async def _read_schemas(loop: asyncio.AbstractEventLoop, io_executor: Executor, paths: List[Path],
+                        queue_size: int) -> List[LoadedSchema]:
+    reads: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def schedule_reads():
+        for path in paths:
+            await reads.put(loop.run_in_executor(io_executor, _load_source, path))
+        await reads.put(None)
+
+    producer = asyncio.ensure_future(schedule_reads())
+    loaded = []
+    try:
+        while True:
+            read = await reads.get()
+            if read is None:
+                break
+            loaded.append(await read)
+        await producer
+    finally:
+        producer.cancel()
+        _discard_pending(reads)
+    return loaded
+
+
+def _load_source(path: Path) -> LoadedSchema:
+    with open(path, "rb") as schema_file:
+        content = schema_file.read()
+    return path, hash_bytes(content), json.loads(content)
+
+
+def _parse_loaded(schema_dir: Path, loaded: List[LoadedSchema]) -> Tuple[SchemaParser, Dict[str, str]]:
+    documents = {os.path.normpath(path): document for path, _, document in loaded}
+    parser = SchemaParser(loader=lambda uri: documents[uri] if uri in documents else load_schema(uri))
+    sources = {}
+    for path, _, document in loaded:
+        uri = os.path.normpath(path)
+        parser.parse_document(uri, document, path.stem)
+        sources[uri] = path.relative_to(schema_dir).as_posix()
+    return parser, sources
+
+
+def _render_executor(workers: Optional[int]) -> Executor:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="jsonschema2javaclass-render")
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _chunk_jobs(jobs: List[Tuple[RenderUnit, str]], workers: Optional[int]) -> List[List[Tuple[RenderUnit, str]]]:
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    return [jobs[start:start + chunksize] for start in range(0, len(jobs), chunksize)]
+
+
+def _render_chunk(chunk: List[Tuple[RenderUnit, str]]) -> List[RenderedFile]:
+    return [(path, render_unit(unit).encode("utf-8")) for unit, path in chunk]
+
+
+async def _render_and_write(loop: asyncio.AbstractEventLoop, render_executor: Executor, io_executor: Executor,
+                            chunks: List[List[Tuple[RenderUnit, str]]], queue_size: int, writers: int,
+                            on_written: Callable[[Tuple[str, str, bool]], None]) -> None:
+    rendered: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def schedule_renders():
+        for chunk in chunks:
+            await rendered.put(loop.run_in_executor(render_executor, _render_chunk, chunk))
+        for _ in range(writers):
+            await rendered.put(None)
+
+    async def write_rendered():
+        while True:
+            render = await rendered.get()
+            if render is None:
+                return
+            for path, content in await render:
+                on_written(await loop.run_in_executor(io_executor, write_if_changed, path, content))
+
+    tasks = [asyncio.ensure_future(schedule_renders())]
+    tasks.extend(asyncio.ensure_future(write_rendered()) for _ in range(writers))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        _discard_pending(rendered)
+
+
+def _discard_pending(queue: asyncio.Queue) -> None:
+    while not queue.empty():
+        pending = queue.get_nowait()
+        if pending is None:
+            continue
+        if pending.done() and not pending.cancelled():
+            pending.exception()
+        pending.cancel()
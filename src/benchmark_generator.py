@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+from src.header_generator import package_declaration
+from src.java_model import EnumClass
+from src.templates import DEFAULT_STYLE, TemplateStyle
+
+BENCHMARK_SUFFIX = "LookupBenchmark"
+
+
+def enum_benchmark_name(enum_name: str) -> str:
+    return f"{enum_name}{BENCHMARK_SUFFIX}"
+
+
+def generate_enum_lookup_benchmark(enum_class: EnumClass, package: str, imports: Optional[List[str]] = None,
+                                   style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> str:
+    class_name = enum_benchmark_name(enum_class.name)
+    enum_name = enum_class.name
+    import_lines = [
+        *(f"import {type_import};" for type_import in sorted(imports or [])),
+        "import java.util.HashMap;",
+        "import java.util.Map;",
+        "import java.util.concurrent.TimeUnit;",
+        "",
+        "import org.openjdk.jmh.annotations.Benchmark;",
+        "import org.openjdk.jmh.annotations.BenchmarkMode;",
+        "import org.openjdk.jmh.annotations.Fork;",
+        "import org.openjdk.jmh.annotations.Measurement;",
+        "import org.openjdk.jmh.annotations.Mode;",
+        "import org.openjdk.jmh.annotations.OutputTimeUnit;",
+        "import org.openjdk.jmh.annotations.Scope;",
+        "import org.openjdk.jmh.annotations.Setup;",
+        "import org.openjdk.jmh.annotations.State;",
+        "import org.openjdk.jmh.annotations.Warmup;",
+        ""
+    ]
+    lines = [
+        package_declaration(package, validated),
+        "",
+        *import_lines,
+        "@BenchmarkMode(Mode.AverageTime)",
+        "@OutputTimeUnit(TimeUnit.NANOSECONDS)",
+        "@State(Scope.Thread)",
+        "@Warmup(iterations = 3, time = 1)",
+        "@Measurement(iterations = 5, time = 1)",
+        "@Fork(1)",
+        f"public class {class_name} {{",
+        "",
+        f"{style.indent_lvl1}private final Map<String, {enum_name}> hashMap = new HashMap<String, {enum_name}>();",
+        f"{style.indent_lvl1}private String[] values;",
+        f"{style.indent_lvl1}private int next;",
+        "",
+        *_get_setup_method(enum_name, style),
+        "",
+        *_get_benchmark_method("fromValue", enum_name, f"{enum_name}.fromValue(nextValue())", style),
+        "",
+        *_get_benchmark_method("hashMapBaseline", enum_name, "hashMap.get(nextValue())", style),
+        "",
+        *_get_next_value_method(style),
+        "}",
+        ""
+    ]
+    return "\n".join(lines)
+
+
+def _get_setup_method(enum_name: str, style: TemplateStyle) -> List[str]:
+    body = [
+        f"{style.indent_lvl1}@Setup",
+        f"{style.indent_lvl1}public void setUp() {{",
+        f"{style.indent_lvl2}{enum_name}[] constants = {enum_name}.values();",
+        f"{style.indent_lvl2}values = new String[constants.length];",
+        f"{style.indent_lvl2}for (int i = 0; i < constants.length; i++) {{",
+        f"{style.indent_lvl3}values[i] = new String(constants[i].value());",
+        f"{style.indent_lvl3}hashMap.put(constants[i].value(), constants[i]);",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
+
+
+def _get_benchmark_method(method_name: str, enum_name: str, expression: str, style: TemplateStyle) -> List[str]:
+    body = [
+        f"{style.indent_lvl1}@Benchmark",
+        f"{style.indent_lvl1}public {enum_name} {method_name}() {{",
+        f"{style.indent_lvl2}return {expression};",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
+
+
+def _get_next_value_method(style: TemplateStyle) -> List[str]:
+    body = [
+        f"{style.indent_lvl1}private String nextValue() {{",
+        f"{style.indent_lvl2}int i = next;",
+        f"{style.indent_lvl2}next = i + 1 == values.length ? 0 : i + 1;",
+        f"{style.indent_lvl2}return values[i];",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
@@ -0,0 +1,172 @@
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+# Values nested deeper than this are skipped by the slower token scan instead of the index regex.
+BUNDLE_NESTING_LIMIT = 12
+LAZY_KEYS = frozenset({"definitions"})
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_PLAIN = rb'[^][{}"]*'
+_SCALAR = rb'[^][{}",\s]+'
+Buffer = Union[bytes, mmap.mmap]
+Span = Tuple[int, int]
+
+
+def _container_regex(depth: int) -> bytes:
+    # Written as unrolled loops without nested alternatives, so a failing match backtracks linearly.
+    inner = _PLAIN + rb'(?:' + _STRING + _PLAIN + rb')*'
+    for _ in range(depth):
+        inner = _PLAIN + rb'(?:(?:' + _STRING + rb'|[\[{]' + inner + rb'[\]}])' + _PLAIN + rb')*'
+    return rb'[\[{]' + inner + rb'[\]}]'
+
+
+_ENTRY = re.compile(rb'\s*(' + _STRING + rb')\s*:\s*(' + _container_regex(BUNDLE_NESTING_LIMIT) + rb'|' + _STRING +
+                    rb'|' + _SCALAR + rb')\s*([,}])')
+_ENTRY_KEY = re.compile(rb'\s*(' + _STRING + rb')\s*:\s*')
+_SEPARATOR = re.compile(rb'\s*([,}])')
+_OBJECT_START = re.compile(rb'(?:\xef\xbb\xbf)?\s*\{')
+_EMPTY_OBJECT = re.compile(rb'\s*}')
+_STRUCTURE = re.compile(_STRING + rb'|[][{}]')
+
+
+class LazyObject(Mapping[str, Any]):
+    # A JSON object inside a memory-mapped buffer. Keys are indexed by byte offset on demand, scanning only as far as
+    # the requested key, and values are decoded from their span on every access so nothing stays materialized.
+    # Objects under lazy keys become nested LazyObjects, so reaching them never scans their content.
+    def __init__(self, buffer: Buffer, start: int, lazy_keys: frozenset = frozenset()):
+        self._buffer = buffer
+        self._lazy_keys = lazy_keys
+        self._offsets: Dict[str, Span] = {}
+        self._children: Dict[str, LazyObject] = {}
+        self._position: Optional[int] = start
+        self._resume: Optional[LazyObject] = None
+        self._end: Optional[int] = None
+        empty = _EMPTY_OBJECT.match(buffer, start)
+        if empty is not None:
+            self._position, self._end = None, empty.end()
+
+    def __getitem__(self, key: str) -> Any:
+        start, end = self._find(key)
+        if key in self._children:
+            return self._children[key]
+        return json.loads(self._buffer[start:end])
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self._find(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan()
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        self._scan()
+        return len(self._offsets)
+
+    def end(self) -> int:
+        self._scan()
+        return self._end
+
+    def _find(self, key: object) -> Span:
+        span = self._offsets.get(key)
+        if span is None and (self._position is not None or self._resume is not None):
+            self._scan(key)
+            span = self._offsets.get(key)
+        if span is None:
+            raise KeyError(key)
+        return span
+
+    def _scan(self, until: object = None) -> None:
+        buffer = self._buffer
+        position = self._position
+        while True:
+            if self._resume is not None:
+                # The end of a lazy child is only needed once a key behind it is requested.
+                position, last = _separator(buffer, self._resume.end())
+                self._resume = None
+                if last:
+                    position, self._end = None, position
+            if position is None:
+                break
+
+            child = None
+            if self._lazy_keys:
+                raw_key, span, last, position, child = self._scan_lazy_entry(position)
+            else:
+                raw_key, span, last, position = _scan_entry(buffer, position)
+            key = _decode_key(raw_key)
+            self._offsets[key] = span
+            if child is not None:
+                self._children[key] = self._resume = child
+            if last:
+                position, self._end = None, position
+            if key == until:
+                break
+        self._position = position
+
+    def _scan_lazy_entry(self, position: int) -> Tuple[bytes, Span, bool, Optional[int], Optional["LazyObject"]]:
+        key_match = _ENTRY_KEY.match(self._buffer, position)
+        if key_match is not None and _decode_key(key_match.group(1)) in self._lazy_keys:
+            start = key_match.end()
+            if self._buffer[start:start + 1] == b"{":
+                return key_match.group(1), (start, start), False, None, LazyObject(self._buffer, start + 1)
+        raw_key, span, last, position = _scan_entry(self._buffer, position)
+        return raw_key, span, last, position, None
+
+
+def load_bundle(path: Union[str, Path], lazy_keys: frozenset = LAZY_KEYS) -> LazyObject:
+    with open(path, "rb") as bundle_file:
+        try:
+            buffer = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            raise ValueError(f"Cannot map schema bundle '{path}': {error}") from error
+    match = _OBJECT_START.match(buffer)
+    if match is None:
+        raise ValueError(f"Schema bundle '{path}' does not contain a JSON object")
+    return LazyObject(buffer, match.end(), lazy_keys)
+
+
+def _scan_entry(buffer: Buffer, position: int) -> Tuple[bytes, Span, bool, int]:
+    match = _ENTRY.match(buffer, position)
+    if match is not None:
+        return match.group(1), match.span(2), match.group(3) == b"}", match.end()
+
+    key_match = _ENTRY_KEY.match(buffer, position)
+    if key_match is None:
+        raise ValueError(f"Invalid JSON object entry at offset {position}")
+    start = key_match.end()
+    end = _skip_container(buffer, start)
+    position, last = _separator(buffer, end)
+    return key_match.group(1), (start, end), last, position
+
+
+def _separator(buffer: Buffer, position: int) -> Tuple[int, bool]:
+    separator = _SEPARATOR.match(buffer, position)
+    if separator is None:
+        raise ValueError(f"Expected ',' or '}}' at offset {position}")
+    return separator.end(), separator.group(1) == b"}"
+
+
+def _skip_container(buffer: Buffer, start: int) -> int:
+    if buffer[start:start + 1] not in (b"{", b"["):
+        raise ValueError(f"Invalid JSON value at offset {start}")
+    depth = 0
+    for token in _STRUCTURE.finditer(buffer, start):
+        char = token.group()[:1]
+        if char in b"[{":
+            depth += 1
+        elif char in b"]}":
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    raise ValueError(f"Unterminated JSON value at offset {start}")
+
+
+def _decode_key(raw_key: bytes) -> str:
+    return json.loads(raw_key) if b"\\" in raw_key else raw_key[1:-1].decode("utf-8")
@@ -0,0 +1,183 @@
+from typing import Iterator, List, Optional, TextIO
+
+from src.enum_generator import get_javadoc
+from src.header_generator import package_declaration
+from src.instrumentation import stage
+from src.java_method_generator import CACHED_HASH_FIELD, FieldPlan, check_equals_mode, plan_fields, render_accessors, \
+    render_equals, render_field_declarations, render_hash_code, render_hash_statements, render_precomputed_hash_code
+from src.java_model import Field, JavaClass
+from src.naming import validate_java_identifier
+from src.options import CLASS_STYLE_BEAN, CLASS_STYLE_IMMUTABLE, CLASS_STYLE_RECORD, CLASS_STYLES, EQUALS_FAST, \
+    EQUALS_STANDARD
+from src.source_writer import iter_lines, write_chunks
+from src.templates import DEFAULT_STYLE, TemplateStyle
+
+RECORD_FORBIDDEN_COMPONENTS = frozenset({
+    "clone", "finalize", "getClass", "hashCode", "notify", "notifyAll", "toString", "wait"
+})
+
+
+def generate_java_class(java_class: JavaClass, package: str, imports: Optional[List[str]] = None,
+                        equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                        style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> str:
+    return "\n".join(_iter_java_class_lines(java_class, package, imports, equals_mode, class_style, style, validated))
+
+
+def iter_java_class(java_class: JavaClass, package: str, imports: Optional[List[str]] = None,
+                    equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                    style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> Iterator[str]:
+    return iter_lines(_iter_java_class_lines(java_class, package, imports, equals_mode, class_style, style, validated))
+
+
+def write_java_class(java_class: JavaClass, package: str, sink: TextIO, imports: Optional[List[str]] = None,
+                     equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                     style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> None:
+    write_chunks(iter_java_class(java_class, package, imports, equals_mode, class_style, style, validated), sink)
+
+
+def _iter_java_class_lines(java_class: JavaClass, package: str, imports: Optional[List[str]],
+                           equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                           style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> Iterator[str]:
+    if class_style not in CLASS_STYLES:
+        raise ValueError(f"Unknown class style: '{class_style}'")
+
+    yield package_declaration(package, validated)
+    yield ""
+    yield from _get_imports(java_class, imports or [], needs_objects=class_style != CLASS_STYLE_RECORD)
+
+    if class_style == CLASS_STYLE_RECORD:
+        yield from _iter_record_lines(java_class, style, validated)
+    elif class_style == CLASS_STYLE_IMMUTABLE:
+        yield from _iter_immutable_class_lines(java_class, style, validated)
+    else:
+        yield from _iter_bean_lines(java_class, equals_mode, style, validated)
+
+    yield "}"
+    yield ""
+
+
+def _iter_bean_lines(java_class: JavaClass, equals_mode: str, style: TemplateStyle,
+                     validated: bool = False) -> Iterator[str]:
+    check_equals_mode(equals_mode)
+    yield from get_javadoc(java_class.description)
+    yield f"public class {java_class.name} {{"
+    if not java_class.fields:
+        return
+
+    with stage("naming"):
+        plans = plan_fields(java_class.fields, validated)
+    yield from render_field_declarations(plans, style=style)
+    yield from render_accessors(plans, style)
+    yield from render_equals(java_class.name, plans, style, equals_mode)
+    yield from render_hash_code(plans, style, equals_mode)
+
+
+def _iter_record_lines(java_class: JavaClass, style: TemplateStyle, validated: bool = False) -> Iterator[str]:
+    yield from _get_record_javadoc(java_class)
+    if not java_class.fields:
+        yield f"public record {java_class.name}() {{"
+        return
+
+    yield f"public record {java_class.name}("
+    last = len(java_class.fields) - 1
+    for i, field in enumerate(java_class.fields):
+        if not validated:
+            validate_java_identifier(field.name)
+        if field.name in RECORD_FORBIDDEN_COMPONENTS:
+            raise ValueError(f"'{field.name}' cannot be used as a record component name")
+        comma = "," if i < last else ""
+        yield f"{style.indent_lvl2}{field.type} {field.name}{comma}"
+    yield ") {"
+
+
+def _get_record_javadoc(java_class: JavaClass) -> List[str]:
+    documented = [field for field in java_class.fields if field.description is not None]
+    if not documented:
+        return get_javadoc(java_class.description)
+
+    javadoc = ["", "/**"]
+    if java_class.description is not None:
+        javadoc.extend([f" * {java_class.description}", " *"])
+    javadoc.extend(f" * @param {field.name} {field.description}" for field in documented)
+    javadoc.append(" */")
+    return javadoc
+
+
+def _iter_immutable_class_lines(java_class: JavaClass, style: TemplateStyle,
+                                validated: bool = False) -> Iterator[str]:
+    yield from get_javadoc(java_class.description)
+    yield f"public final class {java_class.name} {{"
+
+    with stage("naming"):
+        plans = plan_fields(java_class.fields, validated)
+    if plans:
+        yield from render_field_declarations(plans, final=True, style=style)
+        yield ""
+        yield f"{style.indent_lvl1}private final int {CACHED_HASH_FIELD};"
+    yield from _iter_builder_constructor_lines(java_class, plans, style)
+    yield ""
+    yield f"{style.indent_lvl1}public static Builder builder() {{"
+    yield f"{style.indent_lvl2}return new Builder();"
+    yield f"{style.indent_lvl1}}}"
+
+    if plans:
+        yield from render_accessors(plans, style, setters=False)
+        yield from render_equals(java_class.name, plans, style, EQUALS_FAST, precomputed_hash=True)
+        yield from render_precomputed_hash_code(style)
+    yield from _iter_builder_lines(java_class, style)
+
+
+def _iter_builder_constructor_lines(java_class: JavaClass, plans: List[FieldPlan],
+                                    style: TemplateStyle) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}private {java_class.name}(Builder builder) {{"
+    for field in java_class.fields:
+        yield f"{style.indent_lvl2}this.{field.name} = builder.{field.name};"
+    if plans:
+        yield from render_hash_statements(plans, style.indent_lvl2, "int h = 1;", shadowed=("h", "builder"))
+        yield f"{style.indent_lvl2}this.{CACHED_HASH_FIELD} = h;"
+    yield f"{style.indent_lvl1}}}"
+
+
+def _iter_builder_lines(java_class: JavaClass, style: TemplateStyle) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}public static final class Builder {{"
+    if java_class.fields:
+        yield ""
+        for field in java_class.fields:
+            yield f"{style.indent_lvl2}private {field.type} {field.name};"
+    yield ""
+    yield f"{style.indent_lvl2}private Builder() {{"
+    yield f"{style.indent_lvl2}}}"
+    for field in java_class.fields:
+        yield from _iter_builder_setter_lines(field, style)
+    yield ""
+    yield f"{style.indent_lvl2}public {java_class.name} build() {{"
+    yield f"{style.indent_lvl3}return new {java_class.name}(this);"
+    yield f"{style.indent_lvl2}}}"
+    yield f"{style.indent_lvl1}}}"
+
+
+def _iter_builder_setter_lines(field: Field, style: TemplateStyle) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl2}public Builder {field.name}({field.type} {field.name}) {{"
+    yield f"{style.indent_lvl3}this.{field.name} = {field.name};"
+    yield f"{style.indent_lvl3}return this;"
+    yield f"{style.indent_lvl2}}}"
+
+
+def _get_imports(java_class: JavaClass, type_imports: List[str], needs_objects: bool = True) -> List[str]:
+    if not java_class.fields:
+        return []
+
+    imports = [f"import {type_import};" for type_import in sorted(type_imports)]
+    if any(_uses_list(field.type) for field in java_class.fields):
+        imports.append("import java.util.List;")
+    if needs_objects:
+        imports.append("import java.util.Objects;")
+    imports.append("")
+    return imports
+
+
+def _uses_list(java_type: str) -> bool:
+    return java_type.startswith("List<") or "<List<" in java_type
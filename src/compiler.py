@@ -0,0 +1,490 @@
+import os
+from dataclasses import asdict, dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
+
+from src.benchmark_generator import enum_benchmark_name
+from src.header_generator import set_package
+from src.instrumentation import Recorder, collecting, count, current_recorder, stage
+from src.java_model import CompactEnumClass, CompactJavaClass, compact_model
+from src.manifest import MANIFEST_NAME, Manifest, hash_file, hash_options, hash_text, load_manifest, save_manifest
+from src.options import CLASS_STYLE_BEAN, EQUALS_STANDARD, LOOKUP_MAP, LOOKUP_PERFECT_HASH, LOOKUP_SWITCH, \
+    MAX_ENUM_CONSTANTS, ON_CONFLICT_RENAME
+from src.output_writer import make_package_directories, stream_if_changed, write_if_changed, write_source_jar
+from src.render_cache import RenderCache, TreeEntry, tree_key
+from src.schema_parser import SchemaModels, SchemaParser
+from src.type_registry import TypeConflict, TypeRegistry, referenced_type_names
+from src.validation import ModelIndex
+
+ENUM_UNIT = "enum"
+CLASS_UNIT = "class"
+BENCHMARK_UNIT = "enum-benchmark"
+CODEC_UNIT = "codec"
+BENCHMARK_SUBPACKAGE = "jmh"
+
+
+@dataclass
+class RenderUnit:
+    name: str
+    kind: str
+    model: Union[CompactEnumClass, CompactJavaClass]
+    package: str
+    source: str
+    imports: List[str] = field(default_factory=list)
+    enum_lookup: str = LOOKUP_MAP
+    equals_mode: str = EQUALS_STANDARD
+    class_style: str = CLASS_STYLE_BEAN
+    enum_types: Tuple[str, ...] = ()
+    # Set once the unit passed validate_units with the rest of its schema set, so the generators skip the name checks.
+    validated: bool = False
+    # Constant names of an enum unit, computed by validate_units so the enum generator does not convert them again.
+    constant_names: Optional[Tuple[str, ...]] = None
+
+
+@dataclass
+class BuildPlan:
+    units: List[RenderUnit] = field(default_factory=list)
+    conflicts: List[TypeConflict] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CompileResult:
+    written: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    conflicts: List[TypeConflict] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def discover_schemas(schema_dir: Union[str, Path]) -> List[Path]:
+    schema_dir = Path(schema_dir)
+    if not schema_dir.is_dir():
+        raise ValueError(f"Schema directory does not exist: '{schema_dir}'")
+    return sorted(path for path in schema_dir.rglob("*.json") if path.is_file())
+
+
+def plan_directory(schema_dir: Union[str, Path], package: str, shared_package: Optional[str] = None,
+                   on_conflict: str = ON_CONFLICT_RENAME, enum_lookup: str = LOOKUP_MAP,
+                   enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                   class_style: str = CLASS_STYLE_BEAN, codecs: bool = False) -> List[RenderUnit]:
+    return build_plan(schema_dir, package, shared_package, on_conflict, enum_lookup, enum_benchmarks, equals_mode,
+                      class_style, codecs).units
+
+
+def build_plan(schema_dir: Union[str, Path], package: str, shared_package: Optional[str] = None,
+               on_conflict: str = ON_CONFLICT_RENAME, enum_lookup: str = LOOKUP_MAP,
+               enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+               class_style: str = CLASS_STYLE_BEAN, codecs: bool = False) -> BuildPlan:
+    validate_packages(package, shared_package)
+    schema_dir = Path(schema_dir)
+
+    parser = SchemaParser()
+    sources = {}
+    for schema_path in discover_schemas(schema_dir):
+        source = schema_path.relative_to(schema_dir).as_posix()
+        with stage("parse", source):
+            parser.parse_file(schema_path)
+        sources[os.path.normpath(schema_path)] = source
+        count("schemas")
+
+    return plan_parsed_schemas(parser, sources, package, shared_package, on_conflict, enum_lookup, enum_benchmarks,
+                               equals_mode, class_style, codecs)
+
+
+def plan_bundle(bundle_path: Union[str, Path], package: str, roots: Optional[List[str]] = None,
+                shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                class_style: str = CLASS_STYLE_BEAN, codecs: bool = False) -> BuildPlan:
+    from src.bundle_loader import load_bundle
+
+    validate_packages(package, shared_package)
+    bundle_path = Path(bundle_path)
+    uri = os.path.normpath(bundle_path)
+    parser = SchemaParser()
+    with stage("parse", bundle_path.name):
+        document = load_bundle(bundle_path)
+        if roots:
+            parser.parse_roots(uri, roots, document)
+        else:
+            parser.parse_document(uri, document, bundle_path.stem)
+    count("schemas")
+
+    return plan_parsed_schemas(parser, {uri: bundle_path.name}, package, shared_package, on_conflict, enum_lookup,
+                               enum_benchmarks, equals_mode, class_style, codecs)
+
+
+def validate_packages(package: str, shared_package: Optional[str] = None) -> None:
+    set_package(package)
+    if shared_package is not None:
+        set_package(shared_package)
+
+
+def plan_parsed_schemas(parser: SchemaParser, sources: Dict[str, str], package: str,
+                        shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                        enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False,
+                        equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                        codecs: bool = False) -> BuildPlan:
+    return plan_models({uri: parser.models(uri) for uri in parser.documents()}, sources, package, shared_package,
+                       on_conflict, enum_lookup, enum_benchmarks, equals_mode, class_style, codecs)
+
+
+def plan_models(models: Dict[str, SchemaModels], sources: Dict[str, str], package: str,
+                shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                class_style: str = CLASS_STYLE_BEAN, codecs: bool = False) -> BuildPlan:
+    documents = [(sources.get(uri, uri), _label_type_sources(models[uri], sources))
+                 for uri in sorted(models, key=lambda uri: uri not in sources)]
+    registry = TypeRegistry(on_conflict)
+    with stage("resolve_types"):
+        registered_types = registry.resolve(documents)
+
+    type_packages = {}
+    for registered in registered_types:
+        shared = shared_package is not None and len(registered.sources) > 1
+        type_packages[registered.name] = shared_package if shared else package
+
+    if codecs:
+        from src.serializer_generator import codec_imports, codec_name
+    enum_names = {registered.name for registered in registered_types if registered.is_enum}
+    units = []
+    warnings = []
+    for registered in registered_types:
+        unit_package = type_packages[registered.name]
+        model = compact_model(registered.model)
+        if registered.is_enum:
+            unit_lookup = enum_lookup
+            if enum_lookup in (LOOKUP_SWITCH, LOOKUP_PERFECT_HASH) and len(model.values) > MAX_ENUM_CONSTANTS:
+                unit_lookup = LOOKUP_MAP
+                warnings.append(f"'{registered.name}' has more than {MAX_ENUM_CONSTANTS} values and is rendered as "
+                                f"a class with the '{LOOKUP_MAP}' lookup instead of '{enum_lookup}'")
+            units.append(RenderUnit(registered.name, ENUM_UNIT, model, unit_package, registered.sources[0],
+                                    enum_lookup=unit_lookup))
+            if enum_benchmarks and model.values:
+                units.append(RenderUnit(enum_benchmark_name(registered.name), BENCHMARK_UNIT, model,
+                                        f"{unit_package}.{BENCHMARK_SUBPACKAGE}", registered.sources[0],
+                                        [f"{unit_package}.{registered.name}"]))
+        else:
+            imports = _type_imports(model, unit_package, type_packages)
+            units.append(RenderUnit(registered.name, CLASS_UNIT, model, unit_package, registered.sources[0], imports,
+                                    equals_mode=equals_mode, class_style=class_style))
+            if codecs:
+                enum_types = tuple(sorted(name for name in _field_type_names(model) if name in enum_names))
+                units.append(RenderUnit(codec_name(registered.name), CODEC_UNIT, model, unit_package,
+                                        registered.sources[0], codec_imports(imports, set(enum_types)),
+                                        class_style=class_style, enum_types=enum_types))
+
+    with stage("validate"):
+        index = validate_units(units)
+    for unit in units:
+        unit.validated = True
+        if unit.kind == ENUM_UNIT:
+            unit.constant_names = tuple(index.constant_names[f"{unit.package}.{unit.name}"])
+    count("enums", sum(1 for unit in units if unit.kind == ENUM_UNIT))
+    count("classes", sum(1 for unit in units if unit.kind == CLASS_UNIT))
+    count("fields", sum(len(unit.model.fields) for unit in units if unit.kind == CLASS_UNIT))
+    return BuildPlan(units, registry.conflicts, warnings)
+
+
+def validate_units(units: Iterable[RenderUnit]) -> ModelIndex:
+    index = ModelIndex()
+    for unit in units:
+        if unit.kind in (ENUM_UNIT, CLASS_UNIT):
+            index.add_model(unit.package, unit.model, unit.class_style)
+        else:
+            index.add_type(unit.package, unit.name)
+    issues = index.conflicts()
+    if issues:
+        raise ValueError("Invalid schema set:\n" + "\n".join(f"  {issue}" for issue in issues))
+    return index
+
+
+def render_unit(unit: RenderUnit) -> str:
+    # Generators are imported on first use so that, for example, an enum-only run never loads the class generator.
+    if unit.kind == ENUM_UNIT:
+        from src.enum_generator import generate_enum_class
+        return generate_enum_class(unit.model, unit.package, unit.enum_lookup, validated=unit.validated,
+                                   constant_names=unit.constant_names)
+    if unit.kind == CLASS_UNIT:
+        from src.class_generator import generate_java_class
+        return generate_java_class(unit.model, unit.package, unit.imports, unit.equals_mode, unit.class_style,
+                                   validated=unit.validated)
+    if unit.kind == BENCHMARK_UNIT:
+        from src.benchmark_generator import generate_enum_lookup_benchmark
+        return generate_enum_lookup_benchmark(unit.model, unit.package, unit.imports, validated=unit.validated)
+    if unit.kind == CODEC_UNIT:
+        from src.serializer_generator import generate_class_codec
+        return generate_class_codec(unit.model, unit.package, set(unit.enum_types), unit.imports, unit.class_style,
+                                    validated=unit.validated)
+    raise ValueError(f"Unknown render unit kind: '{unit.kind}'")
+
+
+def write_unit(unit: RenderUnit, sink: TextIO) -> None:
+    if unit.kind == ENUM_UNIT:
+        from src.enum_generator import write_enum_class
+        write_enum_class(unit.model, unit.package, sink, unit.enum_lookup, validated=unit.validated,
+                         constant_names=unit.constant_names)
+    elif unit.kind == CLASS_UNIT:
+        from src.class_generator import write_java_class
+        write_java_class(unit.model, unit.package, sink, unit.imports, unit.equals_mode, unit.class_style,
+                         validated=unit.validated)
+    elif unit.kind == BENCHMARK_UNIT:
+        sink.write(render_unit(unit))
+    elif unit.kind == CODEC_UNIT:
+        from src.serializer_generator import write_class_codec
+        write_class_codec(unit.model, unit.package, sink, set(unit.enum_types), unit.imports, unit.class_style,
+                          validated=unit.validated)
+    else:
+        raise ValueError(f"Unknown render unit kind: '{unit.kind}'")
+
+
+def output_path(output_dir: Union[str, Path], unit: RenderUnit) -> Path:
+    return Path(output_dir).joinpath(*unit.package.split("."), f"{unit.name}.java")
+
+
+def compile_directory(schema_dir: Union[str, Path], output_dir: Union[str, Path], package: str,
+                      workers: Optional[int] = None, incremental: bool = True, shared_package: Optional[str] = None,
+                      on_conflict: str = ON_CONFLICT_RENAME, enum_lookup: str = LOOKUP_MAP,
+                      enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                      class_style: str = CLASS_STYLE_BEAN, codecs: bool = False,
+                      cache: Optional[RenderCache] = None) -> CompileResult:
+    schema_dir = Path(schema_dir)
+    output_dir = Path(output_dir)
+
+    options = hash_options(package, shared_package=shared_package, on_conflict=on_conflict, enum_lookup=enum_lookup,
+                           enum_benchmarks=enum_benchmarks, equals_mode=equals_mode, class_style=class_style,
+                           codecs=codecs)
+    with stage("hash_schemas"):
+        schemas = {path.relative_to(schema_dir).as_posix(): hash_file(path) for path in discover_schemas(schema_dir)}
+        previous = load_manifest(output_dir / MANIFEST_NAME) if incremental else Manifest()
+
+    build = partial(build_plan, schema_dir, package, shared_package, on_conflict, enum_lookup, enum_benchmarks,
+                    equals_mode, class_style, codecs)
+    return _compile(build, output_dir, options, schemas, previous, workers, cache)
+
+
+def compile_bundle(bundle_path: Union[str, Path], output_dir: Union[str, Path], package: str,
+                   roots: Optional[List[str]] = None, workers: Optional[int] = None, incremental: bool = True,
+                   shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                   enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                   class_style: str = CLASS_STYLE_BEAN, codecs: bool = False,
+                   cache: Optional[RenderCache] = None) -> CompileResult:
+    bundle_path = Path(bundle_path)
+    output_dir = Path(output_dir)
+
+    options = hash_options(package, shared_package=shared_package, on_conflict=on_conflict, enum_lookup=enum_lookup,
+                           enum_benchmarks=enum_benchmarks, equals_mode=equals_mode, class_style=class_style,
+                           codecs=codecs, roots=list(roots) if roots else None)
+    with stage("hash_schemas"):
+        if not bundle_path.is_file():
+            raise ValueError(f"Schema bundle does not exist: '{bundle_path}'")
+        schemas = {bundle_path.name: hash_file(bundle_path)}
+        previous = load_manifest(output_dir / MANIFEST_NAME) if incremental else Manifest()
+
+    build = partial(plan_bundle, bundle_path, package, roots, shared_package, on_conflict, enum_lookup,
+                    enum_benchmarks, equals_mode, class_style, codecs)
+    return _compile(build, output_dir, options, schemas, previous, workers, cache)
+
+
+def compile_to_jar(schema_dir: Union[str, Path], jar_path: Union[str, Path], package: str,
+                   workers: Optional[int] = None, shared_package: Optional[str] = None,
+                   on_conflict: str = ON_CONFLICT_RENAME, enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False,
+                   equals_mode: str = EQUALS_STANDARD, class_style: str = CLASS_STYLE_BEAN,
+                   codecs: bool = False) -> CompileResult:
+    plan = build_plan(schema_dir, package, shared_package, on_conflict, enum_lookup, enum_benchmarks, equals_mode,
+                      class_style, codecs)
+    result = CompileResult(conflicts=plan.conflicts, warnings=plan.warnings)
+    names = [output_path("", unit).as_posix() for unit in plan.units]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(plan.units) <= 1:
+        path, _, written = write_source_jar(jar_path, zip(names, map(_render_bytes, plan.units)))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(plan.units) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = executor.map(_render_bytes, plan.units, chunksize=chunksize)
+            path, _, written = write_source_jar(jar_path, zip(names, rendered))
+
+    (result.written if written else result.unchanged).append(Path(path))
+    return result
+
+
+def is_up_to_date(previous: Manifest, options: str, schemas: Dict[str, str], output_dir: Path) -> bool:
+    if previous.options != options or previous.schemas != schemas:
+        return False
+    return all((output_dir / relative).is_file() for relative in previous.outputs)
+
+
+def select_jobs(plan: BuildPlan, output_dir: Path, previous: Manifest, manifest: Manifest,
+                result: CompileResult) -> List[Tuple[RenderUnit, str]]:
+    jobs = []
+    for unit in plan.units:
+        path = output_path(output_dir, unit)
+        relative = path.relative_to(output_dir).as_posix()
+        manifest.units[relative] = _hash_unit(unit, manifest.options)
+
+        if manifest.units[relative] == previous.units.get(relative) and relative in previous.outputs \
+                and path.is_file():
+            manifest.outputs[relative] = previous.outputs[relative]
+            result.unchanged.append(path)
+        else:
+            jobs.append((unit, str(path)))
+
+    make_package_directories(output_dir, {unit.package for unit, _ in jobs})
+    return jobs
+
+
+def record_job_result(output_dir: Path, manifest: Manifest, result: CompileResult,
+                      job_result: Tuple[str, str, bool]) -> None:
+    path, content_hash, written = job_result
+    manifest.outputs[Path(path).relative_to(output_dir).as_posix()] = content_hash
+    (result.written if written else result.unchanged).append(Path(path))
+    if written and current_recorder() is not None:
+        count("files_written")
+        count("bytes_written", os.path.getsize(path))
+
+
+def finish_build(output_dir: Path, previous: Manifest, manifest: Manifest, result: CompileResult) -> None:
+    for relative in previous.outputs.keys() - manifest.outputs.keys():
+        stale_path = output_dir / relative
+        if stale_path.is_file():
+            stale_path.unlink()
+            result.removed.append(stale_path)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    save_manifest(output_dir / MANIFEST_NAME, manifest)
+
+
+def _compile(build: Callable[[], BuildPlan], output_dir: Path, options: str, schemas: Dict[str, str],
+             previous: Manifest, workers: Optional[int], cache: Optional[RenderCache]) -> CompileResult:
+    if is_up_to_date(previous, options, schemas, output_dir):
+        return CompileResult(unchanged=[output_dir / relative for relative in previous.outputs])
+
+    cached_tree = tree_key(options, schemas) if cache is not None else None
+    if cache is not None:
+        with stage("cache_restore"):
+            restored = _restore_tree(cache, cached_tree, output_dir, previous, options, schemas)
+        if restored is not None:
+            return restored
+
+    manifest = Manifest(options=options, schemas=schemas)
+    plan = build()
+    result = CompileResult(conflicts=plan.conflicts, warnings=plan.warnings)
+    jobs = select_jobs(plan, output_dir, previous, manifest, result)
+    if cache is not None:
+        with stage("cache_restore"):
+            jobs = _restore_units(cache, jobs, output_dir, manifest, result)
+    recorder = current_recorder()
+    for job_result, timings in _run_jobs(jobs, workers, timed=recorder is not None):
+        if timings is not None:
+            recorder.merge(timings)
+        record_job_result(output_dir, manifest, result, job_result)
+
+    if cache is not None:
+        with stage("cache_store"):
+            _store_tree(cache, cached_tree, output_dir, manifest, plan)
+    with stage("finish"):
+        finish_build(output_dir, previous, manifest, result)
+    return result
+
+
+def _restore_tree(cache: RenderCache, key: str, output_dir: Path, previous: Manifest, options: str,
+                  schemas: Dict[str, str]) -> Optional[CompileResult]:
+    entry = cache.get_tree(key)
+    if entry is None:
+        count("cache_misses")
+        return None
+
+    manifest = Manifest(options=options, schemas=schemas, units=dict(entry.units))
+    result = CompileResult(conflicts=[TypeConflict(**conflict) for conflict in entry.conflicts],
+                           warnings=list(entry.warnings))
+    for directory in {os.path.dirname(relative) for relative in entry.units}:
+        os.makedirs(output_dir / directory, exist_ok=True)
+    for relative, unit_key in entry.units.items():
+        content = cache.get_unit(unit_key)
+        if content is None:
+            count("cache_misses")
+            return None
+        record_job_result(output_dir, manifest, result, write_if_changed(str(output_dir / relative), content))
+
+    count("cache_hits", len(entry.units))
+    finish_build(output_dir, previous, manifest, result)
+    return result
+
+
+def _restore_units(cache: RenderCache, jobs: List[Tuple[RenderUnit, str]], output_dir: Path, manifest: Manifest,
+                   result: CompileResult) -> List[Tuple[RenderUnit, str]]:
+    remaining = []
+    for unit, path in jobs:
+        content = cache.get_unit(manifest.units[Path(path).relative_to(output_dir).as_posix()])
+        if content is None:
+            remaining.append((unit, path))
+        else:
+            record_job_result(output_dir, manifest, result, write_if_changed(path, content))
+    count("cache_hits", len(jobs) - len(remaining))
+    count("cache_misses", len(remaining))
+    return remaining
+
+
+def _store_tree(cache: RenderCache, key: str, output_dir: Path, manifest: Manifest, plan: BuildPlan) -> None:
+    for relative, unit_key in manifest.units.items():
+        if not cache.has_unit(unit_key):
+            cache.put_unit(unit_key, (output_dir / relative).read_bytes())
+    cache.put_tree(key, TreeEntry(dict(manifest.units), [asdict(conflict) for conflict in plan.conflicts],
+                                  list(plan.warnings)))
+    cache.evict()
+
+
+def _hash_unit(unit: RenderUnit, options: str) -> str:
+    return hash_text(f"{options}\n{unit!r}")
+
+
+def _label_type_sources(models: SchemaModels, sources: Dict[str, str]) -> SchemaModels:
+    # The registry names documents by their source label, so the parser's document URIs are relabelled to match.
+    if not models.type_sources:
+        return models
+    return replace(models, type_sources={key: sources.get(uri, uri) for key, uri in models.type_sources.items()})
+
+
+def _type_imports(java_class: CompactJavaClass, package: str, type_packages: Dict[str, str]) -> List[str]:
+    imports = set()
+    for type_name in _field_type_names(java_class):
+        type_package = type_packages.get(type_name)
+        if type_package is not None and type_package != package:
+            imports.add(f"{type_package}.{type_name}")
+    return sorted(imports)
+
+
+def _field_type_names(java_class: CompactJavaClass) -> Set[str]:
+    return {type_name for java_field in java_class.fields for type_name in referenced_type_names(java_field.type)}
+
+
+def _run_jobs(jobs: List[Tuple[RenderUnit, str]], workers: Optional[int],
+              timed: bool = False) -> List[Tuple[Tuple[str, str, bool], Optional[Recorder]]]:
+    workers = workers or os.cpu_count() or 1
+    timed_jobs = [(unit, path, timed) for unit, path in jobs]
+    if workers == 1 or len(jobs) <= 1:
+        return [_render_and_write(job) for job in timed_jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_and_write, timed_jobs, chunksize=chunksize))
+
+
+def _render_bytes(unit: RenderUnit) -> bytes:
+    return render_unit(unit).encode("utf-8")
+
+
+def _render_and_write(job: Tuple[RenderUnit, str, bool]) -> Tuple[Tuple[str, str, bool], Optional[Recorder]]:
+    # Worker processes do not inherit the caller's recorder, so timed jobs collect their own stages and return them
+    # to be merged into the report. Rendering streams into the output file, so both are timed as one stage.
+    unit, path, timed = job
+    if not timed:
+        return stream_if_changed(path, partial(write_unit, unit)), None
+
+    with collecting() as timings, stage("render_and_write", unit.source):
+        job_result = stream_if_changed(path, partial(write_unit, unit))
+    return job_result, timings
@@ -1,60 +1,304 @@
-import re
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
 
-from src.java_model import EnumClass, indent_lvl1, indent_lvl2, indent_lvl3
-from src.header_generator import set_package
+from src.java_model import EnumClass
+from src.header_generator import package_declaration
+from src.instrumentation import stage
+from src.naming import java_constant_name, java_constant_names
+from src.options import LOOKUP_AUTO, LOOKUP_MAP, LOOKUP_PERFECT_HASH, LOOKUP_STRATEGIES, LOOKUP_SWITCH, \
+    MAX_ENUM_CONSTANTS
+from src.perfect_hash import PerfectHash, build_perfect_hash, java_char_string
+from src.source_writer import iter_lines, write_chunks
+from src.templates import DEFAULT_STYLE, CompiledTemplate, TemplateStyle, compile_template, slot
+
+SWITCH_LOOKUP_MAX_VALUES = 64
+# An enum with more than MAX_ENUM_CONSTANTS values is rendered as a final class instead of a Java enum: its constants
+# are created in private nested chunk classes of that size and exposed as stable fields of the outer class, so
+# Color.RED keeps working when values are added. Java callers lose switch, name() and valueOf(); fromValue, values(),
+# ordinal() and value() remain. Such enums always use the map lookup, whatever lookup was asked for.
+CHUNK_CLASS_PREFIX = "Chunk"
 
 
 def to_java_constant(value: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9]", "_", value)  # delimiters a-a -> A_A
-    value = re.sub(r"([a-z])[_]?([A-Z])([A-Z])([a-z])", r"\1_\2_\3\4", value)  # aBCd / a_BCd-> a_B_CD
-    value = re.sub(r"([a-z])([A-Z])", r"\1_\2", value)  # aA -> A_A
-    value = re.sub(r"([A-Za-z])([0-9])", r"\1_\2", value)  # a9 / A9 -> a_9
-    value = re.sub(r"([0-9])([A-Za-z])", r"\1_\2", value)  # 9a / 9A -> 9_A
+    return java_constant_name(value)
+
+
+def to_java_constants(values: Sequence[str]) -> List[str]:
+    return java_constant_names(values)
+
+
+def generate_enum_class(enum_class: EnumClass, package: str, lookup: str = LOOKUP_MAP,
+                        style: TemplateStyle = DEFAULT_STYLE, max_constants: int = MAX_ENUM_CONSTANTS,
+                        validated: bool = False, constant_names: Optional[Sequence[str]] = None) -> str:
+    return "\n".join(_iter_enum_lines(enum_class, package, style, lookup, max_constants, validated, constant_names))
+
+
+def iter_enum_class(enum_class: EnumClass, package: str, lookup: str = LOOKUP_MAP,
+                    style: TemplateStyle = DEFAULT_STYLE, max_constants: int = MAX_ENUM_CONSTANTS,
+                    validated: bool = False, constant_names: Optional[Sequence[str]] = None) -> Iterator[str]:
+    return iter_lines(_iter_enum_lines(enum_class, package, style, lookup, max_constants, validated,
+                                       constant_names))
+
+
+def write_enum_class(enum_class: EnumClass, package: str, sink: TextIO, lookup: str = LOOKUP_MAP,
+                     style: TemplateStyle = DEFAULT_STYLE, max_constants: int = MAX_ENUM_CONSTANTS,
+                     validated: bool = False, constant_names: Optional[Sequence[str]] = None) -> None:
+    write_chunks(iter_enum_class(enum_class, package, lookup, style, max_constants, validated, constant_names),
+                 sink)
+
+
+def select_lookup_strategy(values: Sequence[str], lookup: str = LOOKUP_AUTO) -> str:
+    return _plan_lookup(values, lookup)[0]
+
+
+def _iter_enum_lines(enum_class: EnumClass, package: str, style: TemplateStyle = DEFAULT_STYLE,
+                     lookup: str = LOOKUP_MAP, max_constants: int = MAX_ENUM_CONSTANTS,
+                     validated: bool = False, constant_names: Optional[Sequence[str]] = None) -> Iterator[str]:
+    if max_constants < 1:
+        raise ValueError("The maximum number of enum constants must be at least 1")
+    if len(enum_class.values) > max_constants:
+        yield from _iter_split_enum_lines(enum_class, package, style, lookup, max_constants, validated,
+                                          constant_names)
+        return
+
+    lookup, perfect_hash = _plan_lookup(enum_class.values, lookup)
+    templates = _enum_templates(style, lookup)
+    names = _constant_names(enum_class.values, constant_names)
+    package_line = package_declaration(package, validated)
+
+    if enum_class.description is None:
+        yield templates.header.render(package_declaration=package_line, class_name=enum_class.name)
+    else:
+        yield templates.documented_header.render(package_declaration=package_line,
+                                                 description=enum_class.description, class_name=enum_class.name)
+    yield from _get_constants(enum_class.values, style, names)
+
+    if lookup == LOOKUP_MAP:
+        yield templates.body.render(class_name=enum_class.name)
+    elif lookup == LOOKUP_SWITCH:
+        yield templates.body.render(class_name=enum_class.name,
+                                    switch_cases="\n".join(_get_switch_cases(enum_class.values, style, names)))
+    else:
+        yield templates.body.render(class_name=enum_class.name,
+                                    displacements=java_char_string(perfect_hash.displacements),
+                                    table_size=str(perfect_hash.table_size),
+                                    table_mask=str(perfect_hash.table_size - 1),
+                                    bucket_shift=str(perfect_hash.bucket_shift))
+
+
+def _iter_split_enum_lines(enum_class: EnumClass, package: str, style: TemplateStyle, lookup: str,
+                           max_constants: int, validated: bool = False,
+                           constant_names: Optional[Sequence[str]] = None) -> Iterator[str]:
+    if lookup not in LOOKUP_STRATEGIES:
+        raise ValueError(f"Unknown enum lookup strategy: '{lookup}'")
 
-    return value.upper()
+    templates = _split_enum_templates(style)
+    class_name = enum_class.name
+    values = enum_class.values
+    names = _constant_names(values, constant_names)
+    package_line = package_declaration(package, validated)
+    if enum_class.description is None:
+        yield templates.header.render(package_declaration=package_line, class_name=class_name)
+    else:
+        yield templates.documented_header.render(package_declaration=package_line,
+                                                 description=enum_class.description, class_name=class_name)
 
+    yield ""
+    for index, name in enumerate(names):
+        chunk_name = f"{CHUNK_CLASS_PREFIX}{index // max_constants}"
+        yield f"{style.indent_lvl1}public static final {class_name} {name} = {chunk_name}.{name};"
 
-def generate_enum_class(enum_class: EnumClass, package: str) -> str:
-    enum_body = [
-        set_package(package),
+    chunk_names = []
+    for start in range(0, len(values), max_constants):
+        chunk_names.append(f"{CHUNK_CLASS_PREFIX}{len(chunk_names)}")
+        yield from _get_chunk_class(class_name, chunk_names[-1], values[start:start + max_constants],
+                                    names[start:start + max_constants], start, style)
+
+    yield templates.lookup.render(class_name=class_name, value_count=str(len(values)),
+                                  capacity=str(len(values) * 4 // 3 + 1),
+                                  register_calls="\n".join(f"{style.indent_lvl3}{chunk_name}.register(VALUES);"
+                                                           for chunk_name in chunk_names))
+    yield templates.body.render(class_name=class_name)
+
+
+def _constant_names(values: Sequence[str], constant_names: Optional[Sequence[str]]) -> Sequence[str]:
+    # The compiler passes the names its validation pass already computed; direct callers get them converted here.
+    if constant_names is not None:
+        return constant_names
+    with stage("naming"):
+        return to_java_constants(values)
+
+
+def _plan_lookup(values: Sequence[str], lookup: str) -> Tuple[str, Optional[PerfectHash]]:
+    if lookup not in LOOKUP_STRATEGIES:
+        raise ValueError(f"Unknown enum lookup strategy: '{lookup}'")
+    if lookup == LOOKUP_MAP or lookup == LOOKUP_SWITCH:
+        return lookup, None
+    if lookup == LOOKUP_AUTO and len(values) <= SWITCH_LOOKUP_MAX_VALUES:
+        return LOOKUP_SWITCH, None
+
+    perfect_hash = build_perfect_hash(values)
+    if perfect_hash is not None:
+        return LOOKUP_PERFECT_HASH, perfect_hash
+    if lookup == LOOKUP_AUTO:
+        return LOOKUP_MAP, None
+    raise ValueError("No perfect hash found for the enum values, some of them share a String.hashCode()")
+
+
+class _EnumTemplates(NamedTuple):
+    header: CompiledTemplate
+    documented_header: CompiledTemplate
+    body: CompiledTemplate
+    lookup: Optional[CompiledTemplate] = None
+
+
+@lru_cache(maxsize=None)
+def _enum_templates(style: TemplateStyle, lookup: str = LOOKUP_MAP) -> _EnumTemplates:
+    class_name = slot("class_name")
+    map_imports = ["", "import java.util.HashMap;", "import java.util.Map;", ""] if lookup == LOOKUP_MAP else []
+
+    def header(javadoc: List[str]) -> CompiledTemplate:
+        return compile_template("\n".join([
+            slot("package_declaration"),
+            *map_imports,
+            *javadoc,
+            f"public enum {class_name} {{"
+        ]))
+
+    body = [
+        "",
+        *_get_lookup_fields(class_name, lookup, style),
+        f"{style.indent_lvl1}private final String value;",
+        "",
+        *_get_constructor(class_name, style),
+        "",
+        *_get_lookup_methods(class_name, lookup, style),
+        "",
+        *_get_to_string_method(style),
         "",
-        f"import java.util.HashMap;",
-        f"import java.util.Map;",
-        f""
+        *_get_value_method(style),
+        "}",
+        ""
     ]
+    return _EnumTemplates(
+        header=header(get_javadoc(None)),
+        documented_header=header(get_javadoc(slot("description"))),
+        body=compile_template("\n".join(body)))
 
-    enum_body.extend(_get_javadoc(enum_class.description))
 
-    enum_body.append(f"public enum {enum_class.name} {{")
-    enum_body.extend(_get_constants(enum_class.values))
+@lru_cache(maxsize=None)
+def _split_enum_templates(style: TemplateStyle) -> _EnumTemplates:
+    class_name = slot("class_name")
+    indent_lvl4 = style.indent_lvl3 + style.indent_lvl1
 
-    enum_body.append(f"")
-    enum_body.append(
-        f"{indent_lvl1}private final static Map<String, {enum_class.name}> CONSTANTS = new HashMap<String, {enum_class.name}>();")
-    enum_body.append(f"")
-    enum_body.extend(_get_static_method(enum_class.name))
+    def header(javadoc: List[str]) -> CompiledTemplate:
+        return compile_template("\n".join([
+            slot("package_declaration"),
+            "",
+            "import java.util.HashMap;",
+            "import java.util.Map;",
+            "",
+            *javadoc,
+            f"public final class {class_name} {{"
+        ]))
+
+    lookup = [
+        "",
+        f"{style.indent_lvl1}private static final class Lookup {{",
+        f"{style.indent_lvl2}private static final {class_name}[] VALUES = new {class_name}[{slot('value_count')}];",
+        f"{style.indent_lvl2}private static final Map<String, {class_name}> CONSTANTS = "
+        f"new HashMap<String, {class_name}>({slot('capacity')});",
+        "",
+        f"{style.indent_lvl2}static {{",
+        slot("register_calls"),
+        f"{style.indent_lvl3}for ({class_name} c : VALUES) {{",
+        f"{indent_lvl4}CONSTANTS.put(c.value, c);",
+        f"{style.indent_lvl3}}}",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    ]
+    body = [
+        "",
+        f"{style.indent_lvl1}private final String value;",
+        f"{style.indent_lvl1}private final int ordinal;",
+        "",
+        f"{style.indent_lvl1}private {class_name}(String value, int ordinal) {{",
+        f"{style.indent_lvl2}this.value = value;",
+        f"{style.indent_lvl2}this.ordinal = ordinal;",
+        f"{style.indent_lvl1}}}",
+        "",
+        *_get_from_value_method(class_name, style, "Lookup.CONSTANTS"),
+        "",
+        f"{style.indent_lvl1}public static {class_name}[] values() {{",
+        f"{style.indent_lvl2}return Lookup.VALUES.clone();",
+        f"{style.indent_lvl1}}}",
+        "",
+        f"{style.indent_lvl1}public int ordinal() {{",
+        f"{style.indent_lvl2}return this.ordinal;",
+        f"{style.indent_lvl1}}}",
+        "",
+        *_get_to_string_method(style),
+        "",
+        *_get_value_method(style),
+        "}",
+        ""
+    ]
+    return _EnumTemplates(
+        header=header(get_javadoc(None)),
+        documented_header=header(get_javadoc(slot("description"))),
+        body=compile_template("\n".join(body)),
+        lookup=compile_template("\n".join(lookup)))
 
-    enum_body.append(f"")
-    enum_body.append(f"{indent_lvl1}private final String value;")
-    enum_body.append(f"")
-    enum_body.extend(_get_constructor(enum_class.name))
 
-    enum_body.append(f"")
-    enum_body.extend(_get_from_value_method(enum_class.name))
+def _get_chunk_class(class_name: str, chunk_name: str, values: Sequence[str], names: Sequence[str], start: int,
+                     style: TemplateStyle) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}private static final class {chunk_name} {{"
+    for ordinal, (name, value) in enumerate(zip(names, values), start):
+        yield f'{style.indent_lvl2}static final {class_name} {name} = new {class_name}("{value}", {ordinal});'
+    yield ""
+    yield f"{style.indent_lvl2}private {chunk_name}() {{"
+    yield f"{style.indent_lvl2}}}"
+    yield ""
+    yield f"{style.indent_lvl2}static void register({class_name}[] values) {{"
+    for ordinal, name in enumerate(names, start):
+        yield f"{style.indent_lvl3}values[{ordinal}] = {name};"
+    yield f"{style.indent_lvl2}}}"
+    yield f"{style.indent_lvl1}}}"
 
-    enum_body.append(f"")
-    enum_body.extend(_get_to_string_method())
 
-    enum_body.append(f"")
-    enum_body.extend(_get_value_method())
-    enum_body.append("}")
-    enum_body.append(f"")
+def _get_lookup_fields(class_name: str, lookup: str, style: TemplateStyle) -> List[str]:
+    if lookup == LOOKUP_MAP:
+        return [
+            f"{style.indent_lvl1}private final static Map<String, {class_name}> CONSTANTS = new HashMap<String, {class_name}>();",
+            "",
+            *_get_static_method(class_name, style),
+            ""
+        ]
+    if lookup == LOOKUP_PERFECT_HASH:
+        return [
+            f'{style.indent_lvl1}private static final String DISPLACEMENTS = "{slot("displacements")}";',
+            f"{style.indent_lvl1}private static final {class_name}[] TABLE = new {class_name}[{slot('table_size')}];",
+            "",
+            f"{style.indent_lvl1}static {{",
+            f"{style.indent_lvl2}for ({class_name} c : values()) {{",
+            f"{style.indent_lvl3}TABLE[slot(c.value)] = c;",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl1}}}",
+            ""
+        ]
+    return []
+
 
-    return "\n".join(enum_body)
+def _get_lookup_methods(class_name: str, lookup: str, style: TemplateStyle) -> List[str]:
+    if lookup == LOOKUP_SWITCH:
+        return _get_switch_from_value_method(class_name, style)
+    if lookup == LOOKUP_PERFECT_HASH:
+        return _get_perfect_hash_from_value_method(class_name, style)
+    return _get_from_value_method(class_name, style)
 
 
-def _get_javadoc(description: str) -> List[str]:
+def get_javadoc(description: Optional[str]) -> List[str]:
     javadoc = [""]
     if description is not None:
         javadoc = [
@@ -66,64 +310,119 @@ def _get_javadoc(description: str) -> List[str]:
     return javadoc
 
 
-def _get_constants(constants: List[str]) -> List[str]:
-    values = []
-    for i, value in enumerate(constants):
-        line_end = ";" if i == (len(constants) - 1) else ","
-        values.append(
-            f'{indent_lvl1}{to_java_constant(value)}("{value}"){line_end}'
-        )
-    return values
+def _get_constants(constants: List[str], style: TemplateStyle = DEFAULT_STYLE,
+                   names: Optional[Sequence[str]] = None) -> Iterator[str]:
+    indent = style.indent_lvl1
+    last = len(constants) - 1
+    for i, (value, name) in enumerate(zip(constants, names or to_java_constants(constants))):
+        line_end = ";" if i == last else ","
+        yield f'{indent}{name}("{value}"){line_end}'
 
 
-def _get_static_method(class_name: str) -> List[str]:
+def _get_static_method(class_name: str, style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
     body = [
-        f"{indent_lvl1}static {{",
-        f"{indent_lvl2}for ({class_name} c : values()) {{",
-        f"{indent_lvl3}CONSTANTS.put(c.value, c);",
-        f"{indent_lvl2}}}",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}static {{",
+        f"{style.indent_lvl2}for ({class_name} c : values()) {{",
+        f"{style.indent_lvl3}CONSTANTS.put(c.value, c);",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
     ]
     return body
 
 
-def _get_constructor(class_name: str) -> List[str]:
+def _get_constructor(class_name: str, style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
     body = [
-        f"{indent_lvl1}{class_name}(String value) {{",
-        f"{indent_lvl2}this.value = value;",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}{class_name}(String value) {{",
+        f"{style.indent_lvl2}this.value = value;",
+        f"{style.indent_lvl1}}}"
     ]
     return body
 
 
-def _get_from_value_method(class_name: str) -> List[str]:
+def _get_from_value_method(class_name: str, style: TemplateStyle = DEFAULT_STYLE,
+                           constants: str = "CONSTANTS") -> List[str]:
     body = [
-        f"{indent_lvl1}public static {class_name} fromValue(String value) {{",
-        f"{indent_lvl2}{class_name} constant = CONSTANTS.get(value);",
-        f"{indent_lvl2}if (constant == null) {{",
-        f"{indent_lvl3}throw new IllegalArgumentException(value);",
-        f"{indent_lvl2}}} else {{",
-        f"{indent_lvl3}return constant;",
-        f"{indent_lvl2}}}",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}public static {class_name} fromValue(String value) {{",
+        f"{style.indent_lvl2}{class_name} constant = {constants}.get(value);",
+        f"{style.indent_lvl2}if (constant == null) {{",
+        f"{style.indent_lvl3}throw new IllegalArgumentException(value);",
+        f"{style.indent_lvl2}}} else {{",
+        f"{style.indent_lvl3}return constant;",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
+
+
+def _get_switch_from_value_method(class_name: str, style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
+    body = [
+        f"{style.indent_lvl1}public static {class_name} fromValue(String value) {{",
+        f"{style.indent_lvl2}if (value == null) {{",
+        f"{style.indent_lvl3}throw new IllegalArgumentException(value);",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl2}switch (value) {{",
+        slot("switch_cases"),
+        f"{style.indent_lvl3}default:",
+        f"{style.indent_lvl3}{style.indent_lvl1}throw new IllegalArgumentException(value);",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
+
+
+def _get_switch_cases(constants: Sequence[str], style: TemplateStyle = DEFAULT_STYLE,
+                      names: Optional[Sequence[str]] = None) -> Iterator[str]:
+    case_indent = style.indent_lvl3
+    return_indent = style.indent_lvl3 + style.indent_lvl1
+    for value, name in zip(constants, names or to_java_constants(constants)):
+        yield f'{case_indent}case "{value}":'
+        yield f"{return_indent}return {name};"
+
+
+def _get_perfect_hash_from_value_method(class_name: str, style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
+    indent_lvl4 = style.indent_lvl3 + style.indent_lvl1
+    body = [
+        f"{style.indent_lvl1}public static {class_name} fromValue(String value) {{",
+        f"{style.indent_lvl2}if (value != null) {{",
+        f"{style.indent_lvl3}{class_name} constant = TABLE[slot(value)];",
+        f"{style.indent_lvl3}if (constant != null && constant.value.equals(value)) {{",
+        f"{indent_lvl4}return constant;",
+        f"{style.indent_lvl3}}}",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl2}throw new IllegalArgumentException(value);",
+        f"{style.indent_lvl1}}}",
+        "",
+        f"{style.indent_lvl1}private static int slot(String value) {{",
+        f"{style.indent_lvl2}int h = value.hashCode();",
+        f"{style.indent_lvl2}int displacement = DISPLACEMENTS.charAt(mix(h, 0) >>> {slot('bucket_shift')});",
+        f"{style.indent_lvl2}return mix(h, displacement) & {slot('table_mask')};",
+        f"{style.indent_lvl1}}}",
+        "",
+        f"{style.indent_lvl1}private static int mix(int h, int seed) {{",
+        f"{style.indent_lvl2}h ^= seed * 0x9E3779B9;",
+        f"{style.indent_lvl2}h ^= h >>> 16;",
+        f"{style.indent_lvl2}h *= 0x85EBCA6B;",
+        f"{style.indent_lvl2}h ^= h >>> 13;",
+        f"{style.indent_lvl2}return h;",
+        f"{style.indent_lvl1}}}"
     ]
     return body
 
 
-def _get_to_string_method() -> List[str]:
+def _get_to_string_method(style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
     body = [
-        f"{indent_lvl1}@Override",
-        f"{indent_lvl1}public String toString() {{",
-        f"{indent_lvl2}return this.value;",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}@Override",
+        f"{style.indent_lvl1}public String toString() {{",
+        f"{style.indent_lvl2}return this.value;",
+        f"{style.indent_lvl1}}}"
     ]
     return body
 
 
-def _get_value_method() -> List[str]:
+def _get_value_method(style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
     body = [
-        f"{indent_lvl1}public String value() {{",
-        f"{indent_lvl2}return this.value;",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}public String value() {{",
+        f"{style.indent_lvl2}return this.value;",
+        f"{style.indent_lvl1}}}"
     ]
     return body
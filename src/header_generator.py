@@ -1,8 +1,24 @@
 import re
+from functools import lru_cache
+from typing import Pattern
 
+PACKAGE_REGEX = r"^(?:[A-Za-z_][A-Za-z0-9_]*)(?:\.(?:[A-Za-z_][A-Za-z0-9_]*))*$"
+PACKAGE_CACHE_SIZE = 1024
 
+
+# Every generated file of a package checks the same string, so after the up-front validation pass these are hits.
+@lru_cache(maxsize=PACKAGE_CACHE_SIZE)
 def set_package(package: str) -> str:
-    PACKAGE_REGEX = r"^(?:[A-Za-z_][A-Za-z0-9_]*)(?:\.(?:[A-Za-z_][A-Za-z0-9_]*))*$"
-    if not re.match(PACKAGE_REGEX, package):
+    if not _package_pattern().match(package):
         raise ValueError(f"Invalid package: '{package}'")
     return f"package {package};"
+
+
+def package_declaration(package: str, validated: bool = False) -> str:
+    # The compiler checks every package of a schema set before rendering, so its units skip the pattern match.
+    return f"package {package};" if validated else set_package(package)
+
+
+@lru_cache(maxsize=None)
+def _package_pattern() -> Pattern[str]:
+    return re.compile(PACKAGE_REGEX)
@@ -0,0 +1,189 @@
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager, Dict, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+REPORT_VERSION = 1
+DEFAULT_TOP_N = 10
+PROFILE_TOP_FUNCTIONS = 25
+
+_recorder: ContextVar[Optional["Recorder"]] = ContextVar("jsonschema2javaclass_recorder", default=None)
+_NO_STAGE = nullcontext()
+
+
+@dataclass
+class StageTiming:
+    seconds: float = 0.0
+    calls: int = 0
+
+
+@dataclass
+class Recorder:
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    schema_seconds: Dict[str, float] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    memory_peak_bytes: Optional[int] = None
+    memory_top: List[dict] = field(default_factory=list)
+    profile: List[dict] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str, schema: Optional[str] = None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timing = self.stages.setdefault(name, StageTiming())
+            timing.seconds += elapsed
+            timing.calls += 1
+            if schema is not None:
+                self.schema_seconds[schema] = self.schema_seconds.get(schema, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: "Recorder") -> None:
+        for name, timing in other.stages.items():
+            merged = self.stages.setdefault(name, StageTiming())
+            merged.seconds += timing.seconds
+            merged.calls += timing.calls
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+        for schema, seconds in other.schema_seconds.items():
+            self.schema_seconds[schema] = self.schema_seconds.get(schema, 0.0) + seconds
+
+    def slowest_schemas(self, top_n: int = DEFAULT_TOP_N) -> List[dict]:
+        ranked = sorted(self.schema_seconds.items(), key=lambda item: (-item[1], item[0]))
+        return [{"schema": schema, "seconds": seconds} for schema, seconds in ranked[:top_n]]
+
+    def report(self, top_n: int = DEFAULT_TOP_N) -> dict:
+        report = {
+            "version": REPORT_VERSION,
+            "wall_seconds": self.wall_seconds,
+            "stages": {name: {"seconds": timing.seconds, "calls": timing.calls}
+                       for name, timing in self.stages.items()},
+            "counters": dict(sorted(self.counters.items())),
+            "slowest_schemas": self.slowest_schemas(top_n)
+        }
+        if self.memory_peak_bytes is not None:
+            report["memory"] = {"peak_bytes": self.memory_peak_bytes, "top_allocations": self.memory_top}
+        if self.profile:
+            report["profile"] = self.profile
+        return report
+
+    def summary(self, top_n: int = DEFAULT_TOP_N) -> str:
+        lines = [f"{'stage':<20}{'calls':>8}{'seconds':>12}{'share':>8}"]
+        for name, timing in sorted(self.stages.items(), key=lambda item: -item[1].seconds):
+            share = timing.seconds / self.wall_seconds if self.wall_seconds else 0.0
+            lines.append(f"{name:<20}{timing.calls:>8}{timing.seconds:>12.4f}{share:>8.1%}")
+        lines.append(f"{'total':<20}{'':>8}{self.wall_seconds:>12.4f}")
+
+        if self.counters:
+            lines.append("")
+            lines.append(", ".join(f"{name}: {value}" for name, value in sorted(self.counters.items())))
+        if self.memory_peak_bytes is not None:
+            lines.append(f"peak traced memory: {self.memory_peak_bytes / (1024 * 1024):.1f} MiB")
+
+        slowest = self.slowest_schemas(top_n)
+        if slowest:
+            lines.append("")
+            lines.append(f"slowest {len(slowest)} schemas:")
+            lines.extend(f"{entry['seconds']:>10.4f}s  {entry['schema']}" for entry in slowest)
+        return "\n".join(lines)
+
+
+def current_recorder() -> Optional[Recorder]:
+    return _recorder.get()
+
+
+def stage(name: str, schema: Optional[str] = None) -> ContextManager[None]:
+    recorder = _recorder.get()
+    if recorder is None:
+        return _NO_STAGE
+    return recorder.stage(name, schema)
+
+
+def count(name: str, amount: int = 1) -> None:
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.count(name, amount)
+
+
+@contextmanager
+def collecting() -> Iterator[Recorder]:
+    # A bare recorder for work that runs outside the recording context, such as a worker process, whose stages are
+    # merged back into the caller's recorder.
+    recorder = Recorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextmanager
+def recording(profile: bool = False, trace_memory: bool = False,
+              profile_path: Optional[Union[str, Path]] = None) -> Iterator[Recorder]:
+    import cProfile
+    import tracemalloc
+
+    recorder = Recorder()
+    token = _recorder.set(recorder)
+    profiler = cProfile.Profile() if profile or profile_path else None
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory and hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    if profiler is not None:
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        yield recorder
+    finally:
+        recorder.wall_seconds = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            recorder.profile = _profile_entries(profiler)
+            if profile_path is not None:
+                profiler.dump_stats(str(profile_path))
+        if trace_memory:
+            _, recorder.memory_peak_bytes = tracemalloc.get_traced_memory()
+            recorder.memory_top = _memory_entries(tracemalloc.take_snapshot())
+            if started_tracing:
+                tracemalloc.stop()
+        _recorder.reset(token)
+
+
+def write_report(recorder: Recorder, path: Union[str, Path], top_n: int = DEFAULT_TOP_N) -> None:
+    Path(path).write_text(json.dumps(recorder.report(top_n), indent=2), encoding="utf-8")
+
+
+def _profile_entries(profiler: "cProfile.Profile") -> List[dict]:
+    import pstats
+
+    stats = pstats.Stats(profiler)
+    entries = []
+    for (filename, line, function), (_, calls, total, cumulative, _) in stats.stats.items():
+        entries.append({
+            "function": f"{filename}:{line}({function})",
+            "calls": calls,
+            "total_seconds": total,
+            "cumulative_seconds": cumulative
+        })
+    entries.sort(key=lambda entry: -entry["cumulative_seconds"])
+    return entries[:PROFILE_TOP_FUNCTIONS]
+
+
+def _memory_entries(snapshot: "tracemalloc.Snapshot") -> List[dict]:
+    return [{"location": str(statistic.traceback), "bytes": statistic.size, "count": statistic.count}
+            for statistic in snapshot.statistics("lineno")[:DEFAULT_TOP_N]]
@@ -1,160 +1,355 @@
-import re
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, TextIO, Tuple
 
-from src.java_model import JAVA_KEYWORDS, JAVA_BUILTIN_TYPES, JAVA_LITERALS, indent_lvl1, indent_lvl2, indent_lvl3, \
-    return_indent, Field
+from src.java_model import JAVA_PRIMITIVE_WRAPPERS, Field
+from src.naming import accessor_name, build_getter_name, build_setter_name, validate_java_identifier
+from src.options import EQUALS_FAST, EQUALS_MODES, EQUALS_STANDARD
+from src.source_writer import iter_lines, write_chunks
+from src.templates import DEFAULT_STYLE, CompiledTemplate, TemplateStyle, compile_template, slot
 
+CACHED_HASH_FIELD = "cachedHashCode"
+# Locals of the generated equals(Object obj) that a field with the same name would shadow.
+EQUALS_LOCALS = ("obj", "that")
+HASH_LOCALS = ("h",)
 
-def generate_fields_block(fields: List[Field]) -> str:
-    declaration = []
+
+class FieldPlan(NamedTuple):
+    field: Field
+    getter_name: str
+    setter_name: str
+    primitive: bool
+    comparison: str
+    hash_term: str
+
+
+def plan_fields(fields: List[Field], validated: bool = False) -> List[FieldPlan]:
+    plans = []
     for field in fields:
-        declaration.append(generate_field_declaration(field))
+        if validated:
+            getter_name, setter_name = accessor_name("get", field.name), accessor_name("set", field.name)
+        else:
+            validate_java_identifier(field.name)
+            getter_name, setter_name = build_getter_name(field.name), build_setter_name(field.name)
+        plans.append(FieldPlan(field, getter_name, setter_name, field.type in JAVA_PRIMITIVE_WRAPPERS,
+                               _field_comparison(field), _field_hash(field)))
+    return plans
 
-    return "\n".join(declaration)
 
+def generate_fields_block(fields: List[Field], final: bool = False, style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_fields_block_lines(fields, final, style))
 
-def generate_field_declaration(field: Field) -> str:
-    _validate_java_field_name(field.name)
 
-    declaration = [
-        _render_javadoc(field),
-        f"{indent_lvl1}private {field.type} {field.name};"
-    ]
-    return "\n".join(declaration)
+def iter_fields_block(fields: List[Field], final: bool = False,
+                      style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    return iter_lines(_iter_fields_block_lines(fields, final, style))
 
 
-def _render_javadoc(field: Field) -> str:
-    if field.description is None:
-        return ""
+def write_fields_block(fields: List[Field], sink: TextIO, final: bool = False,
+                       style: TemplateStyle = DEFAULT_STYLE) -> None:
+    write_chunks(iter_fields_block(fields, final, style), sink)
 
-    return "\n".join([
-        "",
-        f"{indent_lvl1}/**",
-        f"{indent_lvl1} * {field.description}",
-        f"{indent_lvl1} */"
-    ])
 
+def _iter_fields_block_lines(fields: List[Field], final: bool = False,
+                             style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_field_declarations(plan_fields(fields), final, style)
 
-def generate_getters_and_setters(fields: List[Field]) -> str:
-    methods = []
-    for field in fields:
-        methods.append(generate_getter(field))
-        methods.append(generate_setter(field))
 
-    return "\n\n".join(methods)
+def render_field_declarations(plans: List[FieldPlan], final: bool = False,
+                              style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    modifiers = "private final" if final else "private"
+    for plan in plans:
+        yield from _render_javadoc(plan.field, style)
+        yield f"{style.indent_lvl1}{modifiers} {plan.field.type} {plan.field.name};"
 
 
-def generate_getter(field: Field) -> str:
-    getter_name = _build_getter_name(field.name)
+def generate_field_declaration(field: Field, final: bool = False, style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_field_declaration_lines(field, final, style))
 
-    getter = [
-        "",
-        f"{indent_lvl1}public {field.type} {getter_name}() {{",
-        f"{indent_lvl2}return {field.name};",
-        f"{indent_lvl1}}}"
-    ]
-    return "\n".join(getter)
+
+def _iter_field_declaration_lines(field: Field, final: bool = False,
+                                  style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_field_declarations(plan_fields([field]), final, style)
 
 
-def generate_setter(field: Field) -> str:
-    setter_name = _build_setter_name(field.name)
+def _render_javadoc(field: Field, style: TemplateStyle = DEFAULT_STYLE) -> List[str]:
+    if field.description is None:
+        return [""]
 
-    setter = [
+    return [
         "",
-        f"{indent_lvl1}public void {setter_name}({field.type} {field.name}) {{",
-        f"{indent_lvl2}this.{field.name} = {field.name};",
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}/**",
+        f"{style.indent_lvl1} * {field.description}",
+        f"{style.indent_lvl1} */"
     ]
-    return "\n".join(setter)
 
 
-def generate_equals(class_name: str, fields: List[Field]) -> str:
-    equals = [
-        "",
-        f"{indent_lvl1}@Override",
-        f"{indent_lvl1}public boolean equals(Object obj) {{",
+def generate_getters_and_setters(fields: List[Field], style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_getters_and_setters_lines(fields, style))
 
-        f"{indent_lvl2}if (this == obj)",
-        f"{indent_lvl3}return true;",
 
-        f"{indent_lvl2}if (!(obj instanceof {class_name}))",
-        f"{indent_lvl3}return false;",
+def iter_getters_and_setters(fields: List[Field], style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    return iter_lines(_iter_getters_and_setters_lines(fields, style))
 
-        f"{indent_lvl2}{class_name} that = ({class_name}) obj;",
 
-        _render_equals_return_statement(fields),
-        f"{indent_lvl1}}}"
-    ]
+def write_getters_and_setters(fields: List[Field], sink: TextIO, style: TemplateStyle = DEFAULT_STYLE) -> None:
+    write_chunks(iter_getters_and_setters(fields, style), sink)
 
-    return "\n".join(equals)
 
+def _iter_getters_and_setters_lines(fields: List[Field], style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_accessors(plan_fields(fields), style)
 
-def _render_equals_return_statement(fields: List[Field]) -> str:
-    return_statement = []
-    for i, field in enumerate(fields):
-        getter_name = _build_getter_name(field.name)
-        end_line = ";" if i == (len(fields) - 1) else ""
-        if i == 0:
-            return_statement.append(f"{indent_lvl2}return Objects.equals({getter_name}(), that.{getter_name}()){end_line}")
-        else:
-            return_statement.append(
-                f"{indent_lvl2}{return_indent}&& Objects.equals({getter_name}(), that.{getter_name}()){end_line}")
-    return "\n".join(return_statement)
+
+def render_accessors(plans: List[FieldPlan], style: TemplateStyle = DEFAULT_STYLE,
+                     setters: bool = True) -> Iterator[str]:
+    for i, plan in enumerate(plans):
+        if i > 0 and setters:
+            yield ""
+        yield from render_getter(plan, style)
+        if setters:
+            yield ""
+            yield from render_setter(plan, style)
+
+
+def generate_getters(fields: List[Field], style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_getters_lines(fields, style))
+
+
+def _iter_getters_lines(fields: List[Field], style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_accessors(plan_fields(fields), style, setters=False)
+
+
+def generate_getter(field: Field, style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_getter_lines(field, style))
+
+
+def _iter_getter_lines(field: Field, style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_getter(plan_fields([field])[0], style)
+
+
+def render_getter(plan: FieldPlan, style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}public {plan.field.type} {plan.getter_name}() {{"
+    yield f"{style.indent_lvl2}return {plan.field.name};"
+    yield f"{style.indent_lvl1}}}"
+
+
+def generate_setter(field: Field, style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_setter_lines(field, style))
+
+
+def _iter_setter_lines(field: Field, style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield from render_setter(plan_fields([field])[0], style)
+
+
+def render_setter(plan: FieldPlan, style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    field = plan.field
+    yield ""
+    yield f"{style.indent_lvl1}public void {plan.setter_name}({field.type} {field.name}) {{"
+    yield f"{style.indent_lvl2}this.{field.name} = {field.name};"
+    yield f"{style.indent_lvl1}}}"
+
+
+def generate_equals(class_name: str, fields: List[Field], mode: str = EQUALS_STANDARD,
+                    style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_equals_lines(class_name, fields, style, mode=mode))
 
 
-def generate_hash_code(fields: List[Field]) -> str:
-    hash_code = [
+def iter_equals(class_name: str, fields: List[Field], mode: str = EQUALS_STANDARD,
+                style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    return iter_lines(_iter_equals_lines(class_name, fields, style, mode=mode))
+
+
+def write_equals(class_name: str, fields: List[Field], sink: TextIO, mode: str = EQUALS_STANDARD,
+                 style: TemplateStyle = DEFAULT_STYLE) -> None:
+    write_chunks(iter_equals(class_name, fields, mode, style), sink)
+
+
+class _EqualsTemplates(NamedTuple):
+    header: CompiledTemplate
+    first_statement: CompiledTemplate
+    next_statement: CompiledTemplate
+    footer: CompiledTemplate
+
+
+def _iter_equals_lines(class_name: str, fields: List[Field], style: TemplateStyle = DEFAULT_STYLE,
+                       mode: str = EQUALS_STANDARD, precomputed_hash: bool = False) -> Iterator[str]:
+    check_equals_mode(mode)
+    yield from render_equals(class_name, plan_fields(fields), style, mode, precomputed_hash)
+
+
+def render_equals(class_name: str, plans: List[FieldPlan], style: TemplateStyle = DEFAULT_STYLE,
+                  mode: str = EQUALS_STANDARD, precomputed_hash: bool = False) -> Iterator[str]:
+    templates = _equals_templates(style)
+    yield templates.header.render(class_name=class_name)
+    if precomputed_hash:
+        yield f"{style.indent_lvl2}if ({CACHED_HASH_FIELD} != that.{CACHED_HASH_FIELD})"
+        yield f"{style.indent_lvl3}return false;"
+    if mode == EQUALS_FAST:
+        yield from _render_fast_equals_return_statement(plans, style)
+    else:
+        yield from _render_equals_return_statement(plans, templates)
+    yield templates.footer.render()
+
+
+def check_equals_mode(mode: str) -> None:
+    if mode not in EQUALS_MODES:
+        raise ValueError(f"Unknown equals/hashCode mode: '{mode}'")
+
+
+def _render_equals_return_statement(plans: List[FieldPlan], templates: _EqualsTemplates) -> Iterator[str]:
+    if not plans:
+        yield ""
+    last = len(plans) - 1
+    for i, plan in enumerate(plans):
+        end_line = ";" if i == last else ""
+        statement = templates.first_statement if i == 0 else templates.next_statement
+        yield statement.render(getter_name=plan.getter_name, end_line=end_line)
+
+
+def _render_fast_equals_return_statement(plans: List[FieldPlan], style: TemplateStyle) -> Iterator[str]:
+    if not plans:
+        yield f"{style.indent_lvl2}return true;"
+    primitive_first = sorted(plans, key=lambda plan: not plan.primitive)
+    last = len(primitive_first) - 1
+    for i, plan in enumerate(primitive_first):
+        end_line = ";" if i == last else ""
+        prefix = "return " if i == 0 else f"{style.return_indent}&& "
+        yield f"{style.indent_lvl2}{prefix}{plan.comparison}{end_line}"
+
+
+def _field_comparison(field: Field, shadowed: Tuple[str, ...] = EQUALS_LOCALS) -> str:
+    field_reference = f"this.{field.name}" if field.name in shadowed else field.name
+    if field.type == "double":
+        return f"Double.compare({field_reference}, that.{field.name}) == 0"
+    if field.type == "float":
+        return f"Float.compare({field_reference}, that.{field.name}) == 0"
+    if field.type in JAVA_PRIMITIVE_WRAPPERS:
+        return f"{field_reference} == that.{field.name}"
+    return f"Objects.equals({field_reference}, that.{field.name})"
+
+
+@lru_cache(maxsize=None)
+def _equals_templates(style: TemplateStyle) -> _EqualsTemplates:
+    class_name = slot("class_name")
+    comparison = f"Objects.equals({slot('getter_name')}(), that.{slot('getter_name')}()){slot('end_line')}"
+    header = [
         "",
-        f"{indent_lvl1}@Override",
-        f"{indent_lvl1}public int hashCode() {{",
-        _render_hashcode_return_statement(fields),
-        f"{indent_lvl1}}}"
+        f"{style.indent_lvl1}@Override",
+        f"{style.indent_lvl1}public boolean equals(Object obj) {{",
+
+        f"{style.indent_lvl2}if (this == obj)",
+        f"{style.indent_lvl3}return true;",
+
+        f"{style.indent_lvl2}if (!(obj instanceof {class_name}))",
+        f"{style.indent_lvl3}return false;",
+
+        f"{style.indent_lvl2}{class_name} that = ({class_name}) obj;"
     ]
+    return _EqualsTemplates(
+        header=compile_template("\n".join(header)),
+        first_statement=compile_template(f"{style.indent_lvl2}return {comparison}"),
+        next_statement=compile_template(f"{style.indent_lvl2}{style.return_indent}&& {comparison}"),
+        footer=compile_template(f"{style.indent_lvl1}}}"))
+
+
+def generate_hash_code(fields: List[Field], mode: str = EQUALS_STANDARD, cache_hash: bool = False,
+                       style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_hash_code_lines(fields, mode, cache_hash, style))
+
+
+def iter_hash_code(fields: List[Field], mode: str = EQUALS_STANDARD, cache_hash: bool = False,
+                   style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    return iter_lines(_iter_hash_code_lines(fields, mode, cache_hash, style))
+
+
+def write_hash_code(fields: List[Field], sink: TextIO, mode: str = EQUALS_STANDARD, cache_hash: bool = False,
+                    style: TemplateStyle = DEFAULT_STYLE) -> None:
+    write_chunks(iter_hash_code(fields, mode, cache_hash, style), sink)
+
+
+def generate_cached_hash_field(style: TemplateStyle = DEFAULT_STYLE) -> str:
+    return "\n".join(_iter_cached_hash_field_lines(style))
+
+
+def _iter_cached_hash_field_lines(style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}private transient int {CACHED_HASH_FIELD};"
+
+
+def _iter_hash_code_lines(fields: List[Field], mode: str = EQUALS_STANDARD, cache_hash: bool = False,
+                          style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    check_equals_mode(mode)
+    if cache_hash and mode != EQUALS_FAST:
+        raise ValueError("A cached hashCode requires the fast equals/hashCode mode")
+
+    yield from render_hash_code(plan_fields(fields), style, mode, cache_hash)
 
-    return "\n".join(hash_code)
 
+def render_hash_code(plans: List[FieldPlan], style: TemplateStyle = DEFAULT_STYLE, mode: str = EQUALS_STANDARD,
+                     cache_hash: bool = False) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}@Override"
+    yield f"{style.indent_lvl1}public int hashCode() {{"
+    if cache_hash:
+        yield from _render_cached_hashcode_statements(plans, style)
+    elif mode == EQUALS_FAST:
+        yield from render_hash_statements(plans, style.indent_lvl2, "int h = 1;")
+        yield f"{style.indent_lvl2}return h;"
+    else:
+        yield from _render_hashcode_return_statement(plans, style)
+    yield f"{style.indent_lvl1}}}"
 
-def _render_hashcode_return_statement(fields: List[Field]) -> str:
-    if len(fields) == 1:
-        return _render_hashcode_return_statement_single_field(fields)
 
-    return _render_hashcode_return_statement_multiple_field(fields)
+def render_precomputed_hash_code(style: TemplateStyle = DEFAULT_STYLE) -> Iterator[str]:
+    yield ""
+    yield f"{style.indent_lvl1}@Override"
+    yield f"{style.indent_lvl1}public int hashCode() {{"
+    yield f"{style.indent_lvl2}return {CACHED_HASH_FIELD};"
+    yield f"{style.indent_lvl1}}}"
 
 
-def _render_hashcode_return_statement_single_field(fields: List[Field]) -> str:
-    field_name = fields[0].name
-    getter_name = _build_getter_name(field_name)
-    return f"{indent_lvl2}return Objects.hash({getter_name}());"
+def render_hash_statements(plans: List[FieldPlan], indent: str, initializer: str,
+                           shadowed: Tuple[str, ...] = HASH_LOCALS) -> Iterator[str]:
+    yield f"{indent}{initializer}"
+    for plan in plans:
+        hash_term = plan.hash_term if shadowed == HASH_LOCALS else _field_hash(plan.field, shadowed)
+        yield f"{indent}h = 31 * h + {hash_term};"
 
 
-def _render_hashcode_return_statement_multiple_field(fields: List[Field]) -> str:
-    return_statement = [f"{indent_lvl2}return Objects.hash("]
-    for index, field in enumerate(fields):
-        getter_name = _build_getter_name(field.name)
-        comma = "," if index < (len(fields) - 1) else ""
-        return_statement.append(f"{indent_lvl2}{return_indent}{getter_name}(){comma}")
+def _render_cached_hashcode_statements(plans: List[FieldPlan], style: TemplateStyle) -> Iterator[str]:
+    yield f"{style.indent_lvl2}int h = {CACHED_HASH_FIELD};"
+    yield f"{style.indent_lvl2}if (h == 0) {{"
+    yield from render_hash_statements(plans, style.indent_lvl3, "h = 1;")
+    yield f"{style.indent_lvl3}{CACHED_HASH_FIELD} = h;"
+    yield f"{style.indent_lvl2}}}"
+    yield f"{style.indent_lvl2}return h;"
 
-    return_statement.append(f"{indent_lvl2});")
 
-    return "\n".join(return_statement)
+def _field_hash(field: Field, shadowed: Tuple[str, ...] = HASH_LOCALS) -> str:
+    field_reference = f"this.{field.name}" if field.name in shadowed else field.name
+    wrapper = JAVA_PRIMITIVE_WRAPPERS.get(field.type)
+    if wrapper is not None:
+        return f"{wrapper}.hashCode({field_reference})"
+    return f"Objects.hashCode({field_reference})"
 
 
-def _build_getter_name(field_name: str) -> str:
-    _validate_java_field_name(field_name)
-    return "get" + field_name[0].upper() + field_name[1:]
+def _render_hashcode_return_statement(plans: List[FieldPlan], style: TemplateStyle) -> Iterator[str]:
+    if len(plans) == 1:
+        return _render_hashcode_return_statement_single_field(plans, style)
 
+    return _render_hashcode_return_statement_multiple_field(plans, style)
 
-def _build_setter_name(field_name: str) -> str:
-    _validate_java_field_name(field_name)
-    return "set" + field_name[0].upper() + field_name[1:]
 
+def _render_hashcode_return_statement_single_field(plans: List[FieldPlan], style: TemplateStyle) -> Iterator[str]:
+    yield f"{style.indent_lvl2}return Objects.hash({plans[0].getter_name}());"
 
-def _validate_java_field_name(name: str) -> None:
-    if not name:
-        raise ValueError("Field name cannot be empty")
 
-    if name in JAVA_KEYWORDS | JAVA_BUILTIN_TYPES | JAVA_LITERALS:
-        raise ValueError(f"'{name}' is a Java reserved keyword")
+def _render_hashcode_return_statement_multiple_field(plans: List[FieldPlan],
+                                                     style: TemplateStyle) -> Iterator[str]:
+    yield f"{style.indent_lvl2}return Objects.hash("
+    last = len(plans) - 1
+    for index, plan in enumerate(plans):
+        comma = "," if index < last else ""
+        yield f"{style.indent_lvl2}{style.return_indent}{plan.getter_name}(){comma}"
 
-    if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", name):
-        raise ValueError(f"Invalid Java identifier: '{name}'")
+    yield f"{style.indent_lvl2});"
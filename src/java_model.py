@@ -1,5 +1,6 @@
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple, Union
 
 JAVA_KEYWORDS = {
     "abstract", "assert", "boolean", "break", "byte", "case", "catch",
@@ -18,6 +19,11 @@ JAVA_BUILTIN_TYPES = {
 JAVA_LITERALS = {
     "null", "true", "false"
 }
+JAVA_PRIMITIVE_WRAPPERS = {
+    "boolean": "Boolean", "byte": "Byte", "char": "Character", "double": "Double", "float": "Float",
+    "int": "Integer", "long": "Long", "short": "Short"
+}
+JAVA_RESERVED_WORDS = frozenset(JAVA_KEYWORDS | JAVA_BUILTIN_TYPES | JAVA_LITERALS)
 indent_lvl1 = " " * 4
 indent_lvl2 = indent_lvl1 * 2
 indent_lvl3 = indent_lvl1 * 3
@@ -36,3 +42,53 @@ class Field:
     name: str
     type: str
     description: Optional[str] = None
+
+
+@dataclass
+class JavaClass:
+    name: str
+    fields: List[Field]
+    description: Optional[str] = None
+
+
+class CompactField(NamedTuple):
+    name: str
+    type: str
+    description: Optional[str] = None
+
+
+class CompactEnumClass(NamedTuple):
+    name: str
+    values: Tuple[str, ...]
+    description: Optional[str] = None
+
+
+class CompactJavaClass(NamedTuple):
+    name: str
+    fields: Tuple[CompactField, ...]
+    description: Optional[str] = None
+
+
+def is_enum_model(model: Union[EnumClass, JavaClass, CompactEnumClass, CompactJavaClass]) -> bool:
+    return isinstance(model, (EnumClass, CompactEnumClass))
+
+
+def compact_field(field: Union[Field, CompactField]) -> CompactField:
+    return CompactField(sys.intern(field.name), sys.intern(field.type), _intern_optional(field.description))
+
+
+def compact_model(model: Union[EnumClass, JavaClass, CompactEnumClass, CompactJavaClass]) \
+        -> Union[CompactEnumClass, CompactJavaClass]:
+    if is_enum_model(model):
+        return CompactEnumClass(
+            sys.intern(model.name),
+            tuple(sys.intern(value) for value in model.values),
+            _intern_optional(model.description))
+    return CompactJavaClass(
+        sys.intern(model.name),
+        tuple(compact_field(field) for field in model.fields),
+        _intern_optional(model.description))
+
+
+def _intern_optional(text: Optional[str]) -> Optional[str]:
+    return None if text is None else sys.intern(text)
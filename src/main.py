@@ -1,6 +1,189 @@
-def main():
-    pass
+import argparse
+import sys
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, List, Optional
+
+from src.instrumentation import DEFAULT_TOP_N, recording, write_report
+from src.options import CLASS_STYLE_BEAN, CLASS_STYLES, DEFAULT_CACHE_MAX_MB, EQUALS_MODES, EQUALS_STANDARD, \
+    LOOKUP_MAP, LOOKUP_STRATEGIES, MAX_ENUM_CONSTANTS, ON_CONFLICT_ERROR, ON_CONFLICT_RENAME
+
+if TYPE_CHECKING:
+    from src.watcher import WatchUpdate
+
+# Commands import their implementation on demand: the CLI is started once per module by build tools, so a plain
+# run should not pay for asyncio, the watcher or generators it never uses.
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    if args.watch:
+        return _watch(args)
+    instrumented = args.report is not None or args.profile is not None or args.trace_memory
+    session = recording(profile=args.profile is not None, trace_memory=args.trace_memory,
+                        profile_path=args.profile or None) if instrumented else nullcontext()
+    try:
+        with session as recorder:
+            options = dict(workers=args.workers, shared_package=args.shared_package, on_conflict=args.on_conflict,
+                           enum_lookup=args.enum_lookup, enum_benchmarks=args.enum_benchmarks,
+                           equals_mode=args.equals_mode, class_style=args.class_style, codecs=args.codecs)
+            if args.jar:
+                from src.compiler import compile_to_jar
+                result = compile_to_jar(args.schema_dir, args.output_dir, args.package, **options)
+            elif args.pipelined:
+                from src.async_pipeline import compile_directory_pipelined
+                result = compile_directory_pipelined(args.schema_dir, args.output_dir, args.package,
+                                                     incremental=not args.force, **options)
+            else:
+                cache = None
+                if args.cache_dir is not None:
+                    from src.render_cache import RenderCache
+                    cache = RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+                if args.bundle:
+                    from src.compiler import compile_bundle
+                    result = compile_bundle(args.schema_dir, args.output_dir, args.package, args.roots,
+                                            incremental=not args.force, cache=cache, **options)
+                else:
+                    from src.compiler import compile_directory
+                    result = compile_directory(args.schema_dir, args.output_dir, args.package,
+                                               incremental=not args.force, cache=cache, **options)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    for conflict in result.conflicts:
+        print(f"warning: {conflict}", file=sys.stderr)
+    for warning in result.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    if args.jar:
+        print(f"Wrote source JAR '{args.output_dir}'" if result.written
+              else f"Source JAR '{args.output_dir}' is unchanged")
+    else:
+        print(f"Generated {len(result.written)} Java files in '{args.output_dir}' "
+              f"({len(result.unchanged)} unchanged, {len(result.removed)} removed)")
+    if recorder is not None:
+        print(recorder.summary(args.top))
+        if args.report is not None:
+            write_report(recorder, args.report, args.top)
+    return 0
+
+
+def _watch(args: argparse.Namespace) -> int:
+    from src.watcher import WatchSession, create_watcher, watch
+
+    try:
+        session = WatchSession(args.schema_dir, args.output_dir, args.package, shared_package=args.shared_package,
+                               on_conflict=args.on_conflict, enum_lookup=args.enum_lookup,
+                               enum_benchmarks=args.enum_benchmarks, equals_mode=args.equals_mode,
+                               class_style=args.class_style, codecs=args.codecs)
+        update = session.build()
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    _print_watch_update(update)
+    watcher = create_watcher(args.schema_dir, polling=args.poll)
+    print(f"Watching '{args.schema_dir}' for schema changes ({type(watcher).__name__}), press Ctrl+C to stop")
+    try:
+        watch(session, watcher, _print_watch_update, lambda error: print(f"error: {error}", file=sys.stderr))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+def _print_watch_update(update: "WatchUpdate") -> None:
+    for error in update.errors:
+        print(f"error: {error}", file=sys.stderr)
+    for conflict in update.result.conflicts:
+        print(f"warning: {conflict}", file=sys.stderr)
+    for warning in update.result.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    if update.errors and not update.changed:
+        return
+    print(f"Regenerated {len(update.result.written)} Java files in {update.seconds * 1000:.0f} ms "
+          f"({len(update.changed)} changed, {len(update.affected)} affected schemas, "
+          f"{len(update.result.removed)} removed)")
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="jsonschema2javaclass",
+        description="Generate Java classes and enums from a directory of JSON schemas.")
+    parser.add_argument("schema_dir", help="directory searched recursively for *.json schemas, or the schema file "
+                                           "with --bundle")
+    parser.add_argument("output_dir", help="root directory of the generated Java sources")
+    parser.add_argument("-p", "--package", required=True, help="Java package of the generated sources")
+    parser.add_argument("-j", "--workers", type=_positive_int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--shared-package", default=None,
+                        help="Java package for types defined identically by more than one schema")
+    parser.add_argument("--on-conflict", choices=[ON_CONFLICT_RENAME, ON_CONFLICT_ERROR], default=ON_CONFLICT_RENAME,
+                        help="how to handle different types sharing a name: prefix them with the schema name "
+                             "or fail (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the incremental build manifest and re-render every unit")
+    parser.add_argument("--enum-lookup", choices=LOOKUP_STRATEGIES, default=LOOKUP_MAP,
+                        help="how the generated fromValue finds a constant: a HashMap, a string switch, a "
+                             "perfect-hash table, or chosen from the enum size (default: %(default)s); enums with "
+                             f"more than {MAX_ENUM_CONSTANTS} values always use the HashMap and are generated as a "
+                             "final class with a constant field per value, which Java cannot switch on and which "
+                             "has no name() or valueOf()")
+    parser.add_argument("--enum-benchmarks", action="store_true",
+                        help="also generate a JMH fromValue benchmark for every enum in a 'jmh' subpackage")
+    parser.add_argument("--equals-mode", choices=EQUALS_MODES, default=EQUALS_STANDARD,
+                        help="'fast' compares fields directly and unrolls hashCode instead of calling "
+                             "Objects.hash (default: %(default)s)")
+    parser.add_argument("--class-style", choices=CLASS_STYLES, default=CLASS_STYLE_BEAN,
+                        help="mutable JavaBeans, Java 16+ records, or final-field classes with a builder and a "
+                             "precomputed hashCode (default: %(default)s)")
+    parser.add_argument("--codecs", action="store_true",
+                        help="also generate a reflection-free Jackson streaming codec next to every class")
+    parser.add_argument("--async", dest="pipelined", action="store_true",
+                        help="overlap schema reading, rendering and file writing in an asyncio pipeline")
+    parser.add_argument("--cache-dir", metavar="DIR", default=None,
+                        help="content-addressed render cache, for example on a mount shared by CI agents; a hit "
+                             "skips parsing and rendering")
+    parser.add_argument("--cache-max-mb", type=_positive_int, default=DEFAULT_CACHE_MAX_MB,
+                        help="size bound of the render cache, least recently used entries are evicted first "
+                             "(default: %(default)s)")
+    parser.add_argument("--bundle", action="store_true",
+                        help="SCHEMA_DIR is a single bundled schema file; it is memory-mapped and only the "
+                             "definitions that are generated get decoded")
+    parser.add_argument("--root", metavar="NAME", action="append", dest="roots", default=None,
+                        help="with --bundle, generate only this definition and the types it references; may be "
+                             "repeated (default: every definition)")
+    parser.add_argument("--jar", action="store_true",
+                        help="pack the generated sources into the source JAR/zip OUTPUT_DIR instead of a directory")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and regenerate the affected sources whenever a schema changes")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll the schema directory instead of using inotify")
+    parser.add_argument("--report", metavar="PATH", default=None,
+                        help="write per-stage timings and counters of the run as JSON to PATH")
+    parser.add_argument("--profile", metavar="PATH", nargs="?", const="", default=None,
+                        help="run under cProfile, add the hottest functions to the report and optionally dump "
+                             "the raw statistics to PATH")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace allocations with tracemalloc and report the peak and the top allocation sites")
+    parser.add_argument("--top", type=_positive_int, default=DEFAULT_TOP_N,
+                        help="number of slowest schemas listed in the summary and report (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.cache_dir is not None and (args.jar or args.watch or args.pipelined):
+        parser.error("--cache-dir cannot be combined with --jar, --watch or --async")
+    if args.bundle and (args.jar or args.watch or args.pipelined):
+        parser.error("--bundle cannot be combined with --jar, --watch or --async")
+    if args.roots and not args.bundle:
+        parser.error("--root requires --bundle")
+    return args
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
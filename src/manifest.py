@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Union
+
+from src import __version__
+from src.templates import DEFAULT_STYLE, TemplateStyle
+
+MANIFEST_NAME = ".jsonschema2javaclass-manifest.json"
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class Manifest:
+    options: str = ""
+    schemas: Dict[str, str] = field(default_factory=dict)
+    units: Dict[str, str] = field(default_factory=dict)
+    outputs: Dict[str, str] = field(default_factory=dict)
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hash_bytes(text.encode("utf-8"))
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as hashed_file:
+        for block in iter(lambda: hashed_file.read(HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint() -> str:
+    # The release version alone does not change between builds of the same checkout, so the generator sources are
+    # hashed as well and any edit to them invalidates manifests and cached trees.
+    fingerprint = hashlib.sha256(__version__.encode("utf-8"))
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        fingerprint.update(f"{path.name}:{hash_file(path)}\n".encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def hash_options(package: str, style: TemplateStyle = DEFAULT_STYLE, **generator_options) -> str:
+    options = {
+        **generator_options,
+        "generator": generator_fingerprint(),
+        "package": package,
+        **style._asdict()
+    }
+    return hash_text(json.dumps(options, sort_keys=True))
+
+
+def load_manifest(path: Union[str, Path]) -> Manifest:
+    try:
+        with open(path, encoding="utf-8") as manifest_file:
+            data = json.load(manifest_file)
+    except (OSError, ValueError):
+        return Manifest()
+
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return Manifest()
+    return Manifest(
+        options=data.get("options", ""),
+        schemas=data.get("schemas", {}),
+        units=data.get("units", {}),
+        outputs=data.get("outputs", {}))
+
+
+def save_manifest(path: Union[str, Path], manifest: Manifest) -> None:
+    data = {"version": MANIFEST_VERSION}
+    data.update(asdict(manifest))
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(data, manifest_file, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
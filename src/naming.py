@@ -0,0 +1,131 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Pattern
+
+from src.java_model import JAVA_RESERVED_WORDS
+
+NAME_CACHE_SIZE = 1 << 16
+
+_JAVA_IDENTIFIER = r"[A-Za-z_][A-Za-z0-9_]*"
+_NON_ALPHANUMERIC = r"[^A-Za-z0-9]"
+_NON_ALPHANUMERIC_OR_SEPARATOR = r"[^A-Za-z0-9\n]"
+_ACRONYM_BOUNDARY = r"([a-z])[_]?([A-Z])([A-Z])([a-z])"
+_CAMEL_CASE_BOUNDARY = r"([a-z])([A-Z])"
+_LETTER_DIGIT_BOUNDARY = r"([A-Za-z])([0-9])"
+_DIGIT_LETTER_BOUNDARY = r"([0-9])([A-Za-z])"
+_CAMEL_CASE_SPLIT = r"([A-Z])(?<=[a-z][A-Z])"
+_LETTER_DIGIT_SPLIT = r"([0-9])(?<=[A-Za-z][0-9])"
+_DIGIT_LETTER_SPLIT = r"([0-9])(?=[A-Za-z])"
+# Batch conversion joins the values with a separator that no rule matches, so each rule runs once over all of them.
+_BATCH_SEPARATOR = "\n"
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def java_constant_name(value: str) -> str:
+    value = _pattern(_NON_ALPHANUMERIC).sub("_", value)  # delimiters a-a -> A_A
+    value = _pattern(_ACRONYM_BOUNDARY).sub(r"\1_\2_\3\4", value)  # aBCd / a_BCd-> a_B_CD
+    value = _pattern(_CAMEL_CASE_BOUNDARY).sub(r"\1_\2", value)  # aA -> A_A
+    value = _pattern(_LETTER_DIGIT_BOUNDARY).sub(r"\1_\2", value)  # a9 / A9 -> a_9
+    value = _pattern(_DIGIT_LETTER_BOUNDARY).sub(r"\1_\2", value)  # 9a / 9A -> 9_A
+
+    return value.upper()
+
+
+def java_constant_names(values: Iterable[str]) -> List[str]:
+    values = list(values)
+    distinct = list(dict.fromkeys(values))
+    names = _joined_constant_names(distinct)
+    if len(set(names)) != len(names):
+        name, owners = next((name, owners) for name, owners in _group_by_name(distinct, names).items()
+                            if len(owners) > 1)
+        raise ValueError(f"Enum values '{owners[0]}' and '{owners[1]}' both map to the constant '{name}'")
+    if len(distinct) == len(values):
+        return names
+    names_by_value = dict(zip(distinct, names))
+    return [names_by_value[value] for value in values]
+
+
+def java_constant_owners(values: Iterable[str]) -> Dict[str, List[str]]:
+    distinct = list(dict.fromkeys(values))
+    return _group_by_name(distinct, _joined_constant_names(distinct))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def validate_java_identifier(name: str) -> str:
+    if not name:
+        raise ValueError("Field name cannot be empty")
+
+    if name in JAVA_RESERVED_WORDS:
+        raise ValueError(f"'{name}' is a Java reserved keyword")
+
+    if not _pattern(_JAVA_IDENTIFIER).fullmatch(name):
+        raise ValueError(f"Invalid Java identifier: '{name}'")
+
+    return name
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def build_getter_name(field_name: str) -> str:
+    validate_java_identifier(field_name)
+    return accessor_name("get", field_name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def build_setter_name(field_name: str) -> str:
+    validate_java_identifier(field_name)
+    return accessor_name("set", field_name)
+
+
+def accessor_name(prefix: str, field_name: str) -> str:
+    return prefix + field_name[0].upper() + field_name[1:]
+
+
+def clear_name_caches() -> None:
+    for cached in (java_constant_name, validate_java_identifier, build_getter_name, build_setter_name):
+        cached.cache_clear()
+
+
+def _joined_constant_names(values: List[str]) -> List[str]:
+    text = _BATCH_SEPARATOR.join(values)
+    if text.count(_BATCH_SEPARATOR) != len(values) - 1:
+        return [java_constant_name(value) for value in values]
+    if text.isascii():
+        text = text.translate(_ascii_delimiter_table())
+    else:
+        text = _pattern(_NON_ALPHANUMERIC_OR_SEPARATOR).sub("_", text)
+    text = _pattern(_ACRONYM_BOUNDARY).sub(r"\1_\2_\3\4", text)
+    # The remaining rules only insert "_" at a boundary. Each pattern starts with the rarer side of its boundary, so
+    # the regex engine skips ahead to candidates, and the split keeps the captured character without a template.
+    text = _insert_before(_pattern(_CAMEL_CASE_SPLIT), text)
+    text = _insert_before(_pattern(_LETTER_DIGIT_SPLIT), text)
+    text = _insert_after(_pattern(_DIGIT_LETTER_SPLIT), text)
+    return text.upper().split(_BATCH_SEPARATOR)
+
+
+def _group_by_name(values: List[str], names: List[str]) -> Dict[str, List[str]]:
+    owners: Dict[str, List[str]] = {}
+    for value, name in zip(values, names):
+        owners.setdefault(name, []).append(value)
+    return owners
+
+
+def _insert_before(pattern: Pattern[str], text: str) -> str:
+    parts = pattern.split(text)
+    parts[1::2] = ["_" + boundary for boundary in parts[1::2]]
+    return "".join(parts)
+
+
+def _insert_after(pattern: Pattern[str], text: str) -> str:
+    parts = pattern.split(text)
+    parts[1::2] = [boundary + "_" for boundary in parts[1::2]]
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _ascii_delimiter_table() -> Dict[int, str]:
+    return {code: "_" for code in range(128) if not chr(code).isalnum() and chr(code) != _BATCH_SEPARATOR}
+
+
+@lru_cache(maxsize=None)
+def _pattern(regex: str) -> Pattern[str]:
+    return re.compile(regex)
@@ -0,0 +1,22 @@
+LOOKUP_MAP = "map"
+LOOKUP_SWITCH = "switch"
+LOOKUP_PERFECT_HASH = "perfect-hash"
+LOOKUP_AUTO = "auto"
+LOOKUP_STRATEGIES = (LOOKUP_MAP, LOOKUP_SWITCH, LOOKUP_PERFECT_HASH, LOOKUP_AUTO)
+# A Java enum initializes every constant in one <clinit>, which overflows the 64KB method limit at a few thousand
+# constants. Larger enums are rendered as a final class instead, see enum_generator.
+MAX_ENUM_CONSTANTS = 2000
+
+EQUALS_STANDARD = "standard"
+EQUALS_FAST = "fast"
+EQUALS_MODES = (EQUALS_STANDARD, EQUALS_FAST)
+
+CLASS_STYLE_BEAN = "bean"
+CLASS_STYLE_RECORD = "record"
+CLASS_STYLE_IMMUTABLE = "immutable"
+CLASS_STYLES = (CLASS_STYLE_BEAN, CLASS_STYLE_RECORD, CLASS_STYLE_IMMUTABLE)
+
+ON_CONFLICT_RENAME = "rename"
+ON_CONFLICT_ERROR = "error"
+
+DEFAULT_CACHE_MAX_MB = 512
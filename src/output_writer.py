@@ -0,0 +1,100 @@
+import os
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterable, List, TextIO, Tuple, Union
+
+from src.header_generator import set_package
+from src.manifest import hash_bytes, hash_file
+from src.source_writer import HashingWriter
+
+JAR_MANIFEST_PATH = "META-INF/MANIFEST.MF"
+JAR_MANIFEST = "Manifest-Version: 1.0\r\nCreated-By: jsonschema2javaclass\r\n\r\n"
+# A fixed timestamp keeps the archive byte-identical when its sources are.
+JAR_ENTRY_TIME = (1980, 1, 1, 0, 0, 0)
+JAR_ENTRY_MODE = 0o644 << 16
+
+WriteResult = Tuple[str, str, bool]
+
+
+def package_directory(output_dir: Union[str, Path], package: str) -> Path:
+    set_package(package)
+    return Path(output_dir).joinpath(*package.split("."))
+
+
+def make_package_directories(output_dir: Union[str, Path], packages: Iterable[str]) -> List[Path]:
+    directories = [package_directory(output_dir, package) for package in sorted(set(packages))]
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+    return directories
+
+
+def write_if_changed(path: str, content: bytes) -> WriteResult:
+    content_hash = hash_bytes(content)
+    if os.path.isfile(path) and hash_file(path) == content_hash:
+        return path, content_hash, False
+
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path, content_hash, True
+
+
+def stream_if_changed(path: str, write: Callable[[TextIO], None]) -> WriteResult:
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, "wb") as temp_file:
+            writer = HashingWriter(temp_file)
+            write(writer)
+            writer.flush()
+        content_hash = writer.hexdigest()
+
+        if os.path.isfile(path) and hash_file(path) == content_hash:
+            return path, content_hash, False
+
+        os.replace(temp_path, path)
+        return path, content_hash, True
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def write_source_jar(path: Union[str, Path], entries: Iterable[Tuple[str, bytes]]) -> WriteResult:
+    path = str(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = _temp_path(path)
+    try:
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_DEFLATED) as jar:
+            _write_jar_entry(jar, JAR_MANIFEST_PATH, JAR_MANIFEST.encode("utf-8"))
+            for name, content in entries:
+                _write_jar_entry(jar, name, content)
+        content_hash = hash_file(temp_path)
+
+        if os.path.isfile(path) and hash_file(path) == content_hash:
+            return path, content_hash, False
+
+        os.replace(temp_path, path)
+        return path, content_hash, True
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _write_jar_entry(jar: zipfile.ZipFile, name: str, content: bytes) -> None:
+    if name.startswith("/") or ".." in name.split("/"):
+        raise ValueError(f"Invalid source JAR entry: '{name}'")
+    info = zipfile.ZipInfo(name, date_time=JAR_ENTRY_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = JAR_ENTRY_MODE
+    jar.writestr(info, content)
+
+
+def _temp_path(path: str) -> str:
+    return f"{path}.{os.getpid()}.tmp"
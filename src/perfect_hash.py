@@ -0,0 +1,85 @@
+import struct
+from typing import List, NamedTuple, Optional, Sequence
+
+MAX_DISPLACEMENT = 0xFFFF
+KEYS_PER_BUCKET = 4
+
+_INT_MASK = 0xFFFFFFFF
+_GOLDEN_GAMMA = 0x9E3779B9
+_MIX_MULTIPLIER = 0x85EBCA6B
+
+
+class PerfectHash(NamedTuple):
+    table_bits: int
+    bucket_bits: int
+    displacements: List[int]
+    slots: List[int]
+
+    @property
+    def table_size(self) -> int:
+        return 1 << self.table_bits
+
+    @property
+    def bucket_shift(self) -> int:
+        return 32 - self.bucket_bits
+
+
+def java_string_hash(value: str) -> int:
+    code_units = value.encode("utf-16-le")
+    h = 0
+    for code_unit in struct.unpack(f"<{len(code_units) // 2}H", code_units):
+        h = (31 * h + code_unit) & _INT_MASK
+    return h
+
+
+def mix(h: int, seed: int) -> int:
+    h = (h ^ (seed * _GOLDEN_GAMMA)) & _INT_MASK
+    h ^= h >> 16
+    h = (h * _MIX_MULTIPLIER) & _INT_MASK
+    h ^= h >> 13
+    return h
+
+
+def perfect_hash_slot(perfect_hash: PerfectHash, value: str) -> int:
+    h = java_string_hash(value)
+    displacement = perfect_hash.displacements[mix(h, 0) >> perfect_hash.bucket_shift]
+    return mix(h, displacement) & (perfect_hash.table_size - 1)
+
+
+def build_perfect_hash(values: Sequence[str]) -> Optional[PerfectHash]:
+    hashes = [java_string_hash(value) for value in values]
+    if len(set(hashes)) != len(hashes):
+        return None
+
+    table_bits = max(1, (2 * len(values) - 1).bit_length())
+    bucket_bits = max(1, (max(1, len(values) // KEYS_PER_BUCKET) - 1).bit_length())
+    table_mask = (1 << table_bits) - 1
+    bucket_shift = 32 - bucket_bits
+
+    buckets: List[List[int]] = [[] for _ in range(1 << bucket_bits)]
+    for index, h in enumerate(hashes):
+        buckets[mix(h, 0) >> bucket_shift].append(index)
+
+    displacements = [0] * len(buckets)
+    slots = [0] * len(values)
+    occupied = set()
+    for bucket in sorted(range(len(buckets)), key=lambda bucket: -len(buckets[bucket])):
+        members = buckets[bucket]
+        if not members:
+            break
+        for displacement in range(MAX_DISPLACEMENT + 1):
+            candidate = [mix(hashes[index], displacement) & table_mask for index in members]
+            if len(set(candidate)) == len(candidate) and occupied.isdisjoint(candidate):
+                break
+        else:
+            return None
+        displacements[bucket] = displacement
+        occupied.update(candidate)
+        for index, table_slot in zip(members, candidate):
+            slots[index] = table_slot
+
+    return PerfectHash(table_bits, bucket_bits, displacements, slots)
+
+
+def java_char_string(values: Sequence[int]) -> str:
+    return "".join(f"\\{value:o}" if value < 0x100 else f"\\u{value:04x}" for value in values)
@@ -0,0 +1,131 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.manifest import hash_bytes, hash_text
+from src.options import DEFAULT_CACHE_MAX_MB
+
+CACHE_LAYOUT_VERSION = 1
+DEFAULT_CACHE_MAX_BYTES = DEFAULT_CACHE_MAX_MB * 1024 * 1024
+UNITS_DIR = "units"
+TREES_DIR = "trees"
+
+_DIGEST_LENGTH = 64
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+@dataclass
+class TreeEntry:
+    units: Dict[str, str] = field(default_factory=dict)
+    conflicts: List[dict] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+class RenderCache:
+    def __init__(self, directory: Union[str, Path], max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("The render cache size must not be negative")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._root = self.directory / f"v{CACHE_LAYOUT_VERSION}"
+
+    def get_unit(self, key: str) -> Optional[bytes]:
+        return self._get(UNITS_DIR, key)
+
+    def put_unit(self, key: str, content: bytes) -> None:
+        self._put(UNITS_DIR, key, content)
+
+    def has_unit(self, key: str) -> bool:
+        return self._path(UNITS_DIR, key).is_file()
+
+    def get_tree(self, key: str) -> Optional[TreeEntry]:
+        content = self._get(TREES_DIR, key)
+        if content is None:
+            return None
+        data = json.loads(content)
+        return TreeEntry(units=data["units"], conflicts=data["conflicts"], warnings=data.get("warnings", []))
+
+    def put_tree(self, key: str, entry: TreeEntry) -> None:
+        content = json.dumps({"units": entry.units, "conflicts": entry.conflicts, "warnings": entry.warnings},
+                             sort_keys=True)
+        self._put(TREES_DIR, key, content.encode("utf-8"))
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> List[Path]:
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        evicted = []
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+            evicted.append(path)
+        return evicted
+
+    def _get(self, kind: str, key: str) -> Optional[bytes]:
+        path = self._path(kind, key)
+        try:
+            with open(path, "rb") as entry_file:
+                data = entry_file.read()
+        except FileNotFoundError:
+            return None
+
+        digest, content = data[:_DIGEST_LENGTH].decode("ascii", "replace"), data[_DIGEST_LENGTH + 1:]
+        if data[_DIGEST_LENGTH:_DIGEST_LENGTH + 1] != b"\n" or hash_bytes(content) != digest:
+            _remove(path)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def _put(self, kind: str, key: str, content: bytes) -> None:
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as entry_file:
+                entry_file.write(hash_bytes(content).encode("ascii") + b"\n" + content)
+            os.replace(temp_path, path)
+        finally:
+            _remove(temp_path)
+
+    def _path(self, kind: str, key: str) -> Path:
+        if not _is_key(key):
+            raise ValueError(f"Invalid render cache key: '{key}'")
+        return self._root / kind / key[:2] / key
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for kind in (UNITS_DIR, TREES_DIR):
+            for path in (self._root / kind).glob("*/*"):
+                if _is_key(path.name):
+                    try:
+                        entries.append((path, path.stat()))
+                    except FileNotFoundError:
+                        pass
+        return entries
+
+
+def tree_key(options: str, schemas: Dict[str, str]) -> str:
+    return hash_text(f"{options}\n{json.dumps(schemas, sort_keys=True)}")
+
+
+def _is_key(name: str) -> bool:
+    return len(name) == _DIGEST_LENGTH and _HEX_DIGITS.issuperset(name)
+
+
+def _remove(path: Union[str, Path]) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from src.class_generator import generate_java_class
+from src.enum_generator import generate_enum_class
+from src.java_model import CompactEnumClass, CompactJavaClass, EnumClass, JavaClass, is_enum_model
+from src.options import CLASS_STYLE_BEAN, EQUALS_STANDARD, LOOKUP_MAP
+from src.templates import DEFAULT_STYLE, TemplateStyle
+
+Model = Union[EnumClass, JavaClass, CompactEnumClass, CompactJavaClass]
+
+
+# Everything a render depends on travels in this immutable value, so concurrent calls with different options never
+# observe each other: the generators keep no module-level state besides caches keyed by these options.
+class RenderOptions(NamedTuple):
+    package: str
+    style: TemplateStyle = DEFAULT_STYLE
+    imports: Tuple[str, ...] = ()
+    enum_lookup: str = LOOKUP_MAP
+    equals_mode: str = EQUALS_STANDARD
+    class_style: str = CLASS_STYLE_BEAN
+
+
+def render_model(model: Model, options: RenderOptions) -> str:
+    if is_enum_model(model):
+        return generate_enum_class(model, options.package, options.enum_lookup, options.style)
+    return generate_java_class(model, options.package, list(options.imports), options.equals_mode,
+                               options.class_style, options.style)
+
+
+def render_models(models: Sequence[Model], options: RenderOptions, max_workers: Optional[int] = None) -> List[str]:
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("The number of rendering threads must be at least 1")
+    if len(models) < 2 or max_workers == 1:
+        return [render_model(model, options) for model in models]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(render_model, options=options), models))
@@ -0,0 +1,282 @@
+import json
+import os
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+
+from src.java_model import EnumClass, Field, JavaClass
+
+JSON_PRIMITIVE_TYPES = {
+    "string": "String",
+    "integer": "Integer",
+    "number": "Double",
+    "boolean": "Boolean"
+}
+RefKey = Tuple[str, str]
+ResolvedType = Tuple[str, Optional[str]]
+
+
+@dataclass
+class SchemaModels:
+    enums: List[EnumClass] = field(default_factory=list)
+    classes: List[JavaClass] = field(default_factory=list)
+    # (class name, field name) -> document defining the field's type, for fields typed from another document.
+    type_sources: Dict[Tuple[str, str], str] = field(default_factory=dict)
+
+
+def load_schema(path: Union[str, Path]) -> dict:
+    with open(path, encoding="utf-8") as schema_file:
+        return json.load(schema_file)
+
+
+def parse_schema_file(path: Union[str, Path]) -> SchemaModels:
+    return SchemaParser().parse_file(path)
+
+
+def parse_schema(schema: dict, root_name: str) -> SchemaModels:
+    return SchemaParser().parse_document(root_name, schema, root_name)
+
+
+def document_references(document: dict, uri: str) -> Set[str]:
+    references = set()
+    pending = [document]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not ref.startswith("#"):
+                references.add(_join_uri(uri, ref.partition("#")[0]))
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    references.discard(uri)
+    return references
+
+
+class SchemaParser:
+    def __init__(self, loader: Callable[[str], dict] = load_schema):
+        self._loader = loader
+        self._documents: Dict[str, dict] = {}
+        self._root_names: Dict[str, str] = {}
+        self._models: Dict[str, SchemaModels] = {}
+        self._parsed: Set[str] = set()
+        # Definitions parsed by parse_roots, kept apart from _parsed so a later parse_document still parses the rest.
+        self._parsed_roots: Dict[str, Set[str]] = {}
+        self._ref_types: Dict[RefKey, ResolvedType] = {}
+        self._in_progress: Set[RefKey] = set()
+        self._pending: Deque[Tuple[JavaClass, dict, str]] = deque()
+
+    def parse_file(self, path: Union[str, Path]) -> SchemaModels:
+        return self.parse_document(os.path.normpath(path), None, Path(path).stem)
+
+    def parse_document(self, uri: str, document: Optional[dict] = None, root_name: Optional[str] = None) -> SchemaModels:
+        if document is not None:
+            self._documents[uri] = document
+        if root_name is not None:
+            self._root_names.setdefault(uri, root_name)
+        document = self._document(uri)
+
+        if uri not in self._parsed:
+            self._parsed.add(uri)
+            for definition_name in document.get("definitions", {}):
+                self._resolve_pointer(uri, f"/definitions/{_escape_pointer_token(definition_name)}")
+            if "properties" in document:
+                self._resolve_pointer(uri, "")
+            self._parse_pending()
+
+        return self._document_models(uri)
+
+    def parse_roots(self, uri: str, roots: List[str], document: Optional[dict] = None,
+                    root_name: Optional[str] = None) -> SchemaModels:
+        # Only the named definitions and what they reference are parsed, so a lazily loaded bundle never decodes the
+        # definitions nobody asked for.
+        if document is not None:
+            self._documents[uri] = document
+        self._root_names.setdefault(uri, root_name or Path(uri).stem)
+        document = self._document(uri)
+        definitions = document.get("definitions", {})
+        missing = [root for root in roots if root not in definitions]
+        if missing:
+            raise ValueError(f"Unknown root definitions in '{uri}': {', '.join(missing)}")
+
+        parsed_roots = self._parsed_roots.setdefault(uri, set())
+        for root in roots:
+            if uri not in self._parsed and root not in parsed_roots:
+                parsed_roots.add(root)
+                self._resolve_pointer(uri, f"/definitions/{_escape_pointer_token(root)}")
+        self._parse_pending()
+        return self._document_models(uri)
+
+    def documents(self) -> List[str]:
+        return list(self._models)
+
+    def models(self, uri: str) -> SchemaModels:
+        return self._document_models(uri)
+
+    def _document(self, uri: str) -> dict:
+        if uri not in self._documents:
+            try:
+                self._documents[uri] = self._loader(uri)
+            except OSError as error:
+                raise ValueError(f"Cannot load referenced schema '{uri}': {error}") from error
+            self._root_names.setdefault(uri, Path(uri).stem)
+        if not isinstance(self._documents[uri], Mapping):
+            raise ValueError(f"Schema document is not an object: '{uri}'")
+        return self._documents[uri]
+
+    def _document_models(self, uri: str) -> SchemaModels:
+        return self._models.setdefault(uri, SchemaModels())
+
+    def _resolve_ref(self, ref: str, base_uri: str) -> ResolvedType:
+        if not isinstance(ref, str):
+            raise ValueError(f"Unsupported $ref in '{base_uri}': {ref!r}")
+        document_part, _, pointer = ref.partition("#")
+        uri = _join_uri(base_uri, document_part) if document_part else base_uri
+        return self._resolve_pointer(uri, unquote(pointer))
+
+    def _resolve_pointer(self, uri: str, pointer: str) -> ResolvedType:
+        key = (uri, pointer)
+        if key in self._ref_types:
+            return self._ref_types[key]
+        if key in self._in_progress:
+            raise ValueError(f"Circular $ref without a named type: '{uri}#{pointer}'")
+
+        schema = _follow_pointer(self._document(uri), uri, pointer)
+        self._in_progress.add(key)
+        try:
+            if isinstance(schema, bool):
+                java_type = self._ref_types[key] = ("Object", None)
+            elif "$ref" in schema:
+                java_type = self._resolve_ref(schema["$ref"], uri)
+                self._ref_types[key] = java_type
+            else:
+                java_type = self._parse_named_schema(key, schema)
+        finally:
+            self._in_progress.discard(key)
+        return java_type
+
+    def _parse_named_schema(self, key: RefKey, schema: dict) -> ResolvedType:
+        uri, pointer = key
+        if "enum" not in schema and _schema_type(schema, uri, "object") != "object" and "properties" not in schema:
+            java_type = self._resolve_type(self._pointer_name(uri, pointer), schema, uri)
+            self._ref_types[key] = java_type
+            return java_type
+
+        name = schema.get("javaType") or self._pointer_name(uri, pointer)
+        self._ref_types[key] = (name, uri)
+        self._parse_definition(name, schema, uri)
+        return name, uri
+
+    def _pointer_name(self, uri: str, pointer: str) -> str:
+        if not pointer:
+            return self._root_names[uri]
+        return _unescape_pointer_token(pointer.rsplit("/", 1)[-1])
+
+    def _parse_definition(self, name: str, definition: dict, uri: str) -> None:
+        models = self._document_models(uri)
+        if "enum" in definition:
+            models.enums.append(EnumClass(
+                name=name,
+                values=[str(value) for value in definition["enum"] if value is not None],
+                description=_description(definition)))
+            return
+
+        java_class = JavaClass(name=name, fields=[], description=_description(definition))
+        models.classes.append(java_class)
+        self._pending.append((java_class, definition, uri))
+
+    def _parse_pending(self) -> None:
+        while self._pending:
+            java_class, definition, uri = self._pending.popleft()
+            for property_name, property_schema in definition.get("properties", {}).items():
+                java_type, type_source = self._resolve_type(property_name, property_schema, uri)
+                if type_source is not None and type_source != uri:
+                    self._document_models(uri).type_sources[(java_class.name, property_name)] = type_source
+                java_class.fields.append(Field(
+                    name=property_name,
+                    type=java_type,
+                    description=_description(property_schema)))
+
+    def _resolve_type(self, property_name: str, schema: Union[dict, bool], uri: str) -> ResolvedType:
+        # Returns the Java type and the document defining the named type in it, so a type renamed to resolve a
+        # conflict can be renamed in the documents referencing it too.
+        if isinstance(schema, bool):
+            return "Object", None
+        if not isinstance(schema, Mapping):
+            raise ValueError(f"Unsupported schema for '{property_name}' in '{uri}': {schema!r}")
+        if "$ref" in schema:
+            return self._resolve_ref(schema["$ref"], uri)
+
+        schema_type = _schema_type(schema, uri)
+        if "enum" in schema or schema_type == "object":
+            nested_name = schema.get("javaType") or _capitalize(property_name)
+            self._parse_definition(nested_name, schema, uri)
+            return nested_name, uri
+
+        if schema_type == "array":
+            items = schema.get("items", {})
+            if isinstance(items, list):
+                raise ValueError(f"Unsupported tuple 'items' for '{property_name}' in '{uri}'")
+            item_type, item_source = self._resolve_type(property_name, items, uri)
+            return f"List<{item_type}>", item_source
+
+        return JSON_PRIMITIVE_TYPES.get(schema_type, "Object"), None
+
+
+def _schema_type(schema: Mapping, uri: str, default: Optional[str] = None) -> Optional[str]:
+    if "type" not in schema:
+        return default
+    schema_type = schema["type"]
+    if isinstance(schema_type, list):
+        # A nullable type such as ["string", "null"] maps to its non-null member; wider unions fall back to Object.
+        members = [member for member in schema_type if member != "null"]
+        schema_type = members[0] if len(members) == 1 else None
+    if schema_type is not None and not isinstance(schema_type, str):
+        raise ValueError(f"Unsupported schema type in '{uri}': {schema['type']!r}")
+    return schema_type
+
+
+def _join_uri(base_uri: str, document_part: str) -> str:
+    return os.path.normpath(os.path.join(os.path.dirname(base_uri), document_part))
+
+
+def _follow_pointer(document: dict, uri: str, pointer: str) -> Union[dict, bool]:
+    schema = document
+    if pointer:
+        if not pointer.startswith("/"):
+            raise ValueError(f"Unsupported $ref: '{uri}#{pointer}'")
+        for token in pointer[1:].split("/"):
+            token = _unescape_pointer_token(token)
+            if isinstance(schema, list) and token.isdigit() and int(token) < len(schema):
+                schema = schema[int(token)]
+            elif isinstance(schema, Mapping) and token in schema:
+                schema = schema[token]
+            else:
+                raise ValueError(f"Unresolved $ref: '{uri}#{pointer}'")
+    if not isinstance(schema, (Mapping, bool)):
+        raise ValueError(f"$ref does not point to a schema: '{uri}#{pointer}'")
+    return schema
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _description(schema: Union[dict, bool]) -> Optional[str]:
+    description = schema.get("description") if isinstance(schema, Mapping) else None
+    if description is None:
+        return None
+    if not isinstance(description, str):
+        raise ValueError(f"Schema description is not a string: {description!r}")
+    return " ".join(description.split())
+
+
+def _capitalize(name: str) -> str:
+    return name[:1].upper() + name[1:]
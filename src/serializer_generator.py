@@ -0,0 +1,443 @@
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from src.header_generator import package_declaration
+from src.instrumentation import stage
+from src.java_model import JAVA_PRIMITIVE_WRAPPERS, Field, JavaClass
+from src.naming import accessor_name, validate_java_identifier
+from src.options import CLASS_STYLE_BEAN, CLASS_STYLE_IMMUTABLE, CLASS_STYLE_RECORD, CLASS_STYLES
+from src.source_writer import iter_lines, write_chunks
+from src.templates import DEFAULT_STYLE, TemplateStyle
+
+CODEC_SUFFIX = "Codec"
+SCALAR_READERS = {
+    "String": "getText",
+    "Boolean": "getBooleanValue",
+    "Byte": "getByteValue",
+    "Short": "getShortValue",
+    "Integer": "getIntValue",
+    "Long": "getLongValue",
+    "Float": "getFloatValue",
+    "Double": "getDoubleValue"
+}
+PRIMITIVE_DEFAULTS = {"boolean": "false", "char": "'\\0'"}
+
+_METHOD_LOCALS = frozenset({"parser", "generator", "token", "fieldName", "result", "value"})
+
+
+def codec_name(class_name: str) -> str:
+    return f"{class_name}{CODEC_SUFFIX}"
+
+
+def generate_class_codec(java_class: JavaClass, package: str, enum_types: AbstractSet[str] = frozenset(),
+                         imports: Optional[List[str]] = None, class_style: str = CLASS_STYLE_BEAN,
+                         style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> str:
+    return "\n".join(_iter_codec_lines(java_class, package, enum_types, imports, class_style, style, validated))
+
+
+def iter_class_codec(java_class: JavaClass, package: str, enum_types: AbstractSet[str] = frozenset(),
+                     imports: Optional[List[str]] = None, class_style: str = CLASS_STYLE_BEAN,
+                     style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> Iterator[str]:
+    return iter_lines(_iter_codec_lines(java_class, package, enum_types, imports, class_style, style, validated))
+
+
+def write_class_codec(java_class: JavaClass, package: str, sink: TextIO, enum_types: AbstractSet[str] = frozenset(),
+                      imports: Optional[List[str]] = None, class_style: str = CLASS_STYLE_BEAN,
+                      style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> None:
+    write_chunks(iter_class_codec(java_class, package, enum_types, imports, class_style, style, validated), sink)
+
+
+def codec_imports(type_imports: List[str], enum_types: AbstractSet[str]) -> List[str]:
+    imports = list(type_imports)
+    for type_import in type_imports:
+        package, _, type_name = type_import.rpartition(".")
+        if type_name not in enum_types:
+            imports.append(f"{package}.{codec_name(type_name)}")
+    return sorted(imports)
+
+
+def _iter_codec_lines(java_class: JavaClass, package: str, enum_types: AbstractSet[str],
+                      imports: Optional[List[str]], class_style: str,
+                      style: TemplateStyle = DEFAULT_STYLE, validated: bool = False) -> Iterator[str]:
+    if class_style not in CLASS_STYLES:
+        raise ValueError(f"Unknown class style: '{class_style}'")
+    if not validated:
+        with stage("naming"):
+            for field in java_class.fields:
+                validate_java_identifier(field.name)
+
+    codec = _CodecBuilder(enum_types, style)
+    read_method = codec.read_method(java_class, class_style)
+    write_method = codec.write_method(java_class, class_style)
+
+    yield package_declaration(package, validated)
+    yield ""
+    yield from (f"import {type_import};" for type_import in imports or [])
+    yield "import java.io.IOException;"
+    if codec.uses_lists:
+        yield "import java.util.ArrayList;"
+        yield "import java.util.List;"
+    if codec.uses_untyped:
+        yield "import java.util.LinkedHashMap;"
+        yield "import java.util.Map;"
+    yield ""
+    if codec.uses_untyped:
+        yield "import com.fasterxml.jackson.core.JsonGenerationException;"
+    yield "import com.fasterxml.jackson.core.JsonGenerator;"
+    yield "import com.fasterxml.jackson.core.JsonParseException;"
+    yield "import com.fasterxml.jackson.core.JsonParser;"
+    yield "import com.fasterxml.jackson.core.JsonToken;"
+    yield ""
+    yield ""
+    yield f"public final class {codec_name(java_class.name)} {{"
+    yield ""
+    yield f"{style.indent_lvl1}private {codec_name(java_class.name)}() {{"
+    yield f"{style.indent_lvl1}}}"
+    yield ""
+    yield from read_method
+    yield ""
+    yield from write_method
+    for helper in codec.helpers.values():
+        yield ""
+        yield from helper
+    yield "}"
+    yield ""
+
+
+class _CodecBuilder:
+    def __init__(self, enum_types: AbstractSet[str], style: TemplateStyle = DEFAULT_STYLE):
+        self.enum_types = enum_types
+        self.style = style
+        self.helpers: Dict[str, List[str]] = {}
+        self.uses_lists = False
+        self.uses_untyped = False
+
+    def read_method(self, java_class: JavaClass, class_style: str) -> List[str]:
+        style = self.style
+        indent_lvl4, indent_lvl5 = _deep_indents(style)
+        class_name = java_class.name
+        body = [
+            f"{style.indent_lvl1}public static {class_name} read(JsonParser parser) throws IOException {{",
+            f"{style.indent_lvl2}JsonToken token = parser.currentToken();",
+            f"{style.indent_lvl2}if (token == null) {{",
+            f"{style.indent_lvl3}token = parser.nextToken();",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}if (token == JsonToken.VALUE_NULL) {{",
+            f"{style.indent_lvl3}return null;",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}if (token != JsonToken.START_OBJECT) {{",
+            f'{style.indent_lvl3}throw new JsonParseException(parser, "Expected an object for {class_name}");',
+            f"{style.indent_lvl2}}}"
+        ]
+        for field in java_class.fields:
+            default = PRIMITIVE_DEFAULTS.get(field.type, "0") if field.type in JAVA_PRIMITIVE_WRAPPERS else "null"
+            body.append(f"{style.indent_lvl2}{field.type} {_local_name(field)} = {default};")
+        body.extend([
+            f"{style.indent_lvl2}while (parser.nextToken() == JsonToken.FIELD_NAME) {{",
+            f"{style.indent_lvl3}String fieldName = parser.currentName();",
+            f"{style.indent_lvl3}parser.nextToken();",
+            f"{style.indent_lvl3}switch (fieldName) {{"
+        ])
+        for field in java_class.fields:
+            body.append(f'{indent_lvl4}case "{field.name}":')
+            read = f"{_local_name(field)} = {self.read_expression(field.type)};"
+            if field.type in JAVA_PRIMITIVE_WRAPPERS:
+                # A JSON null keeps the primitive default instead of unboxing null.
+                body.extend([
+                    f"{indent_lvl5}if (parser.currentToken() != JsonToken.VALUE_NULL) {{",
+                    f"{indent_lvl5}{style.indent_lvl1}{read}",
+                    f"{indent_lvl5}}}"
+                ])
+            else:
+                body.append(f"{indent_lvl5}{read}")
+            body.append(f"{indent_lvl5}break;")
+        body.extend([
+            f"{indent_lvl4}default:",
+            f"{indent_lvl5}parser.skipChildren();",
+            f"{style.indent_lvl3}}}",
+            f"{style.indent_lvl2}}}",
+            *_construct_statements(java_class, class_style, style),
+            f"{style.indent_lvl1}}}"
+        ])
+        return body
+
+    def write_method(self, java_class: JavaClass, class_style: str) -> List[str]:
+        style = self.style
+        body = [
+            f"{style.indent_lvl1}public static void write(JsonGenerator generator, {java_class.name} value) "
+            f"throws IOException {{",
+            f"{style.indent_lvl2}if (value == null) {{",
+            f"{style.indent_lvl3}generator.writeNull();",
+            f"{style.indent_lvl3}return;",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}generator.writeStartObject();"
+        ]
+        for field in java_class.fields:
+            local_name = _local_name(field)
+            body.append(f"{style.indent_lvl2}{field.type} {local_name} = value.{_accessor(field, class_style)}();")
+            if field.type in JAVA_PRIMITIVE_WRAPPERS:
+                body.append(f'{style.indent_lvl2}generator.writeFieldName("{field.name}");')
+                body.append(f"{style.indent_lvl2}{self.write_statement(field.type, local_name)}")
+            else:
+                body.extend([
+                    f"{style.indent_lvl2}if ({local_name} != null) {{",
+                    f'{style.indent_lvl3}generator.writeFieldName("{field.name}");',
+                    f"{style.indent_lvl3}{self.write_statement(field.type, local_name)}",
+                    f"{style.indent_lvl2}}}"
+                ])
+        body.extend([
+            f"{style.indent_lvl2}generator.writeEndObject();",
+            f"{style.indent_lvl1}}}"
+        ])
+        return body
+
+    def read_expression(self, java_type: str) -> str:
+        element_type = _list_element_type(java_type)
+        if element_type is not None:
+            return f"{self._list_helpers(java_type, element_type)[0]}(parser)"
+        scalar_type = JAVA_PRIMITIVE_WRAPPERS.get(java_type, java_type)
+        if scalar_type in SCALAR_READERS:
+            return f"{self._scalar_reader(scalar_type)}(parser)"
+        if scalar_type == "Character":
+            return f"{self._character_reader()}(parser)"
+        if java_type in self.enum_types:
+            return f"{self._enum_reader(java_type)}(parser)"
+        if java_type == "Object" or "<" in java_type:
+            return f"{self._untyped_helpers()[0]}(parser)"
+        return f"{codec_name(java_type)}.read(parser)"
+
+    def write_statement(self, java_type: str, value: str) -> str:
+        element_type = _list_element_type(java_type)
+        if element_type is not None:
+            return f"{self._list_helpers(java_type, element_type)[1]}(generator, {value});"
+        scalar_type = JAVA_PRIMITIVE_WRAPPERS.get(java_type, java_type)
+        if scalar_type == "String":
+            return f"generator.writeString({value});"
+        if scalar_type == "Boolean":
+            return f"generator.writeBoolean({value});"
+        if scalar_type == "Character":
+            return f"generator.writeString(String.valueOf({value}));"
+        if scalar_type in SCALAR_READERS:
+            return f"generator.writeNumber({value});"
+        if java_type in self.enum_types:
+            return f"generator.writeString({value}.value());"
+        if java_type == "Object" or "<" in java_type:
+            return f"{self._untyped_helpers()[1]}(generator, {value});"
+        return f"{codec_name(java_type)}.write(generator, {value});"
+
+    def _scalar_reader(self, scalar_type: str) -> str:
+        method_name = f"read{scalar_type}"
+        if method_name not in self.helpers:
+            expression = f"parser.{SCALAR_READERS[scalar_type]}()"
+            self.helpers[method_name] = _nullable_reader(method_name, scalar_type, expression, self.style)
+        return method_name
+
+    def _character_reader(self) -> str:
+        if "readCharacter" not in self.helpers:
+            style = self.style
+            self.helpers["readCharacter"] = [
+                f"{style.indent_lvl1}private static Character readCharacter(JsonParser parser) throws IOException {{",
+                f"{style.indent_lvl2}if (parser.currentToken() == JsonToken.VALUE_NULL) {{",
+                f"{style.indent_lvl3}return null;",
+                f"{style.indent_lvl2}}}",
+                f"{style.indent_lvl2}String text = parser.getText();",
+                f"{style.indent_lvl2}if (text.length() != 1) {{",
+                f'{style.indent_lvl3}throw new JsonParseException(parser, "Expected a single character");',
+                f"{style.indent_lvl2}}}",
+                f"{style.indent_lvl2}return text.charAt(0);",
+                f"{style.indent_lvl1}}}"
+            ]
+        return "readCharacter"
+
+    def _enum_reader(self, enum_type: str) -> str:
+        method_name = f"read{enum_type}"
+        if method_name not in self.helpers:
+            expression = f"{enum_type}.fromValue(parser.getText())"
+            self.helpers[method_name] = _nullable_reader(method_name, enum_type, expression, self.style)
+        return method_name
+
+    def _list_helpers(self, java_type: str, element_type: str) -> List[str]:
+        suffix = _helper_suffix(java_type)
+        read_name = f"read{suffix}"
+        write_name = f"write{suffix}"
+        if read_name in self.helpers:
+            return [read_name, write_name]
+
+        self.uses_lists = True
+        self.helpers[read_name] = []
+        self.helpers[write_name] = []
+        element_read = self.read_expression(element_type)
+        element_write = self.write_statement(element_type, "element")
+        style = self.style
+        indent_lvl4, _ = _deep_indents(style)
+        self.helpers[read_name] = [
+            f"{style.indent_lvl1}private static {java_type} {read_name}(JsonParser parser) throws IOException {{",
+            f"{style.indent_lvl2}if (parser.currentToken() == JsonToken.VALUE_NULL) {{",
+            f"{style.indent_lvl3}return null;",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}{java_type} values = new ArrayList<>();",
+            f"{style.indent_lvl2}while (parser.nextToken() != JsonToken.END_ARRAY) {{",
+            f"{style.indent_lvl3}values.add({element_read});",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}return values;",
+            f"{style.indent_lvl1}}}"
+        ]
+        self.helpers[write_name] = [
+            f"{style.indent_lvl1}private static void {write_name}(JsonGenerator generator, {java_type} values) "
+            f"throws IOException {{",
+            f"{style.indent_lvl2}generator.writeStartArray();",
+            f"{style.indent_lvl2}for ({element_type} element : values) {{",
+            f"{style.indent_lvl3}if (element == null) {{",
+            f"{indent_lvl4}generator.writeNull();",
+            f"{style.indent_lvl3}}} else {{",
+            f"{indent_lvl4}{element_write}",
+            f"{style.indent_lvl3}}}",
+            f"{style.indent_lvl2}}}",
+            f"{style.indent_lvl2}generator.writeEndArray();",
+            f"{style.indent_lvl1}}}"
+        ]
+        return [read_name, write_name]
+
+    def _untyped_helpers(self) -> List[str]:
+        if "readUntyped" not in self.helpers:
+            self.uses_lists = True
+            self.uses_untyped = True
+            self.helpers["readUntyped"] = list(_untyped_reader(self.style))
+            self.helpers["writeUntyped"] = list(_untyped_writer(self.style))
+        return ["readUntyped", "writeUntyped"]
+
+
+def _construct_statements(java_class: JavaClass, class_style: str, style: TemplateStyle) -> List[str]:
+    class_name = java_class.name
+    local_names = [_local_name(field) for field in java_class.fields]
+    if class_style == CLASS_STYLE_RECORD:
+        if not local_names:
+            return [f"{style.indent_lvl2}return new {class_name}();"]
+        return [
+            f"{style.indent_lvl2}return new {class_name}(",
+            *(f"{style.indent_lvl2}{style.return_indent}{local_name}," for local_name in local_names[:-1]),
+            f"{style.indent_lvl2}{style.return_indent}{local_names[-1]});"
+        ]
+    if class_style == CLASS_STYLE_IMMUTABLE:
+        return [
+            f"{style.indent_lvl2}return {class_name}.builder()",
+            *(f"{style.indent_lvl2}{style.return_indent}.{field.name}({local_name})"
+              for field, local_name in zip(java_class.fields, local_names)),
+            f"{style.indent_lvl2}{style.return_indent}.build();"
+        ]
+    return [
+        f"{style.indent_lvl2}{class_name} result = new {class_name}();",
+        *(f"{style.indent_lvl2}result.{accessor_name('set', field.name)}({local_name});"
+          for field, local_name in zip(java_class.fields, local_names)),
+        f"{style.indent_lvl2}return result;"
+    ]
+
+
+def _nullable_reader(method_name: str, java_type: str, expression: str, style: TemplateStyle) -> List[str]:
+    body = [
+        f"{style.indent_lvl1}private static {java_type} {method_name}(JsonParser parser) throws IOException {{",
+        f"{style.indent_lvl2}if (parser.currentToken() == JsonToken.VALUE_NULL) {{",
+        f"{style.indent_lvl3}return null;",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl2}return {expression};",
+        f"{style.indent_lvl1}}}"
+    ]
+    return body
+
+
+def _accessor(field: Field, class_style: str) -> str:
+    if class_style == CLASS_STYLE_RECORD:
+        return field.name
+    return accessor_name("get", field.name)
+
+
+def _local_name(field: Field) -> str:
+    if field.name in _METHOD_LOCALS:
+        return f"{field.name}_"
+    return field.name
+
+
+def _list_element_type(java_type: str) -> Optional[str]:
+    if java_type.startswith("List<") and java_type.endswith(">"):
+        return java_type[len("List<"):-1].strip()
+    return None
+
+
+def _helper_suffix(java_type: str) -> str:
+    return java_type.replace("List<", "ListOf").replace(">", "").replace(",", "").replace(" ", "")
+
+
+def _deep_indents(style: TemplateStyle) -> Tuple[str, str]:
+    indent_lvl4 = style.indent_lvl3 + style.indent_lvl1
+    return indent_lvl4, indent_lvl4 + style.indent_lvl1
+
+
+@lru_cache(maxsize=None)
+def _untyped_reader(style: TemplateStyle) -> Tuple[str, ...]:
+    indent_lvl4, indent_lvl5 = _deep_indents(style)
+    return (
+        f"{style.indent_lvl1}private static Object readUntyped(JsonParser parser) throws IOException {{",
+        f"{style.indent_lvl2}switch (parser.currentToken()) {{",
+        f"{style.indent_lvl3}case START_OBJECT:",
+        f"{indent_lvl4}Map<String, Object> object = new LinkedHashMap<>();",
+        f"{indent_lvl4}while (parser.nextToken() == JsonToken.FIELD_NAME) {{",
+        f"{indent_lvl5}String fieldName = parser.currentName();",
+        f"{indent_lvl5}parser.nextToken();",
+        f"{indent_lvl5}object.put(fieldName, readUntyped(parser));",
+        f"{indent_lvl4}}}",
+        f"{indent_lvl4}return object;",
+        f"{style.indent_lvl3}case START_ARRAY:",
+        f"{indent_lvl4}List<Object> array = new ArrayList<>();",
+        f"{indent_lvl4}while (parser.nextToken() != JsonToken.END_ARRAY) {{",
+        f"{indent_lvl5}array.add(readUntyped(parser));",
+        f"{indent_lvl4}}}",
+        f"{indent_lvl4}return array;",
+        f"{style.indent_lvl3}case VALUE_STRING:",
+        f"{indent_lvl4}return parser.getText();",
+        f"{style.indent_lvl3}case VALUE_NUMBER_INT:",
+        f"{style.indent_lvl3}case VALUE_NUMBER_FLOAT:",
+        f"{indent_lvl4}return parser.getNumberValue();",
+        f"{style.indent_lvl3}case VALUE_TRUE:",
+        f"{indent_lvl4}return Boolean.TRUE;",
+        f"{style.indent_lvl3}case VALUE_FALSE:",
+        f"{indent_lvl4}return Boolean.FALSE;",
+        f"{style.indent_lvl3}default:",
+        f"{indent_lvl4}return null;",
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _untyped_writer(style: TemplateStyle) -> Tuple[str, ...]:
+    indent_lvl4, _ = _deep_indents(style)
+    return (
+        f"{style.indent_lvl1}private static void writeUntyped(JsonGenerator generator, Object value) "
+        f"throws IOException {{",
+        f"{style.indent_lvl2}if (value == null) {{",
+        f"{style.indent_lvl3}generator.writeNull();",
+        f"{style.indent_lvl2}}} else if (value instanceof String) {{",
+        f"{style.indent_lvl3}generator.writeString((String) value);",
+        f"{style.indent_lvl2}}} else if (value instanceof Number) {{",
+        f"{style.indent_lvl3}generator.writeNumber(value.toString());",
+        f"{style.indent_lvl2}}} else if (value instanceof Boolean) {{",
+        f"{style.indent_lvl3}generator.writeBoolean((Boolean) value);",
+        f"{style.indent_lvl2}}} else if (value instanceof Map) {{",
+        f"{style.indent_lvl3}generator.writeStartObject();",
+        f"{style.indent_lvl3}for (Map.Entry<?, ?> entry : ((Map<?, ?>) value).entrySet()) {{",
+        f"{indent_lvl4}generator.writeFieldName(String.valueOf(entry.getKey()));",
+        f"{indent_lvl4}writeUntyped(generator, entry.getValue());",
+        f"{style.indent_lvl3}}}",
+        f"{style.indent_lvl3}generator.writeEndObject();",
+        f"{style.indent_lvl2}}} else if (value instanceof Iterable) {{",
+        f"{style.indent_lvl3}generator.writeStartArray();",
+        f"{style.indent_lvl3}for (Object element : (Iterable<?>) value) {{",
+        f"{indent_lvl4}writeUntyped(generator, element);",
+        f"{style.indent_lvl3}}}",
+        f"{style.indent_lvl3}generator.writeEndArray();",
+        f"{style.indent_lvl2}}} else {{",
+        f'{style.indent_lvl3}throw new JsonGenerationException("Cannot write " + value.getClass().getName(), '
+        f'generator);',
+        f"{style.indent_lvl2}}}",
+        f"{style.indent_lvl1}}}"
+    )
@@ -0,0 +1,47 @@
+import hashlib
+from typing import BinaryIO, Iterable, Iterator, List, TextIO
+
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def iter_lines(lines: Iterable[str], separator: str = "\n") -> Iterator[str]:
+    lines = iter(lines)
+    for first_line in lines:
+        yield first_line
+        break
+    for line in lines:
+        yield separator + line
+
+
+def write_chunks(chunks: Iterable[str], sink: TextIO) -> None:
+    sink.writelines(chunks)
+
+
+class HashingWriter:
+    def __init__(self, binary_file: BinaryIO, encoding: str = "utf-8"):
+        self._file = binary_file
+        self._encoding = encoding
+        self._hash = hashlib.sha256()
+        self._buffer: List[str] = []
+        self._buffered = 0
+
+    def write(self, text: str) -> int:
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= WRITE_BUFFER_SIZE:
+            self.flush()
+        return len(text)
+
+    def writelines(self, chunks: Iterable[str]) -> None:
+        for chunk in chunks:
+            self.write(chunk)
+
+    def flush(self) -> None:
+        data = "".join(self._buffer).encode(self._encoding)
+        self._hash.update(data)
+        self._file.write(data)
+        self._buffer = []
+        self._buffered = 0
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
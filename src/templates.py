@@ -0,0 +1,51 @@
+from typing import NamedTuple, Optional, Tuple
+
+from src.java_model import indent_lvl1, indent_lvl2, indent_lvl3, return_indent
+
+_SLOT_DELIMITER = "\x00"
+
+
+class TemplateStyle(NamedTuple):
+    indent_lvl1: str = indent_lvl1
+    indent_lvl2: str = indent_lvl2
+    indent_lvl3: str = indent_lvl3
+    return_indent: str = return_indent
+
+
+DEFAULT_STYLE = TemplateStyle()
+
+
+def indent_style(indent: str) -> TemplateStyle:
+    return TemplateStyle(indent, indent * 2, indent * 3, indent * 2)
+
+
+class CompiledTemplate:
+    __slots__ = ("parts", "slots", "_single_slot")
+
+    def __init__(self, parts: Tuple[str, ...], slots: Tuple[str, ...]):
+        self.parts = parts
+        self.slots = slots
+        self._single_slot: Optional[str] = slots[0] if slots and len(set(slots)) == 1 else None
+
+    def render(self, **values: str) -> str:
+        if self._single_slot is not None:
+            return values[self._single_slot].join(self.parts)
+        if not self.slots:
+            return self.parts[0]
+
+        chunks = [self.parts[0]]
+        for slot_name, part in zip(self.slots, self.parts[1:]):
+            chunks.append(values[slot_name])
+            chunks.append(part)
+        return "".join(chunks)
+
+
+def slot(name: str) -> str:
+    return f"{_SLOT_DELIMITER}{name}{_SLOT_DELIMITER}"
+
+
+def compile_template(text: str) -> CompiledTemplate:
+    pieces = text.split(_SLOT_DELIMITER)
+    if len(pieces) % 2 == 0:
+        raise ValueError("Unterminated template slot")
+    return CompiledTemplate(tuple(pieces[0::2]), tuple(pieces[1::2]))
@@ -0,0 +1,157 @@
+import hashlib
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import PurePosixPath
+from typing import Dict, List, Pattern, Set, Tuple, Union
+
+from src.java_model import CompactEnumClass, CompactJavaClass, EnumClass, JavaClass, is_enum_model
+from src.options import ON_CONFLICT_ERROR, ON_CONFLICT_RENAME
+from src.schema_parser import SchemaModels
+
+MAX_RESOLUTION_PASSES = 10
+
+_TYPE_IDENTIFIER = r"[A-Za-z_$][A-Za-z0-9_$]*"
+
+Model = Union[EnumClass, JavaClass, CompactEnumClass, CompactJavaClass]
+
+
+@dataclass
+class RegisteredType:
+    name: str
+    model: Model
+    fingerprint: str
+    sources: List[str] = field(default_factory=list)
+
+    @property
+    def is_enum(self) -> bool:
+        return is_enum_model(self.model)
+
+
+@dataclass
+class TypeConflict:
+    name: str
+    sources: List[str]
+    renamed: Dict[str, str]
+
+    def __str__(self) -> str:
+        if not self.renamed:
+            return f"'{self.name}' has conflicting definitions in {', '.join(self.sources)}"
+        renamed = ", ".join(f"'{new_name}' in {source}" for source, new_name in self.renamed.items())
+        return f"'{self.name}' has conflicting definitions in {', '.join(self.sources)}; renamed to {renamed}"
+
+
+def fingerprint(model: Model) -> str:
+    if is_enum_model(model):
+        structure = ["enum", model.name, *model.values]
+    else:
+        structure = ["class", model.name]
+        for model_field in model.fields:
+            structure.extend((model_field.name, model_field.type))
+    return hashlib.sha256("\0".join(structure).encode("utf-8")).hexdigest()
+
+
+def referenced_type_names(java_type: str) -> List[str]:
+    return _type_identifier_pattern().findall(java_type)
+
+
+def rename_types(java_type: str, renames: Dict[str, str]) -> str:
+    if not renames:
+        return java_type
+    return _type_identifier_pattern().sub(lambda match: renames.get(match.group(0), match.group(0)), java_type)
+
+
+class TypeRegistry:
+    def __init__(self, on_conflict: str = ON_CONFLICT_RENAME):
+        if on_conflict not in (ON_CONFLICT_RENAME, ON_CONFLICT_ERROR):
+            raise ValueError(f"Unknown conflict policy: '{on_conflict}'")
+        self.on_conflict = on_conflict
+        self.types: List[RegisteredType] = []
+        self.conflicts: List[TypeConflict] = []
+
+    def resolve(self, documents: List[Tuple[str, SchemaModels]]) -> List[RegisteredType]:
+        renames: Dict[str, Dict[str, str]] = {}
+        for _ in range(MAX_RESOLUTION_PASSES):
+            types, conflicts, new_renames = self._resolve_pass(documents, renames)
+            if new_renames == renames:
+                break
+            renames = new_renames
+
+        if conflicts and self.on_conflict == ON_CONFLICT_ERROR:
+            raise ValueError("Conflicting type definitions:\n" + "\n".join(str(conflict) for conflict in conflicts))
+
+        self.types = types
+        self.conflicts = conflicts
+        return types
+
+    def _resolve_pass(self, documents: List[Tuple[str, SchemaModels]], renames: Dict[str, Dict[str, str]]) \
+            -> Tuple[List[RegisteredType], List[TypeConflict], Dict[str, Dict[str, str]]]:
+        by_name: Dict[str, Dict[str, RegisteredType]] = {}
+        conflicts: Dict[str, TypeConflict] = {}
+        new_renames: Dict[str, Dict[str, str]] = {}
+        types: List[RegisteredType] = []
+        taken: Set[str] = {model.name for _, models in documents for model in [*models.enums, *models.classes]}
+
+        for source, models in documents:
+            for model in [*models.enums, *models.classes]:
+                model = _rename_field_types(model, source, models.type_sources, renames)
+                model_fingerprint = fingerprint(model)
+                variants = by_name.setdefault(model.name, {})
+
+                registered = variants.get(model_fingerprint)
+                if registered is None:
+                    name = model.name
+                    if variants:
+                        name = _disambiguate(model.name, source, taken)
+                        conflict = conflicts.setdefault(model.name, TypeConflict(
+                            model.name, list(next(iter(variants.values())).sources), {}))
+                        conflict.sources.append(source)
+                        conflict.renamed[source] = name
+                        if self.on_conflict == ON_CONFLICT_ERROR:
+                            name = model.name
+                    registered = RegisteredType(name, _replace(model, name=name), model_fingerprint)
+                    variants[model_fingerprint] = registered
+                    types.append(registered)
+
+                if registered.name != model.name:
+                    new_renames.setdefault(source, {})[model.name] = registered.name
+                if source not in registered.sources:
+                    registered.sources.append(source)
+
+        if self.on_conflict == ON_CONFLICT_ERROR:
+            for conflict in conflicts.values():
+                conflict.renamed = {}
+        return types, list(conflicts.values()), new_renames
+
+
+def _rename_field_types(model: Model, source: str, type_sources: Dict[Tuple[str, str], str],
+                        renames: Dict[str, Dict[str, str]]) -> Model:
+    # Renames belong to the document defining the renamed type, which for a cross-document $ref is not the source.
+    if not renames or is_enum_model(model):
+        return model
+    fields = [_replace(model_field, type=rename_types(
+        model_field.type, renames.get(type_sources.get((model.name, model_field.name), source), {})))
+        for model_field in model.fields]
+    return _replace(model, fields=tuple(fields) if isinstance(model, tuple) else fields)
+
+
+def _replace(model, **changes):
+    if isinstance(model, tuple):
+        return model._replace(**changes)
+    return replace(model, **changes)
+
+
+def _disambiguate(name: str, source: str, taken: Set[str]) -> str:
+    stem = re.sub(r"[^A-Za-z0-9_]", "", PurePosixPath(source).stem)
+    candidate = f"{stem}{name}"
+    suffix = 2
+    while candidate in taken:
+        candidate = f"{stem}{name}{suffix}"
+        suffix += 1
+    taken.add(candidate)
+    return candidate
+
+
+@lru_cache(maxsize=None)
+def _type_identifier_pattern() -> Pattern[str]:
+    return re.compile(_TYPE_IDENTIFIER)
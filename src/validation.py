@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Set, Union
+
+from src.header_generator import set_package
+from src.java_model import CompactEnumClass, CompactJavaClass, EnumClass, JavaClass, is_enum_model
+from src.naming import build_getter_name, build_setter_name, java_constant_owners, validate_java_identifier
+from src.options import CLASS_STYLE_BEAN, CLASS_STYLE_IMMUTABLE, CLASS_STYLE_RECORD
+
+Model = Union[EnumClass, JavaClass, CompactEnumClass, CompactJavaClass]
+
+
+class ValidationIssue(NamedTuple):
+    subject: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.subject}: {self.message}"
+
+
+# Built once per schema set before rendering, so that every naming conflict is reported together and the generators
+# only see names that were already checked.
+@dataclass
+class ModelIndex:
+    packages: Set[str] = field(default_factory=set)
+    classes: Dict[str, List[str]] = field(default_factory=dict)
+    accessors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    constants: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # Java constant name of every value, in value order, for the enums whose constants are all valid.
+    constant_names: Dict[str, List[str]] = field(default_factory=dict)
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+    def add_type(self, package: str, name: str) -> str:
+        qualified_name = f"{package}.{name}"
+        if package not in self.packages:
+            self.packages.add(package)
+            self._check(package, set_package, package)
+        if self._check(qualified_name, validate_java_identifier, name):
+            self.classes.setdefault(name, []).append(qualified_name)
+        return qualified_name
+
+    def add_model(self, package: str, model: Model, class_style: str = CLASS_STYLE_BEAN) -> str:
+        qualified_name = self.add_type(package, model.name)
+        if is_enum_model(model):
+            self._add_constants(qualified_name, model.values)
+        else:
+            self._add_accessors(qualified_name, [model_field.name for model_field in model.fields], class_style)
+        return qualified_name
+
+    def conflicts(self) -> List[ValidationIssue]:
+        duplicates = [ValidationIssue(name, f"class is defined more than once: {', '.join(qualified_names)}")
+                      for name, qualified_names in self.classes.items() if len(qualified_names) > 1]
+        return self.issues + duplicates
+
+    def _add_constants(self, qualified_name: str, values: List[str]) -> None:
+        constants = self.constants.setdefault(qualified_name, {})
+        valid = True
+        for name, owners in java_constant_owners(values).items():
+            if len(owners) > 1:
+                self._issue(qualified_name, f"enum values {_quoted(owners)} all map to the constant '{name}'")
+                valid = False
+            elif self._check(qualified_name, validate_java_identifier, name):
+                constants[name] = owners[0]
+            else:
+                valid = False
+        if valid:
+            names_by_value = {value: name for name, value in constants.items()}
+            self.constant_names[qualified_name] = [names_by_value[value] for value in values]
+
+    def _add_accessors(self, qualified_name: str, field_names: List[str], class_style: str) -> None:
+        accessors = self.accessors.setdefault(qualified_name, {})
+        seen = set()
+        for field_name in field_names:
+            if field_name in seen:
+                self._issue(qualified_name, f"field '{field_name}' is defined more than once")
+                continue
+            seen.add(field_name)
+            if not self._check(qualified_name, validate_java_identifier, field_name):
+                continue
+            for name in _accessor_names(field_name, class_style):
+                owner = accessors.setdefault(name, field_name)
+                if owner != field_name:
+                    self._issue(qualified_name, f"fields '{owner}' and '{field_name}' both generate '{name}'")
+
+    def _check(self, subject: str, check, name: str) -> bool:
+        try:
+            check(name)
+        except ValueError as error:
+            self._issue(subject, str(error))
+            return False
+        return True
+
+    def _issue(self, subject: str, message: str) -> None:
+        self.issues.append(ValidationIssue(subject, message))
+
+
+def _accessor_names(field_name: str, class_style: str) -> List[str]:
+    if class_style == CLASS_STYLE_RECORD:
+        return [field_name]
+    if class_style == CLASS_STYLE_IMMUTABLE:
+        return [build_getter_name(field_name)]
+    return [build_getter_name(field_name), build_setter_name(field_name)]
+
+
+def _quoted(values: List[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
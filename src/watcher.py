@@ -0,0 +1,340 @@
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.compiler import CompileResult, finish_build, plan_models, record_job_result, render_unit, select_jobs, \
+    validate_packages
+from src.manifest import MANIFEST_NAME, Manifest, hash_bytes, hash_options, load_manifest
+from src.options import CLASS_STYLE_BEAN, EQUALS_STANDARD, LOOKUP_MAP, ON_CONFLICT_RENAME
+from src.output_writer import write_if_changed
+from src.schema_parser import SchemaModels, SchemaParser, document_references, load_schema
+
+DEFAULT_POLL_INTERVAL = 0.25
+DEBOUNCE_SECONDS = 0.05
+SCHEMA_SUFFIX = ".json"
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_IN_EVENT_HEADER = struct.Struct("iIII")
+_IN_READ_SIZE = 64 * 1024
+
+
+@dataclass
+class WatchUpdate:
+    result: CompileResult
+    changed: List[str] = field(default_factory=list)
+    affected: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+class WatchSession:
+    def __init__(self, schema_dir: Union[str, Path], output_dir: Union[str, Path], package: str,
+                 shared_package: Optional[str] = None, on_conflict: str = ON_CONFLICT_RENAME,
+                 enum_lookup: str = LOOKUP_MAP, enum_benchmarks: bool = False, equals_mode: str = EQUALS_STANDARD,
+                 class_style: str = CLASS_STYLE_BEAN, codecs: bool = False):
+        validate_packages(package, shared_package)
+        self.schema_dir = Path(os.path.normpath(schema_dir))
+        self.output_dir = Path(output_dir)
+        self._plan_options = (package, shared_package, on_conflict, enum_lookup, enum_benchmarks, equals_mode,
+                              class_style, codecs)
+        self._options = hash_options(package, shared_package=shared_package, on_conflict=on_conflict,
+                                     enum_lookup=enum_lookup, enum_benchmarks=enum_benchmarks,
+                                     equals_mode=equals_mode, class_style=class_style, codecs=codecs)
+        self._documents: Dict[str, Tuple[str, dict]] = {}
+        self._references: Dict[str, Set[str]] = {}
+        self._models: Dict[str, SchemaModels] = {}
+        self._parse_failed = False
+        self._manifest = Manifest()
+
+    def build(self) -> WatchUpdate:
+        if not self.schema_dir.is_dir():
+            raise ValueError(f"Schema directory does not exist: '{self.schema_dir}'")
+        start = time.perf_counter()
+        self._documents.clear()
+        self._references.clear()
+        self._models.clear()
+        self._parse_failed = False
+        self._manifest = load_manifest(self.output_dir / MANIFEST_NAME)
+        changed, errors = self._reload(iter_schema_paths(self.schema_dir))
+        return WatchUpdate(self._regenerate(), changed, changed, errors, time.perf_counter() - start)
+
+    def update(self, paths: Iterable[Union[str, Path]]) -> WatchUpdate:
+        start = time.perf_counter()
+        changed, errors = self._reload(paths)
+        if not changed:
+            return WatchUpdate(CompileResult(), errors=errors, seconds=time.perf_counter() - start)
+        affected = self.dependents(changed)
+        try:
+            # After a failed parse the kept models are stale, so everything is parsed again until a parse succeeds.
+            result = self._regenerate(None if self._parse_failed else affected)
+        except ValueError as error:
+            self._parse_failed = True
+            errors.append(str(error))
+            return WatchUpdate(CompileResult(), changed, affected, errors, time.perf_counter() - start)
+        self._parse_failed = False
+        return WatchUpdate(result, changed, affected, errors, time.perf_counter() - start)
+
+    def dependents(self, sources: Iterable[str]) -> List[str]:
+        referenced_by: Dict[str, Set[str]] = {}
+        for uri, references in self._references.items():
+            for reference in references:
+                referenced_by.setdefault(reference, set()).add(uri)
+
+        uris = {self._uri(source) for source in sources}
+        pending = list(uris)
+        while pending:
+            for dependent in referenced_by.get(pending.pop(), ()):
+                if dependent not in uris:
+                    uris.add(dependent)
+                    pending.append(dependent)
+        return sorted(self._source(uri) for uri in uris)
+
+    def _reload(self, paths: Iterable[Union[str, Path]]) -> Tuple[List[str], List[str]]:
+        changed = []
+        errors = []
+        for path in paths:
+            uri = os.path.normpath(path)
+            if not uri.endswith(SCHEMA_SUFFIX) or not _is_relative_to(Path(uri), self.schema_dir):
+                continue
+            try:
+                with open(uri, "rb") as schema_file:
+                    content = schema_file.read()
+            except FileNotFoundError:
+                if self._documents.pop(uri, None) is not None:
+                    self._references.pop(uri, None)
+                    changed.append(self._source(uri))
+                continue
+            except OSError as error:
+                errors.append(f"Cannot read schema '{self._source(uri)}': {error}")
+                continue
+
+            content_hash = hash_bytes(content)
+            cached = self._documents.get(uri)
+            if cached is not None and cached[0] == content_hash:
+                continue
+            try:
+                document = json.loads(content)
+            except ValueError as error:
+                errors.append(f"Invalid JSON in schema '{self._source(uri)}': {error}")
+                continue
+            self._documents[uri] = (content_hash, document)
+            self._references[uri] = document_references(document, uri)
+            changed.append(self._source(uri))
+        return sorted(set(changed)), errors
+
+    def _regenerate(self, affected: Optional[List[str]] = None) -> CompileResult:
+        self._parse(affected)
+        sources = {uri: self._source(uri) for uri in sorted(self._documents, key=Path)}
+        plan = plan_models(self._models, sources, *self._plan_options)
+        schemas = {sources[uri]: content_hash for uri, (content_hash, _) in self._documents.items()}
+        manifest = Manifest(options=self._options, schemas=dict(sorted(schemas.items())))
+        result = CompileResult(conflicts=plan.conflicts, warnings=plan.warnings)
+        for unit, path in select_jobs(plan, self.output_dir, self._manifest, manifest, result):
+            record_job_result(self.output_dir, manifest, result, write_if_changed(path, render_unit(unit).encode()))
+        finish_build(self.output_dir, self._manifest, manifest, result)
+        self._manifest = manifest
+        return result
+
+    def _parse(self, affected: Optional[List[str]] = None) -> None:
+        # Models of a schema depend only on its own content and on the schemas it references, so only the affected
+        # schemas are parsed again. Parsing them in the same order as a full build, and together with everything that
+        # references them, keeps their models identical to a full parse.
+        uris = sorted(self._documents if affected is None else
+                      {self._uri(source) for source in affected} & self._documents.keys(), key=Path)
+        parser = SchemaParser(loader=self._load)
+        for uri in uris:
+            parser.parse_document(uri, self._documents[uri][1], Path(uri).stem)
+
+        if affected is not None and not self._documents.keys() >= set(parser.documents()):
+            # A schema outside the watched directory only holds the definitions that were referenced, and those
+            # references may come from schemas that were not parsed again.
+            self._parse()
+        elif affected is None:
+            self._models = {uri: parser.models(uri) for uri in parser.documents()}
+        else:
+            for uri in self._models.keys() - self._documents.keys():
+                del self._models[uri]
+            for uri in uris:
+                self._models[uri] = parser.models(uri)
+
+    def _load(self, uri: str) -> dict:
+        cached = self._documents.get(uri)
+        return cached[1] if cached is not None else load_schema(uri)
+
+    def _uri(self, source: str) -> str:
+        return os.path.normpath(self.schema_dir / source)
+
+    def _source(self, uri: str) -> str:
+        return Path(uri).relative_to(self.schema_dir).as_posix()
+
+
+class PollingWatcher:
+    def __init__(self, schema_dir: Union[str, Path], interval: float = DEFAULT_POLL_INTERVAL):
+        self.schema_dir = Path(schema_dir)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(0.0, remaining))
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for path in iter_schema_paths(self.schema_dir):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+class InotifyWatcher:
+    def __init__(self, schema_dir: Union[str, Path]):
+        self.schema_dir = Path(schema_dir)
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError("inotify is not available on this platform")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: Dict[int, str] = {}
+        self._add_tree(str(self.schema_dir))
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        changed = self._read(timeout)
+        while changed:
+            more = self._read(DEBOUNCE_SECONDS)
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, _IN_READ_SIZE)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = _IN_EVENT_HEADER.unpack_from(data, offset)
+            offset += _IN_EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_length].rstrip(b"\0"))
+            offset += name_length
+
+            if mask & _IN_Q_OVERFLOW:
+                changed.update(iter_schema_paths(self.schema_dir))
+                continue
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_DELETE_SELF:
+                del self._directories[wd]
+                continue
+            path = os.path.join(directory, name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._add_tree(path)
+                    changed.update(iter_schema_paths(path))
+            elif name.endswith(SCHEMA_SUFFIX):
+                changed.add(path)
+        return changed
+
+    def _add_tree(self, root: str) -> None:
+        for directory, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_WATCH_MASK)
+            if wd >= 0:
+                self._directories[wd] = directory
+
+
+def create_watcher(schema_dir: Union[str, Path], polling: bool = False,
+                   interval: float = DEFAULT_POLL_INTERVAL) -> Union[InotifyWatcher, PollingWatcher]:
+    if not polling and _load_libc() is not None:
+        try:
+            return InotifyWatcher(schema_dir)
+        except OSError:
+            pass
+    return PollingWatcher(schema_dir, interval)
+
+
+def watch(session: WatchSession, watcher: Union[InotifyWatcher, PollingWatcher],
+          on_update: Callable[[WatchUpdate], None], on_error: Callable[[Exception], None],
+          stop: Optional[threading.Event] = None, timeout: float = 0.5) -> None:
+    while stop is None or not stop.is_set():
+        changed = watcher.wait(timeout)
+        if not changed:
+            continue
+        try:
+            update = session.update(changed)
+        except (OSError, ValueError) as error:
+            on_error(error)
+            continue
+        if update.changed or update.errors:
+            on_update(update)
+
+
+def iter_schema_paths(schema_dir: Union[str, Path]) -> List[str]:
+    paths = []
+    for directory, _, file_names in os.walk(schema_dir):
+        paths.extend(os.path.join(directory, name) for name in file_names if name.endswith(SCHEMA_SUFFIX))
+    return sorted(paths)
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+def _is_relative_to(path: Path, directory: Path) -> bool:
+    try:
+        path.relative_to(directory)
+    except ValueError:
+        return False
+    return True
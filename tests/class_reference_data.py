@@ -0,0 +1,177 @@
+from src.java_model import Field, JavaClass
+
+class_ChargingStation = JavaClass(
+    name="ChargingStation",
+    fields=[
+        Field(name="serialNumber", type="String", description="Device. Serial_ Number."),
+        Field(name="firmwareVersions", type="List<String>")
+    ],
+    description="The physical system.")
+
+class_HeartbeatRequest = JavaClass(name="HeartbeatRequest", fields=[])
+
+expected_ChargingStation = """package ocpp.msgDef.DataTypes;
+
+import java.util.List;
+import java.util.Objects;
+
+
+/**
+ * The physical system.
+ */
+public class ChargingStation {
+
+    /**
+     * Device. Serial_ Number.
+     */
+    private String serialNumber;
+
+    private List<String> firmwareVersions;
+
+    public String getSerialNumber() {
+        return serialNumber;
+    }
+
+
+    public void setSerialNumber(String serialNumber) {
+        this.serialNumber = serialNumber;
+    }
+
+
+    public List<String> getFirmwareVersions() {
+        return firmwareVersions;
+    }
+
+
+    public void setFirmwareVersions(List<String> firmwareVersions) {
+        this.firmwareVersions = firmwareVersions;
+    }
+
+    @Override
+    public boolean equals(Object obj) {
+        if (this == obj)
+            return true;
+        if (!(obj instanceof ChargingStation))
+            return false;
+        ChargingStation that = (ChargingStation) obj;
+        return Objects.equals(getSerialNumber(), that.getSerialNumber())
+                && Objects.equals(getFirmwareVersions(), that.getFirmwareVersions());
+    }
+
+    @Override
+    public int hashCode() {
+        return Objects.hash(
+                getSerialNumber(),
+                getFirmwareVersions()
+        );
+    }
+}
+"""
+
+expected_HeartbeatRequest = """package ocpp.msgDef.Messages;
+
+
+public class HeartbeatRequest {
+}
+"""
+
+expected_ChargingStationRecord = """package ocpp.msgDef.DataTypes;
+
+import java.util.List;
+
+
+/**
+ * The physical system.
+ *
+ * @param serialNumber Device. Serial_ Number.
+ */
+public record ChargingStation(
+        String serialNumber,
+        List<String> firmwareVersions
+) {
+}
+"""
+
+expected_ChargingStationImmutable = """package ocpp.msgDef.DataTypes;
+
+import java.util.List;
+import java.util.Objects;
+
+
+/**
+ * The physical system.
+ */
+public final class ChargingStation {
+
+    /**
+     * Device. Serial_ Number.
+     */
+    private final String serialNumber;
+
+    private final List<String> firmwareVersions;
+
+    private final int cachedHashCode;
+
+    private ChargingStation(Builder builder) {
+        this.serialNumber = builder.serialNumber;
+        this.firmwareVersions = builder.firmwareVersions;
+        int h = 1;
+        h = 31 * h + Objects.hashCode(serialNumber);
+        h = 31 * h + Objects.hashCode(firmwareVersions);
+        this.cachedHashCode = h;
+    }
+
+    public static Builder builder() {
+        return new Builder();
+    }
+
+    public String getSerialNumber() {
+        return serialNumber;
+    }
+
+    public List<String> getFirmwareVersions() {
+        return firmwareVersions;
+    }
+
+    @Override
+    public boolean equals(Object obj) {
+        if (this == obj)
+            return true;
+        if (!(obj instanceof ChargingStation))
+            return false;
+        ChargingStation that = (ChargingStation) obj;
+        if (cachedHashCode != that.cachedHashCode)
+            return false;
+        return Objects.equals(serialNumber, that.serialNumber)
+                && Objects.equals(firmwareVersions, that.firmwareVersions);
+    }
+
+    @Override
+    public int hashCode() {
+        return cachedHashCode;
+    }
+
+    public static final class Builder {
+
+        private String serialNumber;
+        private List<String> firmwareVersions;
+
+        private Builder() {
+        }
+
+        public Builder serialNumber(String serialNumber) {
+            this.serialNumber = serialNumber;
+            return this;
+        }
+
+        public Builder firmwareVersions(List<String> firmwareVersions) {
+            this.firmwareVersions = firmwareVersions;
+            return this;
+        }
+
+        public ChargingStation build() {
+            return new ChargingStation(this);
+        }
+    }
+}
+"""
@@ -0,0 +1,100 @@
+expected_ChargingStationCodec = """package ocpp.msgDef.DataTypes;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.List;
+
+import com.fasterxml.jackson.core.JsonGenerator;
+import com.fasterxml.jackson.core.JsonParseException;
+import com.fasterxml.jackson.core.JsonParser;
+import com.fasterxml.jackson.core.JsonToken;
+
+
+public final class ChargingStationCodec {
+
+    private ChargingStationCodec() {
+    }
+
+    public static ChargingStation read(JsonParser parser) throws IOException {
+        JsonToken token = parser.currentToken();
+        if (token == null) {
+            token = parser.nextToken();
+        }
+        if (token == JsonToken.VALUE_NULL) {
+            return null;
+        }
+        if (token != JsonToken.START_OBJECT) {
+            throw new JsonParseException(parser, "Expected an object for ChargingStation");
+        }
+        String serialNumber = null;
+        List<String> firmwareVersions = null;
+        while (parser.nextToken() == JsonToken.FIELD_NAME) {
+            String fieldName = parser.currentName();
+            parser.nextToken();
+            switch (fieldName) {
+                case "serialNumber":
+                    serialNumber = readString(parser);
+                    break;
+                case "firmwareVersions":
+                    firmwareVersions = readListOfString(parser);
+                    break;
+                default:
+                    parser.skipChildren();
+            }
+        }
+        ChargingStation result = new ChargingStation();
+        result.setSerialNumber(serialNumber);
+        result.setFirmwareVersions(firmwareVersions);
+        return result;
+    }
+
+    public static void write(JsonGenerator generator, ChargingStation value) throws IOException {
+        if (value == null) {
+            generator.writeNull();
+            return;
+        }
+        generator.writeStartObject();
+        String serialNumber = value.getSerialNumber();
+        if (serialNumber != null) {
+            generator.writeFieldName("serialNumber");
+            generator.writeString(serialNumber);
+        }
+        List<String> firmwareVersions = value.getFirmwareVersions();
+        if (firmwareVersions != null) {
+            generator.writeFieldName("firmwareVersions");
+            writeListOfString(generator, firmwareVersions);
+        }
+        generator.writeEndObject();
+    }
+
+    private static String readString(JsonParser parser) throws IOException {
+        if (parser.currentToken() == JsonToken.VALUE_NULL) {
+            return null;
+        }
+        return parser.getText();
+    }
+
+    private static List<String> readListOfString(JsonParser parser) throws IOException {
+        if (parser.currentToken() == JsonToken.VALUE_NULL) {
+            return null;
+        }
+        List<String> values = new ArrayList<>();
+        while (parser.nextToken() != JsonToken.END_ARRAY) {
+            values.add(readString(parser));
+        }
+        return values;
+    }
+
+    private static void writeListOfString(JsonGenerator generator, List<String> values) throws IOException {
+        generator.writeStartArray();
+        for (String element : values) {
+            if (element == null) {
+                generator.writeNull();
+            } else {
+                generator.writeString(element);
+            }
+        }
+        generator.writeEndArray();
+    }
+}
+"""
@@ -100,3 +100,128 @@ public enum CancelReservationStatusEnum {
     }
 }
 """
+
+expected_CancelReservationStatusEnumSwitch = """package ocpp.anotherDef.Enums;
+
+public enum CancelReservationStatusEnum {
+    ACCEPTED("Accepted");
+
+    private final String value;
+
+    CancelReservationStatusEnum(String value) {
+        this.value = value;
+    }
+
+    public static CancelReservationStatusEnum fromValue(String value) {
+        if (value == null) {
+            throw new IllegalArgumentException(value);
+        }
+        switch (value) {
+            case "Accepted":
+                return ACCEPTED;
+            default:
+                throw new IllegalArgumentException(value);
+        }
+    }
+
+    @Override
+    public String toString() {
+        return this.value;
+    }
+
+    public String value() {
+        return this.value;
+    }
+}
+"""
+
+expected_AttributeEnumSplit = """package ocpp.msgDef.Enumerations;
+
+import java.util.HashMap;
+import java.util.Map;
+
+
+/**
+ * Type of attribute: Actual, Target, MinSet, MaxSet.
+ */
+public final class AttributeEnum {
+
+    public static final AttributeEnum ACTUAL = Chunk0.ACTUAL;
+    public static final AttributeEnum TARGET = Chunk0.TARGET;
+    public static final AttributeEnum MIN_SET = Chunk0.MIN_SET;
+    public static final AttributeEnum MAX_SET = Chunk1.MAX_SET;
+
+    private static final class Chunk0 {
+        static final AttributeEnum ACTUAL = new AttributeEnum("Actual", 0);
+        static final AttributeEnum TARGET = new AttributeEnum("Target", 1);
+        static final AttributeEnum MIN_SET = new AttributeEnum("MinSet", 2);
+
+        private Chunk0() {
+        }
+
+        static void register(AttributeEnum[] values) {
+            values[0] = ACTUAL;
+            values[1] = TARGET;
+            values[2] = MIN_SET;
+        }
+    }
+
+    private static final class Chunk1 {
+        static final AttributeEnum MAX_SET = new AttributeEnum("MaxSet", 3);
+
+        private Chunk1() {
+        }
+
+        static void register(AttributeEnum[] values) {
+            values[3] = MAX_SET;
+        }
+    }
+
+    private static final class Lookup {
+        private static final AttributeEnum[] VALUES = new AttributeEnum[4];
+        private static final Map<String, AttributeEnum> CONSTANTS = new HashMap<String, AttributeEnum>(6);
+
+        static {
+            Chunk0.register(VALUES);
+            Chunk1.register(VALUES);
+            for (AttributeEnum c : VALUES) {
+                CONSTANTS.put(c.value, c);
+            }
+        }
+    }
+
+    private final String value;
+    private final int ordinal;
+
+    private AttributeEnum(String value, int ordinal) {
+        this.value = value;
+        this.ordinal = ordinal;
+    }
+
+    public static AttributeEnum fromValue(String value) {
+        AttributeEnum constant = Lookup.CONSTANTS.get(value);
+        if (constant == null) {
+            throw new IllegalArgumentException(value);
+        } else {
+            return constant;
+        }
+    }
+
+    public static AttributeEnum[] values() {
+        return Lookup.VALUES.clone();
+    }
+
+    public int ordinal() {
+        return this.ordinal;
+    }
+
+    @Override
+    public String toString() {
+        return this.value;
+    }
+
+    public String value() {
+        return this.value;
+    }
+}
+"""
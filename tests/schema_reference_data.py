@@ -0,0 +1,65 @@
+schema_BootNotificationRequest = {
+    "$schema": "http://json-schema.org/draft-06/schema#",
+    "$id": "urn:OCPP:Cp:2:2020:3:BootNotificationRequest",
+    "comment": "OCPP 2.0.1 FINAL",
+    "definitions": {
+        "BootReasonEnumType": {
+            "description": "This contains the reason for sending this message to the CSMS.\r\n",
+            "javaType": "BootReasonEnum",
+            "type": "string",
+            "additionalProperties": False,
+            "enum": ["ApplicationReset", "FirmwareUpdate", "LocalReset", "PowerUp"]
+        },
+        "ChargingStationType": {
+            "description": "Charge_ Point\r\nurn:x-oca:ocpp:uid:2:233122\r\nThe physical system.\r\n",
+            "javaType": "ChargingStation",
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "serialNumber": {
+                    "description": "Device. Serial_ Number.\r\n",
+                    "type": "string",
+                    "maxLength": 25
+                },
+                "model": {
+                    "type": "string",
+                    "maxLength": 20
+                },
+                "firmwareVersions": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["model"]
+        }
+    },
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "chargingStation": {"$ref": "#/definitions/ChargingStationType"},
+        "reason": {"$ref": "#/definitions/BootReasonEnumType"},
+        "retries": {"type": "integer"}
+    },
+    "required": ["reason", "chargingStation"]
+}
+
+schema_CancelReservationResponse = {
+    "$schema": "http://json-schema.org/draft-06/schema#",
+    "$id": "urn:OCPP:Cp:2:2020:3:CancelReservationResponse",
+    "comment": "OCPP 2.0.1 FINAL",
+    "definitions": {
+        "CancelReservationStatusEnumType": {
+            "javaType": "CancelReservationStatusEnum",
+            "type": "string",
+            "additionalProperties": False,
+            "enum": ["Accepted", "Rejected"]
+        }
+    },
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "status": {"$ref": "#/definitions/CancelReservationStatusEnumType"},
+        "note": {"type": "string", "enum": ["None", "Some"]}
+    },
+    "required": ["status"]
+}
@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+import pytest
+
+from src.async_pipeline import compile_directory_async, compile_directory_pipelined
+from src.compiler import compile_directory
+from src.manifest import MANIFEST_NAME
+from tests.schema_reference_data import *
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+    (directory / "nested" / "CancelReservationResponse.json").write_text(json.dumps(schema_CancelReservationResponse))
+    return directory
+
+
+def _java_files(output_dir):
+    return {path.relative_to(output_dir).as_posix(): path.read_text() for path in output_dir.rglob("*.java")}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_compile_directory_async_matches_compile_directory(schema_dir, tmp_path, workers):
+    compile_directory(schema_dir, tmp_path / "expected", "ocpp.v201", workers=1)
+
+    result = asyncio.run(compile_directory_async(schema_dir, tmp_path / "java", "ocpp.v201", workers=workers,
+                                                 queue_size=1, io_workers=2))
+
+    assert len(result.written) == 6
+    assert _java_files(tmp_path / "java") == _java_files(tmp_path / "expected")
+    assert (tmp_path / "java" / MANIFEST_NAME).read_text() == (tmp_path / "expected" / MANIFEST_NAME).read_text()
+
+
+def test_compile_directory_pipelined_incremental(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory_pipelined(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert compile_directory_pipelined(schema_dir, output_dir, "ocpp.v201", workers=1).written == []
+
+    (schema_dir / "nested" / "CancelReservationResponse.json").unlink()
+    result = compile_directory_pipelined(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert result.written == []
+    assert sorted(path.name for path in result.removed) == [
+        "CancelReservationResponse.java", "CancelReservationStatusEnum.java", "Note.java"]
+
+
+def test_compile_directory_pipelined_invalid_json(schema_dir, tmp_path):
+    (schema_dir / "Broken.json").write_text("{")
+
+    with pytest.raises(ValueError):
+        compile_directory_pipelined(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+
+
+def test_compile_directory_pipelined_invalid_queue_size(schema_dir, tmp_path):
+    with pytest.raises(ValueError):
+        compile_directory_pipelined(schema_dir, tmp_path / "java", "ocpp.v201", queue_size=0)
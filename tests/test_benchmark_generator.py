@@ -0,0 +1,11 @@
+from src.benchmark_generator import generate_enum_lookup_benchmark
+from tests.enum_reference_data import *
+
+
+def test_generate_enum_lookup_benchmark():
+    java = generate_enum_lookup_benchmark(enum_AttributeEnum, "ocpp.v201.jmh", ["ocpp.v201.AttributeEnum"])
+
+    assert java.startswith("package ocpp.v201.jmh;\n\nimport ocpp.v201.AttributeEnum;\nimport java.util.HashMap;\n")
+    assert "public class AttributeEnumLookupBenchmark {" in java
+    assert "        return AttributeEnum.fromValue(nextValue());" in java
+    assert "        return hashMap.get(nextValue());" in java
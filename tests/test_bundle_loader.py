@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from src.bundle_loader import BUNDLE_NESTING_LIMIT, LazyObject, load_bundle
+from src.java_model import EnumClass
+from src.schema_parser import SchemaParser
+from tests.schema_reference_data import *
+
+
+def materialize(value):
+    if isinstance(value, LazyObject):
+        return {key: materialize(value[key]) for key in value}
+    return value
+
+
+def write_bundle(tmp_path, document, **dump_options):
+    path = tmp_path / "bundle.json"
+    path.write_text(json.dumps(document, **dump_options), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("dump_options", [{}, {"indent": 2}, {"separators": (",", ":")}, {"ensure_ascii": False}])
+def test_load_bundle_matches_json(tmp_path, dump_options):
+    document = json.loads(json.dumps(schema_BootNotificationRequest))
+    document["definitions"]["Odd \"{key}\" ü/~"] = {"description": "Braces } ] { [ and \\\" quotes", "enum": [1, 2.5]}
+    document["definitions"]["Flag"] = True
+    document["empty"] = {}
+
+    bundle = load_bundle(write_bundle(tmp_path, document, **dump_options))
+
+    assert isinstance(bundle["definitions"], LazyObject)
+    assert bundle["definitions"] is bundle["definitions"]
+    assert materialize(bundle) == document
+    assert "missing" not in bundle
+    with pytest.raises(KeyError):
+        bundle["definitions"]["missing"]
+
+
+def test_load_bundle_deeply_nested_value(tmp_path):
+    nested = {"leaf": ["}"]}
+    for _ in range(BUNDLE_NESTING_LIMIT + 2):
+        nested = {"next": [nested]}
+    document = {"definitions": {"Deep": nested, "After": {"type": "string"}}}
+
+    bundle = load_bundle(write_bundle(tmp_path, document))
+
+    assert bundle["definitions"]["After"] == {"type": "string"}
+    assert materialize(bundle) == document
+
+
+def test_load_bundle_scans_only_up_to_requested_key(tmp_path):
+    path = tmp_path / "truncated.json"
+    path.write_text('{"definitions": {"First": {"type": "string"}, "Second": {"type": ', encoding="utf-8")
+
+    definitions = load_bundle(path)["definitions"]
+
+    assert definitions["First"] == {"type": "string"}
+    with pytest.raises(ValueError):
+        definitions["Second"]
+
+
+@pytest.mark.parametrize("content", ["", "[1, 2]", "{\"a\" 1}"])
+def test_load_bundle_invalid(tmp_path, content):
+    path = tmp_path / "invalid.json"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        len(load_bundle(path))
+
+
+def test_parse_roots_materializes_reachable_definitions(tmp_path):
+    document = json.loads(json.dumps(schema_BootNotificationRequest))
+    document["definitions"]["UnusedType"] = {"javaType": "Unused", "type": "object", "properties": {}}
+    path = write_bundle(tmp_path, document)
+
+    parser = SchemaParser()
+    models = parser.parse_roots(str(path), ["BootReasonEnumType"], load_bundle(path))
+
+    assert models.enums == [EnumClass(name="BootReasonEnum", values=["ApplicationReset", "FirmwareUpdate",
+                                                                     "LocalReset", "PowerUp"],
+                                      description="This contains the reason for sending this message to the CSMS.")]
+    assert models.classes == []
+    with pytest.raises(ValueError, match="MissingType"):
+        SchemaParser().parse_roots(str(path), ["MissingType"], load_bundle(path))
+
+
+def test_parse_document_after_parse_roots(tmp_path):
+    document = json.loads(json.dumps(schema_BootNotificationRequest))
+    document["definitions"]["UnusedType"] = {"javaType": "Unused", "type": "object", "properties": {}}
+    path = write_bundle(tmp_path, document)
+
+    parser = SchemaParser()
+    parser.parse_roots(str(path), ["BootReasonEnumType"], load_bundle(path))
+    models = parser.parse_document(str(path))
+
+    assert [enum.name for enum in models.enums] == ["BootReasonEnum"]
+    assert sorted(java_class.name for java_class in models.classes) == ["ChargingStation", "Unused", "bundle"]
+
+
+def test_parse_bundle_document_matches_json(tmp_path):
+    path = write_bundle(tmp_path, schema_BootNotificationRequest, indent=4)
+
+    lazy = SchemaParser().parse_document(str(path), load_bundle(path), "BootNotificationRequest")
+    loaded = SchemaParser().parse_document(str(path), json.loads(path.read_text()), "BootNotificationRequest")
+
+    assert lazy == loaded
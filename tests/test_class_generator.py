@@ -0,0 +1,86 @@
+import pytest
+
+from src.class_generator import generate_java_class
+from src.java_method_generator import generate_equals, generate_fields_block, generate_getters_and_setters, \
+    generate_hash_code
+from src.java_model import Field, JavaClass
+from tests.class_reference_data import *
+
+
+def test_generate_java_class():
+    assert generate_java_class(class_ChargingStation, "ocpp.msgDef.DataTypes") == expected_ChargingStation
+
+
+def test_generate_java_class_without_fields():
+    assert generate_java_class(class_HeartbeatRequest, "ocpp.msgDef.Messages") == expected_HeartbeatRequest
+
+
+def test_generate_java_class_fast_equals():
+    java_class = generate_java_class(class_ChargingStation, "ocpp.msgDef.DataTypes", equals_mode="fast")
+
+    assert "Objects.hash(" not in java_class
+    assert "        return Objects.equals(serialNumber, that.serialNumber)\n" in java_class
+    assert "        h = 31 * h + Objects.hashCode(firmwareVersions);\n" in java_class
+
+
+@pytest.mark.parametrize("equals_mode", ["standard", "fast"])
+def test_generate_java_class_matches_section_generators(equals_mode):
+    java_class = JavaClass(name="Sample", fields=[
+        Field(name="name", type="String", description="Display name"),
+        Field(name="ratio", type="double"),
+        Field(name="h", type="Integer"),
+        Field(name="tags", type="List<String>")
+    ])
+    sections = "\n".join([
+        generate_fields_block(java_class.fields),
+        generate_getters_and_setters(java_class.fields),
+        generate_equals(java_class.name, java_class.fields, equals_mode),
+        generate_hash_code(java_class.fields, equals_mode)
+    ])
+
+    assert sections in generate_java_class(java_class, "ocpp.msgDef.DataTypes", equals_mode=equals_mode)
+
+
+def test_generate_java_class_invalid_field_name():
+    java_class = JavaClass(name="Sample", fields=[Field(name="class", type="String")])
+    with pytest.raises(ValueError):
+        generate_java_class(java_class, "ocpp.msgDef.DataTypes")
+
+
+def test_generate_java_class_record():
+    assert generate_java_class(class_ChargingStation, "ocpp.msgDef.DataTypes", class_style="record") == \
+        expected_ChargingStationRecord
+    assert "public record HeartbeatRequest() {\n}" in \
+        generate_java_class(class_HeartbeatRequest, "ocpp.msgDef.Messages", class_style="record")
+
+
+def test_generate_java_class_record_forbidden_component():
+    java_class = JavaClass(name="Sample", fields=[Field(name="hashCode", type="Integer")])
+    with pytest.raises(ValueError):
+        generate_java_class(java_class, "ocpp.msgDef.DataTypes", class_style="record")
+
+
+def test_generate_java_class_immutable():
+    assert generate_java_class(class_ChargingStation, "ocpp.msgDef.DataTypes", class_style="immutable") == \
+        expected_ChargingStationImmutable
+
+
+def test_generate_java_class_immutable_shadowed_field_names():
+    java_class = JavaClass(name="Sample", fields=[Field(name="builder", type="String"), Field(name="h", type="int")])
+    java = generate_java_class(java_class, "ocpp.msgDef.DataTypes", class_style="immutable")
+
+    assert "        h = 31 * h + Objects.hashCode(this.builder);\n" in java
+    assert "        h = 31 * h + Integer.hashCode(this.h);\n" in java
+
+
+def test_generate_java_class_immutable_equals_shadowed_field_names():
+    java_class = JavaClass(name="Sample", fields=[Field(name="obj", type="String"), Field(name="that", type="int")])
+    java = generate_java_class(java_class, "ocpp.msgDef.DataTypes", class_style="immutable")
+
+    assert "        return this.that == that.that\n                && Objects.equals(this.obj, that.obj);\n" in java
+    assert "        h = 31 * h + Objects.hashCode(obj);\n" in java
+
+
+def test_generate_java_class_unknown_style():
+    with pytest.raises(ValueError):
+        generate_java_class(class_ChargingStation, "ocpp.msgDef.DataTypes", class_style="lombok")
@@ -0,0 +1,334 @@
+import json
+import zipfile
+
+import pytest
+
+from src.compiler import compile_bundle, compile_directory, compile_to_jar, plan_directory, render_unit, CLASS_UNIT, \
+    ENUM_UNIT
+from src.manifest import MANIFEST_NAME
+from src.options import MAX_ENUM_CONSTANTS
+from src.render_cache import RenderCache
+from src.enum_generator import generate_enum_class
+from src.naming import clear_name_caches, validate_java_identifier
+from tests.schema_reference_data import *
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+    (directory / "nested" / "CancelReservationResponse.json").write_text(json.dumps(schema_CancelReservationResponse))
+    return directory
+
+
+def test_plan_directory(schema_dir):
+    units = plan_directory(schema_dir, "ocpp.v201")
+
+    assert [(unit.name, unit.kind) for unit in units] == [
+        ("BootReasonEnum", ENUM_UNIT),
+        ("ChargingStation", CLASS_UNIT),
+        ("BootNotificationRequest", CLASS_UNIT),
+        ("CancelReservationStatusEnum", ENUM_UNIT),
+        ("Note", ENUM_UNIT),
+        ("CancelReservationResponse", CLASS_UNIT)
+    ]
+    assert units[-1].source == "nested/CancelReservationResponse.json"
+
+
+def test_render_validated_units_skips_name_checks(schema_dir, monkeypatch):
+    units = plan_directory(schema_dir, "ocpp.v201", codecs=True)
+    assert all(unit.validated for unit in units)
+
+    clear_name_caches()
+    monkeypatch.setattr("src.enum_generator.to_java_constants", pytest.fail)
+    for unit in units:
+        render_unit(unit)
+
+    assert validate_java_identifier.cache_info().misses == 0
+
+
+def test_plan_directory_generates_shared_names_once(schema_dir):
+    (schema_dir / "CancelReservationResponseCopy.json").write_text(json.dumps(schema_CancelReservationResponse))
+
+    names = [unit.name for unit in plan_directory(schema_dir, "ocpp.v201")]
+
+    assert names.count("CancelReservationStatusEnum") == 1
+
+
+def test_plan_directory_renames_cross_document_refs(tmp_path):
+    directory = tmp_path / "refs"
+    directory.mkdir()
+    for name, values in (("a", ["Red"]), ("b", ["Green"])):
+        (directory / f"{name}.json").write_text(json.dumps({"definitions": {
+            "FooEnumType": {"javaType": "FooEnum", "type": "string", "enum": values}}}))
+    (directory / "c.json").write_text(json.dumps({"properties": {
+        "bar": {"$ref": "b.json#/definitions/FooEnumType"},
+        "bars": {"type": "array", "items": {"$ref": "a.json#/definitions/FooEnumType"}}}}))
+
+    units = {unit.name: unit for unit in plan_directory(directory, "ocpp.v201")}
+
+    assert units["bFooEnum"].model.values == ("Green",)
+    assert [(field.name, field.type) for field in units["c"].model.fields] == [
+        ("bar", "bFooEnum"), ("bars", "List<FooEnum>")]
+
+
+def test_plan_directory_invalid_package(schema_dir):
+    with pytest.raises(ValueError):
+        plan_directory(schema_dir, "ocpp.2")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_compile_directory(schema_dir, tmp_path, workers):
+    output_dir = tmp_path / "java"
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=workers)
+
+    package_dir = output_dir / "ocpp" / "v201"
+    assert sorted(result.written) == sorted(package_dir / f"{name}.java" for name in [
+        "BootReasonEnum", "ChargingStation", "BootNotificationRequest",
+        "CancelReservationStatusEnum", "Note", "CancelReservationResponse"])
+    units = {unit.name: unit for unit in plan_directory(schema_dir, "ocpp.v201")}
+    assert (package_dir / "BootReasonEnum.java").read_text() == \
+        generate_enum_class(units["BootReasonEnum"].model, "ocpp.v201")
+
+
+def test_compile_directory_no_op_rebuild(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+    enum_path = output_dir / "ocpp" / "v201" / "BootReasonEnum.java"
+    mtime = enum_path.stat().st_mtime_ns
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert result.written == []
+    assert len(result.unchanged) == 6
+    assert enum_path.stat().st_mtime_ns == mtime
+
+
+def test_compile_directory_renders_only_changed_units(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    schema = json.loads(json.dumps(schema_CancelReservationResponse))
+    schema["definitions"]["CancelReservationStatusEnumType"]["enum"].append("Unknown")
+    (schema_dir / "nested" / "CancelReservationResponse.json").write_text(json.dumps(schema))
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert result.written == [output_dir / "ocpp" / "v201" / "CancelReservationStatusEnum.java"]
+    assert len(result.unchanged) == 5
+
+
+def test_compile_directory_skips_identical_output(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1, incremental=False)
+
+    assert result.written == []
+    assert len(result.unchanged) == 6
+
+
+def test_compile_directory_removes_stale_outputs(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    (schema_dir / "nested" / "CancelReservationResponse.json").unlink()
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert sorted(path.name for path in result.removed) == [
+        "CancelReservationResponse.java", "CancelReservationStatusEnum.java", "Note.java"]
+    assert not (output_dir / "ocpp" / "v201" / "Note.java").exists()
+
+
+def test_compile_directory_rebuilds_on_option_change(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v16", workers=1)
+
+    assert len(result.written) == 6
+    assert len(result.removed) == 6
+    assert (output_dir / MANIFEST_NAME).is_file()
+
+
+def test_compile_directory_shared_package(schema_dir, tmp_path):
+    (schema_dir / "CancelReservationResponseCopy.json").write_text(json.dumps(schema_CancelReservationResponse))
+    output_dir = tmp_path / "java"
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1, shared_package="ocpp.common")
+
+    assert sorted(path.name for path in (output_dir / "ocpp" / "common").iterdir()) == [
+        "CancelReservationStatusEnum.java", "Note.java"]
+    response = (output_dir / "ocpp" / "v201" / "CancelReservationResponse.java").read_text()
+    assert "import ocpp.common.CancelReservationStatusEnum;\nimport ocpp.common.Note;\n" in response
+    boot = (output_dir / "ocpp" / "v201" / "BootNotificationRequest.java").read_text()
+    assert "import ocpp.common" not in boot
+    assert result.conflicts == []
+
+
+def test_compile_directory_reports_conflicts(schema_dir, tmp_path):
+    schema = json.loads(json.dumps(schema_CancelReservationResponse))
+    schema["definitions"]["CancelReservationStatusEnumType"]["enum"] = ["Accepted"]
+    (schema_dir / "LegacyResponse.json").write_text(json.dumps(schema))
+
+    result = compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+
+    assert [conflict.name for conflict in result.conflicts] == ["CancelReservationStatusEnum"]
+    assert (tmp_path / "java" / "ocpp" / "v201" / "CancelReservationResponseCancelReservationStatusEnum.java").is_file()
+
+
+def test_compile_directory_enum_lookup_and_benchmarks(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1, enum_lookup="switch", enum_benchmarks=True)
+
+    assert "switch (value) {" in (output_dir / "ocpp" / "v201" / "BootReasonEnum.java").read_text()
+    assert sorted(path.name for path in (output_dir / "ocpp" / "v201" / "jmh").iterdir()) == [
+        "BootReasonEnumLookupBenchmark.java", "CancelReservationStatusEnumLookupBenchmark.java",
+        "NoteLookupBenchmark.java"]
+
+    result = compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1)
+
+    assert len(result.removed) == 3
+    assert "CONSTANTS.get(value)" in (output_dir / "ocpp" / "v201" / "BootReasonEnum.java").read_text()
+
+
+def test_compile_directory_large_enum_falls_back_to_map_lookup(schema_dir, tmp_path):
+    values = [f"Reason{i}" for i in range(MAX_ENUM_CONSTANTS + 1)]
+    (schema_dir / "Large.json").write_text(json.dumps({"definitions": {"LargeEnum": {"type": "string",
+                                                                                      "enum": values}}}))
+
+    result = compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1, enum_lookup="switch")
+
+    assert len(result.warnings) == 1 and "'LargeEnum'" in result.warnings[0]
+    package_dir = tmp_path / "java" / "ocpp" / "v201"
+    assert "Lookup.CONSTANTS.get(value)" in (package_dir / "LargeEnum.java").read_text()
+    assert "switch (value) {" in (package_dir / "BootReasonEnum.java").read_text()
+
+
+def test_compile_directory_class_style(schema_dir, tmp_path):
+    output_dir = tmp_path / "java"
+
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1, class_style="record")
+
+    assert "public record ChargingStation(" in (output_dir / "ocpp" / "v201" / "ChargingStation.java").read_text()
+
+
+def test_compile_directory_codecs(schema_dir, tmp_path):
+    (schema_dir / "CancelReservationResponseCopy.json").write_text(json.dumps(schema_CancelReservationResponse))
+    output_dir = tmp_path / "java"
+
+    compile_directory(schema_dir, output_dir, "ocpp.v201", workers=1, shared_package="ocpp.common", codecs=True)
+
+    codec = (output_dir / "ocpp" / "v201" / "BootNotificationRequestCodec.java").read_text()
+    assert "ChargingStationCodec.read(parser)" in codec
+    assert "BootReasonEnum.fromValue(parser.getText())" in codec
+    response_codec = (output_dir / "ocpp" / "v201" / "CancelReservationResponseCodec.java").read_text()
+    assert "import ocpp.common.CancelReservationStatusEnum;\nimport ocpp.common.Note;\nimport java.io" in response_codec
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_compile_to_jar(schema_dir, tmp_path, workers):
+    compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+    jar_path = tmp_path / "sources.jar"
+
+    result = compile_to_jar(schema_dir, jar_path, "ocpp.v201", workers=workers)
+
+    assert result.written == [jar_path]
+    with zipfile.ZipFile(jar_path) as jar:
+        sources = {name: jar.read(name) for name in jar.namelist() if name.endswith(".java")}
+    assert sources == {path.relative_to(tmp_path / "java").as_posix(): path.read_bytes()
+                       for path in (tmp_path / "java").rglob("*.java")}
+    assert compile_to_jar(schema_dir, jar_path, "ocpp.v201", workers=workers).unchanged == [jar_path]
+
+
+def test_compile_directory_render_cache(schema_dir, tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path / "cache")
+    first = compile_directory(schema_dir, tmp_path / "first", "ocpp.v201", workers=1, cache=cache)
+    expected = {path.name: path.read_text() for path in first.written}
+
+    import src.compiler
+    monkeypatch.setattr(src.compiler, "build_plan", lambda *args: pytest.fail("the tree should come from the cache"))
+    second = compile_directory(schema_dir, tmp_path / "second", "ocpp.v201", workers=1, cache=cache)
+
+    assert {path.name: path.read_text() for path in second.written} == expected
+    assert json.loads((tmp_path / "second" / MANIFEST_NAME).read_text()) == \
+        json.loads((tmp_path / "first" / MANIFEST_NAME).read_text())
+
+
+def test_compile_directory_render_cache_generator_changed(schema_dir, tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path / "cache")
+    compile_directory(schema_dir, tmp_path / "first", "ocpp.v201", workers=1, cache=cache)
+
+    import src.compiler
+    import src.manifest
+    rendered = []
+    render_and_write = src.compiler._render_and_write
+    monkeypatch.setattr(src.manifest, "generator_fingerprint", lambda: "changed")
+    monkeypatch.setattr(src.compiler, "_render_and_write", lambda job: rendered.append(job[0].name) or
+                        render_and_write(job))
+    result = compile_directory(schema_dir, tmp_path / "first", "ocpp.v201", workers=1, cache=cache)
+
+    assert len(rendered) == len(result.unchanged) == 6
+
+
+def test_compile_directory_render_cache_units(schema_dir, tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path / "cache")
+    compile_directory(schema_dir, tmp_path / "first", "ocpp.v201", workers=1, cache=cache)
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(
+        dict(schema_BootNotificationRequest, description="Changed")))
+
+    import src.compiler
+    rendered = []
+    render_and_write = src.compiler._render_and_write
+    monkeypatch.setattr(src.compiler, "_render_and_write", lambda job: rendered.append(job[0].name) or
+                        render_and_write(job))
+    result = compile_directory(schema_dir, tmp_path / "second", "ocpp.v201", workers=1, cache=cache)
+
+    assert rendered == ["BootNotificationRequest"]
+    assert len(result.written) == 6
+
+
+def test_plan_directory_reports_every_naming_issue(schema_dir):
+    schema = {
+        "$schema": "http://json-schema.org/draft-06/schema#",
+        "type": "object",
+        "properties": {
+            "url": {"type": "string"},
+            "Url": {"type": "string"},
+            "mode": {"type": "string", "enum": ["kit-kat", "kitKat"]}
+        }
+    }
+    (schema_dir / "LinkRequest.json").write_text(json.dumps(schema))
+
+    with pytest.raises(ValueError) as error:
+        plan_directory(schema_dir, "ocpp.v201")
+
+    assert "fields 'url' and 'Url' both generate 'getUrl'" in str(error.value)
+    assert "enum values 'kit-kat', 'kitKat' all map to the constant 'KIT_KAT'" in str(error.value)
+
+
+def test_compile_bundle_roots(tmp_path):
+    bundle = json.loads(json.dumps(schema_BootNotificationRequest))
+    bundle["definitions"].update(schema_CancelReservationResponse["definitions"])
+    bundle_path = tmp_path / "OcppBundle.json"
+    bundle_path.write_text(json.dumps(bundle))
+    output_dir = tmp_path / "java"
+
+    result = compile_bundle(bundle_path, output_dir, "ocpp.v201", ["ChargingStationType"], workers=1)
+
+    assert [path.name for path in result.written] == ["ChargingStation.java"]
+    assert compile_bundle(bundle_path, output_dir, "ocpp.v201", ["ChargingStationType"], workers=1).written == []
+
+    result = compile_bundle(bundle_path, output_dir, "ocpp.v201", workers=1)
+
+    assert sorted(path.name for path in result.written) == [
+        "BootReasonEnum.java", "CancelReservationStatusEnum.java", "OcppBundle.java"
+    ]
+    assert [path.name for path in result.unchanged] == ["ChargingStation.java"]
+
+
+def test_compile_bundle_missing(tmp_path):
+    with pytest.raises(ValueError):
+        compile_bundle(tmp_path / "missing.json", tmp_path / "java", "ocpp.v201")
@@ -1,4 +1,10 @@
-from src.enum_generator import to_java_constant, generate_enum_class
+import io
+
+import pytest
+
+from src.enum_generator import to_java_constant, generate_enum_class, iter_enum_class, write_enum_class, \
+    select_lookup_strategy, LOOKUP_AUTO, LOOKUP_MAP, LOOKUP_PERFECT_HASH, LOOKUP_SWITCH, MAX_ENUM_CONSTANTS, \
+    SWITCH_LOOKUP_MAX_VALUES
 from tests.enum_reference_data import *
 
 
@@ -27,3 +33,98 @@ def test_to_java_constant():
 def test_generate_enum_class():
     assert generate_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations") == expected_AttributeEnum
     assert generate_enum_class(enum_CancelReservationStatusEnum, "ocpp.anotherDef.Enums") == expected_CancelReservationStatusEnum
+
+
+def test_write_enum_class():
+    sink = io.StringIO()
+    write_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations", sink)
+    assert sink.getvalue() == expected_AttributeEnum
+
+
+def test_iter_enum_class_yields_header_constants_and_body():
+    chunks = list(iter_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations"))
+    assert "".join(chunks) == expected_AttributeEnum
+    assert len(chunks) == len(enum_AttributeEnum.values) + 2
+
+
+def test_generate_enum_class_without_constants():
+    enum_class = EnumClass(name="EmptyEnum", values=[])
+    assert "public enum EmptyEnum {\n\n    private final static" in generate_enum_class(enum_class, "org.example")
+
+
+def test_generate_enum_class_switch_lookup():
+    assert generate_enum_class(enum_CancelReservationStatusEnum, "ocpp.anotherDef.Enums", LOOKUP_SWITCH) == \
+        expected_CancelReservationStatusEnumSwitch
+
+
+def test_generate_enum_class_perfect_hash_lookup():
+    enum_class = EnumClass(name="MeasurandEnum", values=[f"Value{i}" for i in range(100)])
+    java = generate_enum_class(enum_class, "org.example", LOOKUP_PERFECT_HASH)
+
+    assert "import java.util" not in java
+    assert "    private static final MeasurandEnum[] TABLE = new MeasurandEnum[256];" in java
+    assert "        return mix(h, displacement) & 255;" in java
+    assert "CONSTANTS" not in java
+
+
+def test_generate_split_enum_class():
+    assert generate_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations", max_constants=3) == \
+        expected_AttributeEnumSplit
+
+
+def test_write_split_enum_class():
+    sink = io.StringIO()
+    write_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations", sink, LOOKUP_AUTO, max_constants=3)
+    assert sink.getvalue() == expected_AttributeEnumSplit
+
+
+def test_generate_enum_class_splits_above_max_constants():
+    values = [f"Reason{i}" for i in range(MAX_ENUM_CONSTANTS * 2 + 1)]
+    java = generate_enum_class(EnumClass(name="ReasonEnum", values=values), "org.example")
+
+    assert "public final class ReasonEnum {" in java
+    assert java.count("private static final class Chunk") == 3
+    assert '        static final ReasonEnum REASON_0 = new ReasonEnum("Reason0", 0);' in java
+    alias = f"REASON_{MAX_ENUM_CONSTANTS}"
+    assert f"    public static final ReasonEnum {alias} = Chunk1.{alias};" in java
+    assert f"            values[{len(values) - 1}] = REASON_{len(values) - 1};" in java
+    assert f"new ReasonEnum[{len(values)}];" in java
+    largest_enum = EnumClass(name="ReasonEnum", values=values[:MAX_ENUM_CONSTANTS])
+    assert "public enum ReasonEnum {" in generate_enum_class(largest_enum, "org.example")
+
+
+def test_generate_enum_class_rejects_colliding_constants():
+    enum_class = EnumClass(name="AttributeEnum", values=["MinSet", "Min-Set"])
+    for max_constants in (MAX_ENUM_CONSTANTS, 1):
+        with pytest.raises(ValueError):
+            generate_enum_class(enum_class, "org.example", max_constants=max_constants)
+
+
+def test_generate_split_enum_class_falls_back_to_map_lookup():
+    for lookup in (LOOKUP_SWITCH, LOOKUP_PERFECT_HASH):
+        assert generate_enum_class(enum_AttributeEnum, "ocpp.msgDef.Enumerations", lookup, max_constants=3) == \
+            expected_AttributeEnumSplit
+
+
+def test_generate_split_enum_class_errors():
+    with pytest.raises(ValueError):
+        generate_enum_class(enum_AttributeEnum, "org.example", "binary", max_constants=2)
+    with pytest.raises(ValueError):
+        generate_enum_class(enum_AttributeEnum, "org.example", max_constants=0)
+
+
+def test_select_lookup_strategy():
+    small = [f"Value{i}" for i in range(SWITCH_LOOKUP_MAX_VALUES)]
+    large = [f"Value{i}" for i in range(SWITCH_LOOKUP_MAX_VALUES + 1)]
+
+    assert select_lookup_strategy(small) == LOOKUP_SWITCH
+    assert select_lookup_strategy(large) == LOOKUP_PERFECT_HASH
+    assert select_lookup_strategy(large, LOOKUP_MAP) == LOOKUP_MAP
+    assert select_lookup_strategy(large + ["Aa", "BB"], LOOKUP_AUTO) == LOOKUP_MAP
+
+
+def test_select_lookup_strategy_errors():
+    with pytest.raises(ValueError):
+        select_lookup_strategy(["Aa", "BB"], LOOKUP_PERFECT_HASH)
+    with pytest.raises(ValueError):
+        select_lookup_strategy(["Aa"], "binary-search")
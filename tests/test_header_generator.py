@@ -1,6 +1,6 @@
 import pytest
 
-from src.header_generator import set_package
+from src.header_generator import package_declaration, set_package
 
 
 def test_set_package():
@@ -25,3 +25,10 @@ def test_set_package_illegal_name():
     example_2 = "com.example.123name"
     with pytest.raises(ValueError):
         set_package(example_2)
+
+
+def test_package_declaration():
+    assert package_declaration("org.example") == "package org.example;"
+    assert package_declaration("org.2example", validated=True) == "package org.2example;"
+    with pytest.raises(ValueError):
+        package_declaration("org.2example")
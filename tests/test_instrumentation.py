@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from src.compiler import compile_directory
+from src.instrumentation import Recorder, count, current_recorder, recording, stage, write_report
+from tests.schema_reference_data import *
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+    (directory / "nested" / "CancelReservationResponse.json").write_text(json.dumps(schema_CancelReservationResponse))
+    return directory
+
+
+def test_stage_and_count_without_recorder():
+    assert current_recorder() is None
+    with stage("parse", "a.json"):
+        count("schemas")
+
+
+def test_recorder_accumulates_stages_and_schemas():
+    recorder = Recorder()
+    with recorder.stage("parse", "a.json"):
+        pass
+    with recorder.stage("parse", "b.json"):
+        pass
+    with recorder.stage("render", "a.json"):
+        pass
+    recorder.count("schemas", 2)
+
+    assert recorder.stages["parse"].calls == 2
+    assert recorder.counters == {"schemas": 2}
+    assert [entry["schema"] for entry in recorder.slowest_schemas(1)] == [
+        max(recorder.schema_seconds, key=recorder.schema_seconds.get)]
+    assert set(recorder.schema_seconds) == {"a.json", "b.json"}
+
+
+def test_recording_compile_directory(schema_dir, tmp_path):
+    with recording() as recorder:
+        compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+
+    assert current_recorder() is None
+    assert {"hash_schemas", "parse", "resolve_types", "naming", "render_and_write", "finish"} <= set(recorder.stages)
+    assert recorder.counters["schemas"] == 2
+    assert recorder.counters["classes"] == 3
+    assert recorder.counters["enums"] == 3
+    assert recorder.counters["files_written"] == 6
+    assert recorder.counters["bytes_written"] == sum(
+        path.stat().st_size for path in (tmp_path / "java").rglob("*.java"))
+    assert {entry["schema"] for entry in recorder.slowest_schemas()} == {
+        "BootNotificationRequest.json", "nested/CancelReservationResponse.json"}
+
+
+def test_recording_compile_directory_workers(schema_dir, tmp_path):
+    with recording() as serial:
+        compile_directory(schema_dir, tmp_path / "serial", "ocpp.v201", workers=1)
+    with recording() as recorder:
+        compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=2)
+
+    assert set(recorder.stages) == set(serial.stages)
+    assert {"render_and_write", "naming"} <= set(recorder.stages)
+    assert recorder.stages["render_and_write"].calls == 6
+    assert recorder.counters["files_written"] == 6
+    assert {entry["schema"] for entry in recorder.slowest_schemas()} == {
+        "BootNotificationRequest.json", "nested/CancelReservationResponse.json"}
+
+
+def test_recorder_merge():
+    recorder, other = Recorder(), Recorder()
+    with recorder.stage("render", "a.json"):
+        pass
+    with other.stage("render", "a.json"):
+        pass
+    other.count("schemas")
+
+    recorder.merge(other)
+
+    assert recorder.stages["render"].calls == 2
+    assert recorder.counters == {"schemas": 1}
+    assert list(recorder.schema_seconds) == ["a.json"]
+
+
+def test_recording_profile_and_memory(schema_dir, tmp_path):
+    with recording(trace_memory=True, profile_path=tmp_path / "run.prof") as recorder:
+        compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+
+    assert recorder.profile and "cumulative_seconds" in recorder.profile[0]
+    assert recorder.memory_peak_bytes > 0
+    assert (tmp_path / "run.prof").is_file()
+
+
+def test_write_report(schema_dir, tmp_path):
+    with recording() as recorder:
+        compile_directory(schema_dir, tmp_path / "java", "ocpp.v201", workers=1)
+    write_report(recorder, tmp_path / "report.json", top_n=1)
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["version"] == 1
+    assert report["counters"]["fields"] > 0
+    assert len(report["slowest_schemas"]) == 1
+    assert "memory" not in report and "profile" not in report
+    assert "slowest 1 schemas:" in recorder.summary(1)
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from tests.reference_data import *
@@ -214,3 +216,137 @@ def test_generate_equals_invalid_name():
         attr = Field(name=name, type="String")
         with pytest.raises(ValueError):
             generate_equals("MyClass", [attr])
+
+
+def test_write_fields_block():
+    attributes = [field_exampleAttribute_int, field_someName_String, field_customData_CustomObject]
+    sink = io.StringIO()
+    write_fields_block(attributes, sink)
+    assert sink.getvalue() == generate_fields_block(attributes)
+
+
+def test_write_getters_and_setters():
+    attributes = [field_exampleAttribute_int, field_customData_CustomObject]
+    sink = io.StringIO()
+    write_getters_and_setters(attributes, sink)
+    assert sink.getvalue() == generate_getters_and_setters(attributes)
+
+
+def test_write_equals_and_hash_code():
+    attributes = [field_exampleAttribute_int, field_someName_String]
+    sink = io.StringIO()
+    write_equals("MyClass", attributes, sink)
+    write_hash_code(attributes, sink)
+    assert sink.getvalue() == generate_equals("MyClass", attributes) + generate_hash_code(attributes)
+
+
+def test_iter_fields_block_invalid_name():
+    for name in illegal_names:
+        with pytest.raises(ValueError):
+            list(iter_fields_block([Field(name=name, type="String")]))
+
+
+def test_generate_equals_fast():
+    attributes = [field_someName_String, Field(name="ratio", type="double"), field_exampleAttribute_int]
+    expected = """
+    @Override
+    public boolean equals(Object obj) {
+        if (this == obj)
+            return true;
+        if (!(obj instanceof MyClass))
+            return false;
+        MyClass that = (MyClass) obj;
+        return Double.compare(ratio, that.ratio) == 0
+                && exampleAttribute == that.exampleAttribute
+                && Objects.equals(someName, that.someName);
+    }"""
+    assert generate_equals("MyClass", attributes, EQUALS_FAST) == expected
+
+
+def test_generate_equals_and_hash_code_fast_shadowed_field_names():
+    attributes = [Field(name="obj", type="String"), Field(name="that", type="int"), Field(name="h", type="double")]
+
+    assert generate_equals("MyClass", attributes, EQUALS_FAST).endswith("""
+        return this.that == that.that
+                && Double.compare(h, that.h) == 0
+                && Objects.equals(this.obj, that.obj);
+    }""")
+    assert "        h = 31 * h + Double.hashCode(this.h);\n" in generate_hash_code(attributes, EQUALS_FAST)
+    assert [plan.comparison for plan in plan_fields(attributes)] == [
+        "Objects.equals(this.obj, that.obj)", "this.that == that.that", "Double.compare(h, that.h) == 0"
+    ]
+
+
+def test_generate_hash_code_fast():
+    attributes = [field_exampleAttribute_int, field_someName_String, Field(name="ratio", type="double")]
+    expected = """
+    @Override
+    public int hashCode() {
+        int h = 1;
+        h = 31 * h + Integer.hashCode(exampleAttribute);
+        h = 31 * h + Objects.hashCode(someName);
+        h = 31 * h + Double.hashCode(ratio);
+        return h;
+    }"""
+    assert generate_hash_code(attributes, EQUALS_FAST) == expected
+
+
+def test_generate_hash_code_fast_cached():
+    expected = """
+    @Override
+    public int hashCode() {
+        int h = cachedHashCode;
+        if (h == 0) {
+            h = 1;
+            h = 31 * h + Objects.hashCode(someName);
+            cachedHashCode = h;
+        }
+        return h;
+    }"""
+    assert generate_hash_code([field_someName_String], EQUALS_FAST, cache_hash=True) == expected
+    assert generate_cached_hash_field() == "\n    private transient int cachedHashCode;"
+
+
+def test_generate_equals_and_hash_code_invalid_mode():
+    with pytest.raises(ValueError):
+        generate_equals("MyClass", [field_someName_String], "reflective")
+    with pytest.raises(ValueError):
+        generate_hash_code([field_someName_String], cache_hash=True)
+
+
+def test_generate_equals_and_hash_code_fast_invalid_name():
+    for name in illegal_names:
+        attr = Field(name=name, type="String")
+        with pytest.raises(ValueError):
+            generate_equals("MyClass", [attr], EQUALS_FAST)
+        with pytest.raises(ValueError):
+            generate_hash_code([attr], EQUALS_FAST)
+
+
+def test_plan_fields():
+    plans = plan_fields([field_someName_String, Field(name="ratio", type="double")])
+
+    assert [(plan.getter_name, plan.setter_name, plan.primitive) for plan in plans] == [
+        ("getSomeName", "setSomeName", False),
+        ("getRatio", "setRatio", True)
+    ]
+    assert plans[1].comparison == "Double.compare(ratio, that.ratio) == 0"
+    assert plans[1].hash_term == "Double.hashCode(ratio)"
+
+
+def test_plan_fields_invalid_name():
+    for name in illegal_names:
+        with pytest.raises(ValueError):
+            plan_fields([Field(name=name, type="String")])
+
+
+def test_render_from_plans_matches_generators():
+    attributes = [field_exampleAttribute_int, field_someName_String, Field(name="ratio", type="double")]
+    plans = plan_fields(attributes)
+
+    assert "\n".join(render_field_declarations(plans)) == generate_fields_block(attributes)
+    assert "\n".join(render_accessors(plans)) == generate_getters_and_setters(attributes)
+    assert "\n".join(render_accessors(plans, setters=False)) == generate_getters(attributes)
+    for mode in (EQUALS_STANDARD, EQUALS_FAST):
+        assert "\n".join(render_equals("MyClass", plans, mode=mode)) == generate_equals("MyClass", attributes, mode)
+        assert "\n".join(render_hash_code(plans, mode=mode)) == generate_hash_code(attributes, mode)
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from src.class_generator import generate_java_class
+from src.enum_generator import generate_enum_class
+from src.java_model import CompactEnumClass, CompactField, CompactJavaClass, compact_field, compact_model, \
+    is_enum_model
+from tests.class_reference_data import class_ChargingStation, expected_ChargingStation
+from tests.enum_reference_data import enum_AttributeEnum, expected_AttributeEnum
+from tests.reference_data import field_exampleAttribute_int
+
+
+def test_compact_field():
+    field = compact_field(field_exampleAttribute_int)
+
+    assert field == CompactField("exampleAttribute", "int", "javadoc description")
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.name = "other"
+
+
+def test_compact_model_interns_strings():
+    type_name = "".join(["Custom", "Data"])
+    first = compact_field(CompactField("customData", type_name))
+    second = compact_field(CompactField("customData", "CustomData"))
+
+    assert first.type is second.type
+
+
+def test_compact_models_are_hashable_and_picklable():
+    enum_class = compact_model(enum_AttributeEnum)
+    java_class = compact_model(class_ChargingStation)
+
+    assert isinstance(enum_class, CompactEnumClass) and is_enum_model(enum_class)
+    assert isinstance(java_class, CompactJavaClass) and not is_enum_model(java_class)
+    assert {enum_class: 1, java_class: 2}[compact_model(enum_AttributeEnum)] == 1
+    assert pickle.loads(pickle.dumps(java_class)) == java_class
+
+
+def test_generators_accept_compact_models():
+    assert generate_enum_class(compact_model(enum_AttributeEnum), "ocpp.msgDef.Enumerations") == expected_AttributeEnum
+    assert generate_java_class(compact_model(class_ChargingStation), "ocpp.msgDef.DataTypes") == expected_ChargingStation
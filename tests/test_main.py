@@ -0,0 +1,110 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.main import main
+from tests.schema_reference_data import *
+
+
+def test_main(tmp_path, capsys):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+
+    assert main([str(schema_dir), str(tmp_path / "java"), "--package", "ocpp.v201", "--workers", "1"]) == 0
+    assert (tmp_path / "java" / "ocpp" / "v201" / "BootNotificationRequest.java").is_file()
+    assert "Generated 3 Java files" in capsys.readouterr().out
+
+
+def test_main_missing_schema_dir(tmp_path, capsys):
+    assert main([str(tmp_path / "missing"), str(tmp_path / "java"), "--package", "ocpp.v201"]) == 1
+    assert "Schema directory does not exist" in capsys.readouterr().err
+
+
+def test_main_async(tmp_path, capsys):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+
+    assert main([str(schema_dir), str(tmp_path / "java"), "-p", "ocpp.v201", "-j", "1", "--async"]) == 0
+    assert "Generated 3 Java files" in capsys.readouterr().out
+
+
+def test_main_report(tmp_path, capsys):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+
+    report_path = tmp_path / "report.json"
+    assert main([str(schema_dir), str(tmp_path / "java"), "-p", "ocpp.v201", "-j", "1", "--report", str(report_path),
+                 "--top", "1"]) == 0
+    assert "slowest 1 schemas:" in capsys.readouterr().out
+    assert json.loads(report_path.read_text())["counters"]["schemas"] == 1
+
+
+def test_main_watch_missing_schema_dir(tmp_path, capsys):
+    assert main([str(tmp_path / "missing"), str(tmp_path / "java"), "-p", "ocpp.v201", "--watch"]) == 1
+    assert "Schema directory does not exist" in capsys.readouterr().err
+
+
+def test_main_imports_only_the_cli():
+    code = "import sys, src.main; print(' '.join(sys.modules))"
+    loaded = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True,
+                            check=True).stdout.split()
+
+    for module in ("asyncio", "cProfile", "ctypes", "src.async_pipeline", "src.compiler", "src.watcher"):
+        assert module not in loaded
+
+
+def test_main_enum_only_run_skips_class_generator(tmp_path):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "Status.json").write_text(json.dumps({"definitions": {"StatusEnumType": {"enum": ["A", "B"]}}}))
+    code = ("import sys; from src.main import main; "
+            f"assert main([{str(schema_dir)!r}, {str(tmp_path / 'java')!r}, '-p', 'ocpp', '-j', '1']) == 0; "
+            "print(' '.join(sys.modules))")
+    loaded = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True,
+                            check=True).stdout.split()
+
+    assert "src.enum_generator" in loaded
+    assert "src.class_generator" not in loaded
+    assert "src.java_method_generator" not in loaded
+
+
+def test_main_jar(tmp_path, capsys):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+
+    jar_path = tmp_path / "sources.jar"
+    assert main([str(schema_dir), str(jar_path), "-p", "ocpp.v201", "-j", "1", "--jar"]) == 0
+    assert "Wrote source JAR" in capsys.readouterr().out
+    assert jar_path.is_file()
+
+
+def test_main_cache_dir(tmp_path, capsys):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+
+    args = [str(schema_dir), str(tmp_path / "java"), "-p", "ocpp.v201", "-j", "1", "--cache-dir", str(tmp_path / "c")]
+    assert main(args) == 0
+    assert "Generated 3 Java files" in capsys.readouterr().out
+    assert any((tmp_path / "c").rglob("*"))
+    with pytest.raises(SystemExit):
+        main(args + ["--async"])
+
+
+def test_main_bundle(tmp_path, capsys):
+    bundle_path = tmp_path / "bundle.json"
+    bundle_path.write_text(json.dumps(schema_BootNotificationRequest))
+
+    args = [str(bundle_path), str(tmp_path / "java"), "-p", "ocpp.v201", "-j", "1", "--bundle"]
+    assert main(args + ["--root", "ChargingStationType", "--root", "BootReasonEnumType"]) == 0
+    assert "Generated 2 Java files" in capsys.readouterr().out
+    assert main(args + ["--root", "MissingType"]) == 1
+    assert "MissingType" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(args[:-1] + ["--root", "ChargingStationType"])
@@ -0,0 +1,46 @@
+import src.manifest
+from src.manifest import Manifest, generator_fingerprint, hash_options, load_manifest, save_manifest
+from src.templates import DEFAULT_STYLE, indent_style
+
+
+def test_save_and_load_manifest(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = Manifest(
+        options=hash_options("ocpp.v201"),
+        schemas={"BootNotificationRequest.json": "a1"},
+        units={"ocpp/v201/BootReasonEnum.java": "b2"},
+        outputs={"ocpp/v201/BootReasonEnum.java": "c3"})
+
+    save_manifest(path, manifest)
+
+    assert load_manifest(path) == manifest
+
+
+def test_load_manifest_missing_or_corrupt(tmp_path):
+    path = tmp_path / "manifest.json"
+    assert load_manifest(path) == Manifest()
+
+    path.write_text("{not json")
+    assert load_manifest(path) == Manifest()
+
+    path.write_text('{"version": 0, "options": "x"}')
+    assert load_manifest(path) == Manifest()
+
+
+def test_hash_options_depends_on_package():
+    assert hash_options("ocpp.v201") == hash_options("ocpp.v201")
+    assert hash_options("ocpp.v201") != hash_options("ocpp.v16")
+
+
+def test_hash_options_depends_on_style():
+    assert hash_options("ocpp.v201", style=DEFAULT_STYLE) == hash_options("ocpp.v201")
+    assert hash_options("ocpp.v201", style=indent_style("\t")) != hash_options("ocpp.v201")
+
+
+def test_hash_options_depends_on_generator_fingerprint(monkeypatch):
+    options = hash_options("ocpp.v201")
+    assert generator_fingerprint() == generator_fingerprint()
+
+    monkeypatch.setattr(src.manifest, "generator_fingerprint", lambda: "changed")
+
+    assert hash_options("ocpp.v201") != options
@@ -0,0 +1,62 @@
+import pytest
+
+from src.class_generator import generate_java_class
+from src.java_model import Field, JavaClass, JAVA_RESERVED_WORDS
+from src.naming import build_getter_name, build_setter_name, clear_name_caches, java_constant_name, \
+    java_constant_names, validate_java_identifier
+
+
+@pytest.fixture(autouse=True)
+def empty_name_caches():
+    clear_name_caches()
+    yield
+    clear_name_caches()
+
+
+def test_build_accessor_names():
+    assert build_getter_name("someName") == "getSomeName"
+    assert build_setter_name("someName") == "setSomeName"
+    assert build_getter_name("_private") == "get_private"
+
+
+def test_validate_java_identifier():
+    assert validate_java_identifier("customData") == "customData"
+    for name in ["", None, "3d", "abc-d", "abc\n", *JAVA_RESERVED_WORDS]:
+        with pytest.raises(ValueError):
+            validate_java_identifier(name)
+
+
+def test_java_constant_name():
+    assert java_constant_name("MinSet") == "MIN_SET"
+    assert java_constant_name("kit-9") == "KIT_9"
+
+
+def test_java_constant_names_match_single_conversion():
+    values = ["kitKat", "KiTKat", "aBCdEFg", "kit_9", "9a", "L2-N", "Grüße", "", "x.Y z"]
+
+    assert java_constant_names(values) == [java_constant_name(value) for value in values]
+    assert java_constant_names(["a\nb", "cD"]) == ["A_B", "C_D"]
+    assert java_constant_names([]) == []
+
+
+def test_java_constant_names_keep_duplicates():
+    assert java_constant_names(["MinSet", "Actual", "MinSet"]) == ["MIN_SET", "ACTUAL", "MIN_SET"]
+
+
+def test_java_constant_names_detect_collisions():
+    with pytest.raises(ValueError, match="'Min-Set' and 'MinSet' both map to the constant 'MIN_SET'"):
+        java_constant_names(["Actual", "Min-Set", "MinSet"])
+
+
+def test_field_names_validated_once_per_run():
+    java_class = JavaClass(name="MyClass", fields=[
+        Field(name="exampleAttribute", type="int"),
+        Field(name="someName", type="String")
+    ])
+
+    generate_java_class(java_class, "org.example")
+    generate_java_class(java_class, "org.example")
+
+    assert validate_java_identifier.cache_info().misses == 2
+    assert build_getter_name.cache_info().misses == 2
+    assert build_setter_name.cache_info().misses == 2
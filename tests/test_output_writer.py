@@ -0,0 +1,77 @@
+import os
+import zipfile
+
+import pytest
+
+from src.output_writer import JAR_MANIFEST_PATH, make_package_directories, package_directory, stream_if_changed, \
+    write_if_changed, write_source_jar
+
+
+def test_package_directory(tmp_path):
+    assert package_directory(tmp_path, "ocpp.v201") == tmp_path / "ocpp" / "v201"
+    with pytest.raises(ValueError):
+        package_directory(tmp_path, "ocpp..v201")
+
+
+def test_make_package_directories(tmp_path):
+    directories = make_package_directories(tmp_path, ["ocpp.v201", "ocpp.v16", "ocpp.v201"])
+
+    assert directories == [tmp_path / "ocpp" / "v16", tmp_path / "ocpp" / "v201"]
+    assert all(directory.is_dir() for directory in directories)
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / "A.java")
+
+    _, first_hash, written = write_if_changed(path, b"class A {}")
+    assert written
+    mtime = os.stat(path).st_mtime_ns
+
+    _, second_hash, written = write_if_changed(path, b"class A {}")
+    assert not written and second_hash == first_hash
+    assert os.stat(path).st_mtime_ns == mtime
+    assert os.listdir(tmp_path) == ["A.java"]
+
+
+def test_stream_if_changed(tmp_path):
+    path = str(tmp_path / "A.java")
+    _, content_hash, written = stream_if_changed(path, lambda sink: sink.writelines(["class A ", "{}"]))
+
+    assert written
+    assert write_if_changed(path, b"class A {}") == (path, content_hash, False)
+    assert stream_if_changed(path, lambda sink: sink.write("class A {}"))[2] is False
+    assert os.listdir(tmp_path) == ["A.java"]
+
+
+def test_stream_if_changed_failure_keeps_previous_file(tmp_path):
+    path = str(tmp_path / "A.java")
+    write_if_changed(path, b"class A {}")
+
+    def fail(sink):
+        sink.write("class B")
+        raise ValueError("render failed")
+
+    with pytest.raises(ValueError):
+        stream_if_changed(path, fail)
+    assert (tmp_path / "A.java").read_bytes() == b"class A {}"
+    assert os.listdir(tmp_path) == ["A.java"]
+
+
+def test_write_source_jar(tmp_path):
+    path = tmp_path / "out" / "sources.jar"
+    entries = [("ocpp/v201/A.java", b"class A {}"), ("ocpp/v201/B.java", b"class B {}")]
+
+    _, content_hash, written = write_source_jar(path, iter(entries))
+    assert written
+    with zipfile.ZipFile(path) as jar:
+        assert jar.namelist() == [JAR_MANIFEST_PATH, "ocpp/v201/A.java", "ocpp/v201/B.java"]
+        assert jar.read("ocpp/v201/B.java") == b"class B {}"
+
+    assert write_source_jar(path, entries) == (str(path), content_hash, False)
+    assert write_source_jar(path, entries[:1])[2] is True
+
+
+def test_write_source_jar_invalid_entry(tmp_path):
+    with pytest.raises(ValueError):
+        write_source_jar(tmp_path / "sources.jar", [("../A.java", b"")])
+    assert os.listdir(tmp_path) == []
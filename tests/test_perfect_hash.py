@@ -0,0 +1,27 @@
+from src.perfect_hash import build_perfect_hash, java_char_string, java_string_hash, perfect_hash_slot
+
+
+def test_java_string_hash():
+    assert java_string_hash("") == 0
+    assert java_string_hash("hello") == 99162322
+    assert java_string_hash("polygenelubricants") == 0x80000000
+    assert java_string_hash("\U0001F600") == (0xD83D * 31 + 0xDE00)
+
+
+def test_build_perfect_hash():
+    values = [f"Value{i}" for i in range(1000)]
+    perfect_hash = build_perfect_hash(values)
+
+    assert perfect_hash.table_size == 2048
+    assert len(set(perfect_hash.slots)) == len(values)
+    assert max(perfect_hash.displacements) <= 0xFFFF
+    assert [perfect_hash_slot(perfect_hash, value) for value in values] == perfect_hash.slots
+
+
+def test_build_perfect_hash_hash_collision():
+    assert java_string_hash("Aa") == java_string_hash("BB")
+    assert build_perfect_hash(["Aa", "BB"]) is None
+
+
+def test_java_char_string():
+    assert java_char_string([0, 10, 255, 256, 0xFFFF]) == "\\0\\12\\377\\u0100\\uffff"
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from src.manifest import hash_text
+from src.render_cache import RenderCache, TreeEntry, tree_key
+
+KEY_A = hash_text("a")
+KEY_B = hash_text("b")
+
+
+def test_render_cache_units(tmp_path):
+    cache = RenderCache(tmp_path)
+    assert cache.get_unit(KEY_A) is None
+
+    cache.put_unit(KEY_A, b"class A {}")
+
+    assert cache.has_unit(KEY_A)
+    assert cache.get_unit(KEY_A) == b"class A {}"
+    assert RenderCache(tmp_path).get_unit(KEY_A) == b"class A {}"
+
+
+def test_render_cache_trees(tmp_path):
+    cache = RenderCache(tmp_path)
+    entry = TreeEntry({"ocpp/A.java": KEY_A}, [{"name": "A", "sources": ["a.json", "b.json"], "renamed": {}}])
+
+    cache.put_tree(KEY_B, entry)
+
+    assert cache.get_tree(KEY_B) == entry
+    assert cache.get_tree(KEY_A) is None
+
+
+def test_render_cache_integrity(tmp_path):
+    cache = RenderCache(tmp_path)
+    cache.put_unit(KEY_A, b"class A {}")
+    path = next(path for path in tmp_path.rglob("*") if path.name == KEY_A)
+    path.write_bytes(path.read_bytes().replace(b"class A", b"class B"))
+
+    assert cache.get_unit(KEY_A) is None
+    assert not path.exists()
+
+
+def test_render_cache_invalid_key(tmp_path):
+    with pytest.raises(ValueError):
+        RenderCache(tmp_path).get_unit("../../etc/passwd")
+    with pytest.raises(ValueError):
+        RenderCache(tmp_path, max_bytes=-1)
+
+
+def test_render_cache_lru_eviction(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=200)
+    cache.put_unit(KEY_A, b"a" * 100)
+    cache.put_unit(KEY_B, b"b" * 100)
+    old = next(path for path in tmp_path.rglob("*") if path.name == KEY_A)
+    os.utime(old, ns=(0, 0))
+    cache.get_unit(KEY_A)
+
+    evicted = cache.evict()
+
+    assert [path.name for path in evicted] == [KEY_B]
+    assert cache.get_unit(KEY_A) == b"a" * 100
+    assert cache.size() <= 200
+
+
+def test_tree_key():
+    assert tree_key("options", {"a.json": "1", "b.json": "2"}) == tree_key("options", {"b.json": "2", "a.json": "1"})
+    assert tree_key("options", {"a.json": "1"}) != tree_key("other", {"a.json": "1"})
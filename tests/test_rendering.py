@@ -0,0 +1,93 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.class_generator import generate_java_class
+from src.enum_generator import generate_enum_class
+from src.java_model import Field, JavaClass, compact_model
+from src.rendering import RenderOptions, render_model, render_models
+from src.serializer_generator import generate_class_codec
+from src.templates import DEFAULT_STYLE, indent_style
+from tests.class_reference_data import class_ChargingStation, expected_ChargingStation
+from tests.enum_reference_data import enum_AttributeEnum, expected_AttributeEnum
+
+TABS = indent_style("\t")
+MODELS = [
+    enum_AttributeEnum,
+    class_ChargingStation,
+    JavaClass(name="Sample", fields=[
+        Field(name="name", type="String", description="Display name"),
+        Field(name="ratio", type="double"),
+        Field(name="tags", type="List<String>")
+    ]),
+    compact_model(enum_AttributeEnum)
+]
+OPTIONS = [
+    RenderOptions("ocpp.msgDef.DataTypes"),
+    RenderOptions("ocpp.msgDef.DataTypes", style=TABS),
+    RenderOptions("ocpp.tabs", style=TABS, enum_lookup="switch", equals_mode="fast"),
+    RenderOptions("ocpp.records", style=indent_style("  "), class_style="record"),
+    RenderOptions("ocpp.immutable", style=TABS, enum_lookup="perfect-hash", class_style="immutable")
+]
+
+
+def test_render_model_matches_generators():
+    options = RenderOptions("ocpp.msgDef.DataTypes")
+
+    assert render_model(class_ChargingStation, options) == expected_ChargingStation
+    assert render_model(enum_AttributeEnum, options._replace(package="ocpp.msgDef.Enumerations")) == \
+        expected_AttributeEnum
+
+
+@pytest.mark.parametrize("class_style", ["bean", "record", "immutable"])
+def test_style_only_changes_indentation(class_style):
+    default = generate_java_class(MODELS[2], "ocpp", class_style=class_style)
+    tabs = generate_java_class(MODELS[2], "ocpp", class_style=class_style, style=TABS)
+
+    assert tabs == default.replace(" " * 4, "\t")
+    assert DEFAULT_STYLE.indent_lvl1 not in tabs
+
+
+def test_style_only_changes_enum_and_codec_indentation():
+    assert generate_enum_class(enum_AttributeEnum, "ocpp", "switch", TABS) == \
+        generate_enum_class(enum_AttributeEnum, "ocpp", "switch").replace(" " * 4, "\t")
+    assert generate_class_codec(MODELS[2], "ocpp", style=TABS) == \
+        generate_class_codec(MODELS[2], "ocpp").replace(" " * 4, "\t")
+
+
+def test_render_models_preserves_order():
+    options = OPTIONS[2]
+    expected = [render_model(model, options) for model in MODELS]
+
+    assert render_models(MODELS, options, max_workers=4) == expected
+    assert render_models(MODELS, options, max_workers=1) == expected
+    assert render_models([], options) == []
+
+
+def test_render_models_rejects_invalid_worker_count():
+    with pytest.raises(ValueError):
+        render_models(MODELS, OPTIONS[0], max_workers=0)
+
+
+def test_render_models_identical_under_contention():
+    expected = {options: [render_model(model, options) for model in MODELS] for options in OPTIONS}
+    rounds = 8
+    barrier = threading.Barrier(len(OPTIONS) * 2)
+
+    def render(options: RenderOptions):
+        barrier.wait()
+        return [render_models(MODELS * 4, options, max_workers=4) for _ in range(rounds)]
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=len(OPTIONS) * 2) as executor:
+            futures = [(options, executor.submit(render, options)) for options in OPTIONS * 2]
+            results = [(options, future.result(timeout=60)) for options, future in futures]
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    for options, batches in results:
+        assert batches == [expected[options] * 4] * rounds
@@ -0,0 +1,201 @@
+import os
+
+import pytest
+
+from src.java_model import EnumClass, Field, JavaClass
+from src.schema_parser import SchemaParser, document_references, parse_schema
+from tests.schema_reference_data import *
+
+
+def test_parse_schema_definitions():
+    models = parse_schema(schema_BootNotificationRequest, "BootNotificationRequest")
+
+    assert models.enums == [EnumClass(
+        name="BootReasonEnum",
+        values=["ApplicationReset", "FirmwareUpdate", "LocalReset", "PowerUp"],
+        description="This contains the reason for sending this message to the CSMS.")]
+    assert JavaClass(
+        name="ChargingStation",
+        fields=[
+            Field(name="serialNumber", type="String", description="Device. Serial_ Number."),
+            Field(name="model", type="String"),
+            Field(name="firmwareVersions", type="List<String>")
+        ],
+        description="Charge_ Point urn:x-oca:ocpp:uid:2:233122 The physical system.") in models.classes
+
+
+def test_parse_schema_root_class():
+    models = parse_schema(schema_BootNotificationRequest, "BootNotificationRequest")
+
+    assert models.classes[-1] == JavaClass(
+        name="BootNotificationRequest",
+        fields=[
+            Field(name="chargingStation", type="ChargingStation"),
+            Field(name="reason", type="BootReasonEnum"),
+            Field(name="retries", type="Integer")
+        ])
+
+
+def test_parse_schema_inline_enum():
+    models = parse_schema(schema_CancelReservationResponse, "CancelReservationResponse")
+
+    assert [enum_class.name for enum_class in models.enums] == ["CancelReservationStatusEnum", "Note"]
+    assert models.classes[-1].fields[1] == Field(name="note", type="Note")
+
+
+def test_parse_schema_type_arrays_and_boolean_schemas():
+    schema = {"definitions": {"AnyType": True}, "properties": {
+        "name": {"type": ["string", "null"]},
+        "mode": {"type": ["string", "null"], "enum": ["Fast", "Slow", None]},
+        "tags": {"type": ["array", "null"], "items": {"type": "string"}},
+        "value": {"type": ["string", "integer"]},
+        "extra": True,
+        "any": {"$ref": "#/definitions/AnyType"}}}
+
+    models = parse_schema(schema, "Sample")
+
+    assert models.enums == [EnumClass(name="Mode", values=["Fast", "Slow"])]
+    assert [(field.name, field.type) for field in models.classes[0].fields] == [
+        ("name", "String"), ("mode", "Mode"), ("tags", "List<String>"), ("value", "Object"), ("extra", "Object"),
+        ("any", "Object")]
+
+
+@pytest.mark.parametrize("property_schema", [
+    {"type": 5},
+    {"type": "string", "description": ["not", "a", "string"]},
+    {"type": "array", "items": [{"type": "string"}]},
+    {"$ref": 5},
+    "string"
+])
+def test_parse_schema_unsupported_input(property_schema):
+    with pytest.raises(ValueError):
+        parse_schema({"properties": {"value": property_schema}}, "Sample")
+
+
+def test_parse_schema_unresolved_ref():
+    schema = {"type": "object", "properties": {"idToken": {"$ref": "#/definitions/IdTokenType"}}}
+    with pytest.raises(ValueError):
+        parse_schema(schema, "AuthorizeRequest")
+
+
+def test_parse_schema_recursive_ref():
+    schema = {
+        "definitions": {
+            "NodeType": {
+                "javaType": "Node",
+                "type": "object",
+                "properties": {
+                    "children": {"type": "array", "items": {"$ref": "#/definitions/NodeType"}},
+                    "parent": {"$ref": "#/definitions/NodeType"}
+                }
+            }
+        },
+        "type": "object",
+        "properties": {"root": {"$ref": "#/definitions/NodeType"}}
+    }
+
+    models = parse_schema(schema, "TreeRequest")
+
+    assert models.classes[0] == JavaClass(name="Node", fields=[
+        Field(name="children", type="List<Node>"),
+        Field(name="parent", type="Node")
+    ])
+
+
+def test_parse_schema_circular_alias_ref():
+    schema = {
+        "definitions": {
+            "AType": {"$ref": "#/definitions/BType"},
+            "BType": {"$ref": "#/definitions/AType"}
+        },
+        "type": "object",
+        "properties": {"a": {"$ref": "#/definitions/AType"}}
+    }
+    with pytest.raises(ValueError):
+        parse_schema(schema, "CircularRequest")
+
+
+def test_parse_schema_deep_ref_chain():
+    depth = 5000
+    definitions = {
+        f"Level{i}Type": {"type": "object", "properties": {"next": {"$ref": f"#/definitions/Level{i + 1}Type"}}}
+        for i in range(depth)
+    }
+    definitions[f"Level{depth}Type"] = {"type": "string", "enum": ["End"]}
+    schema = {"definitions": definitions, "type": "object",
+              "properties": {"first": {"$ref": "#/definitions/Level0Type"}}}
+
+    models = parse_schema(schema, "DeepRequest")
+
+    assert len(models.classes) == depth + 1
+    assert models.classes[depth - 1].fields == [Field(name="next", type=f"Level{depth}Type")]
+
+
+def test_parse_schema_alias_and_pointer_escaping():
+    schema = {
+        "definitions": {
+            "a/b": {"type": "object", "properties": {"id": {"type": "integer"}}},
+            "IdentifierStringType": {"type": "string", "maxLength": 36},
+            "IdType": {"$ref": "#/definitions/IdentifierStringType"}
+        },
+        "type": "object",
+        "properties": {
+            "slashed": {"$ref": "#/definitions/a~1b"},
+            "id": {"$ref": "#/definitions/IdType"}
+        }
+    }
+
+    models = parse_schema(schema, "AliasRequest")
+
+    assert [java_class.name for java_class in models.classes] == ["a/b", "AliasRequest"]
+    assert models.classes[-1].fields == [Field(name="slashed", type="a/b"), Field(name="id", type="String")]
+
+
+def test_schema_parser_shares_cross_file_definitions():
+    documents = {
+        "schemas/common.json": {
+            "definitions": {
+                "CustomDataType": {"javaType": "CustomData", "type": "object",
+                                   "properties": {"vendorId": {"type": "string"}}}
+            }
+        },
+        "schemas/HeartbeatRequest.json": {
+            "type": "object",
+            "properties": {"customData": {"$ref": "common.json#/definitions/CustomDataType"}}
+        },
+        "schemas/StatusRequest.json": {
+            "type": "object",
+            "properties": {"customData": {"$ref": "./common.json#/definitions/CustomDataType"}}
+        }
+    }
+    loaded = []
+
+    def loader(uri):
+        loaded.append(uri)
+        return documents[uri]
+
+    parser = SchemaParser(loader=loader)
+    heartbeat = parser.parse_file("schemas/HeartbeatRequest.json")
+    status = parser.parse_file("schemas/StatusRequest.json")
+    common = parser.parse_file("schemas/common.json")
+
+    assert heartbeat.classes[0].fields == [Field(name="customData", type="CustomData")]
+    assert status.classes[0].fields == [Field(name="customData", type="CustomData")]
+    assert [java_class.name for java_class in common.classes] == ["CustomData"]
+    assert sorted(loaded) == sorted(documents)
+    assert parser.documents() == ["schemas/HeartbeatRequest.json", "schemas/common.json",
+                                  "schemas/StatusRequest.json"]
+
+
+def test_document_references():
+    document = {
+        "definitions": {"LocalType": {"type": "string"}},
+        "properties": {
+            "local": {"$ref": "#/definitions/LocalType"},
+            "customData": {"$ref": "common.json#/definitions/CustomDataType"},
+            "items": {"type": "array", "items": [{"$ref": "../shared/IdToken.json"}]}
+        }
+    }
+
+    assert document_references(document, os.path.normpath("schemas/v201/Heartbeat.json")) == {
+        os.path.normpath("schemas/v201/common.json"), os.path.normpath("schemas/shared/IdToken.json")}
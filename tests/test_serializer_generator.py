@@ -0,0 +1,80 @@
+import pytest
+
+from src.java_model import Field, JavaClass
+from src.serializer_generator import codec_imports, generate_class_codec
+from tests.class_reference_data import *
+from tests.codec_reference_data import *
+
+class_BootNotificationRequest = JavaClass(
+    name="BootNotificationRequest",
+    fields=[
+        Field(name="chargingStation", type="ChargingStation"),
+        Field(name="reason", type="BootReasonEnum"),
+        Field(name="value", type="int")
+    ])
+
+
+def test_generate_class_codec():
+    assert generate_class_codec(class_ChargingStation, "ocpp.msgDef.DataTypes") == expected_ChargingStationCodec
+
+
+def test_generate_class_codec_nested_types():
+    codec = generate_class_codec(class_BootNotificationRequest, "ocpp.v201", {"BootReasonEnum"})
+
+    assert "                    chargingStation = ChargingStationCodec.read(parser);\n" in codec
+    assert "        return BootReasonEnum.fromValue(parser.getText());\n" in codec
+    assert "            generator.writeString(reason.value());\n" in codec
+    assert "        int value_ = value.getValue();\n        generator.writeFieldName(\"value\");\n" in codec
+    assert "        result.setValue(value_);\n" in codec
+
+
+def test_generate_class_codec_primitive_fields():
+    java_class = JavaClass(name="Sample", fields=[Field(name="count", type="int"), Field(name="flag", type="boolean"),
+                                                  Field(name="ratio", type="double"), Field(name="code", type="char"),
+                                                  Field(name="initial", type="Character")])
+    codec = generate_class_codec(java_class, "ocpp.v201")
+
+    assert "        int count = 0;\n        boolean flag = false;\n        double ratio = 0;\n" \
+           "        char code = '\\0';\n" in codec
+    assert """                case "count":
+                    if (parser.currentToken() != JsonToken.VALUE_NULL) {
+                        count = readInteger(parser);
+                    }
+                    break;
+                case "flag":
+                    if (parser.currentToken() != JsonToken.VALUE_NULL) {
+                        flag = readBoolean(parser);
+                    }
+                    break;""" in codec
+    assert "                        code = readCharacter(parser);\n" in codec
+    assert '                case "initial":\n                    initial = readCharacter(parser);\n' in codec
+    assert "    private static Character readCharacter(JsonParser parser) throws IOException {" in codec
+    assert "        generator.writeString(String.valueOf(code));\n" in codec
+    assert "CharacterCodec" not in codec
+
+
+def test_generate_class_codec_record_and_immutable():
+    record = generate_class_codec(class_ChargingStation, "ocpp.v201", class_style="record")
+    immutable = generate_class_codec(class_ChargingStation, "ocpp.v201", class_style="immutable")
+
+    assert "        return new ChargingStation(\n                serialNumber,\n                firmwareVersions);" in record
+    assert "        String serialNumber = value.serialNumber();\n" in record
+    assert "        return ChargingStation.builder()\n                .serialNumber(serialNumber)\n" in immutable
+
+
+def test_generate_class_codec_untyped_field():
+    codec = generate_class_codec(JavaClass(name="CustomData", fields=[Field(name="vendorId", type="Object")]),
+                                 "ocpp.v201")
+
+    assert "import java.util.LinkedHashMap;" in codec
+    assert "    private static Object readUntyped(JsonParser parser) throws IOException {" in codec
+
+
+def test_generate_class_codec_invalid_name():
+    with pytest.raises(ValueError):
+        generate_class_codec(JavaClass(name="Sample", fields=[Field(name="class", type="String")]), "ocpp.v201")
+
+
+def test_codec_imports():
+    assert codec_imports(["ocpp.common.BootReasonEnum", "ocpp.common.Note"], {"BootReasonEnum"}) == [
+        "ocpp.common.BootReasonEnum", "ocpp.common.Note", "ocpp.common.NoteCodec"]
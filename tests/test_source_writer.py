@@ -0,0 +1,27 @@
+import hashlib
+import io
+
+from src.source_writer import HashingWriter, iter_lines, write_chunks
+
+
+def test_iter_lines():
+    assert list(iter_lines(["a", "", "b"])) == ["a", "\n", "\nb"]
+    assert list(iter_lines([])) == []
+    assert "".join(iter_lines(["x", "y"], separator="\n\n")) == "x\n\ny"
+
+
+def test_write_chunks():
+    sink = io.StringIO()
+    write_chunks(iter_lines(["a", "b"]), sink)
+    assert sink.getvalue() == "a\nb"
+
+
+def test_hashing_writer():
+    target = io.BytesIO()
+    writer = HashingWriter(target)
+    writer.writelines(["héllo", "\n", "world" * 20000])
+    writer.flush()
+
+    expected = ("héllo\n" + "world" * 20000).encode("utf-8")
+    assert target.getvalue() == expected
+    assert writer.hexdigest() == hashlib.sha256(expected).hexdigest()
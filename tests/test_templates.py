@@ -0,0 +1,31 @@
+import pytest
+
+from src.templates import DEFAULT_STYLE, TemplateStyle, compile_template, slot
+from src.enum_generator import _enum_templates
+
+
+def test_compile_template_single_slot():
+    template = compile_template(f"class {slot('name')} extends Base<{slot('name')}> {{}}")
+    assert template.render(name="Foo") == "class Foo extends Base<Foo> {}"
+
+
+def test_compile_template_multiple_slots():
+    template = compile_template(f"{slot('a')} + {slot('b')} = {slot('a')}{slot('b')}")
+    assert template.parts == ("", " + ", " = ", "", "")
+    assert template.render(a="x", b="y") == "x + y = xy"
+
+
+def test_compile_template_without_slots():
+    assert compile_template("}").render() == "}"
+
+
+def test_compile_template_unterminated_slot():
+    with pytest.raises(ValueError):
+        compile_template("broken \x00slot")
+
+
+def test_templates_compiled_once_per_style():
+    tabs = TemplateStyle(indent_lvl1="\t", indent_lvl2="\t\t", indent_lvl3="\t\t\t", return_indent="\t\t")
+
+    assert _enum_templates(DEFAULT_STYLE) is _enum_templates(TemplateStyle())
+    assert "\n\tprivate final String value;" in _enum_templates(tabs).body.render(class_name="X")
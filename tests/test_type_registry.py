@@ -0,0 +1,78 @@
+import pytest
+
+from src.java_model import EnumClass, Field, JavaClass
+from src.schema_parser import SchemaModels
+from src.type_registry import ON_CONFLICT_ERROR, TypeRegistry, fingerprint, rename_types
+from tests.enum_reference_data import enum_AttributeEnum
+
+
+def _message(name, enum_values, description=None):
+    return SchemaModels(
+        enums=[EnumClass(name="AttributeEnum", values=enum_values, description=description)],
+        classes=[JavaClass(name=name, fields=[Field(name="attributeType", type="List<AttributeEnum>")])])
+
+
+def test_fingerprint_ignores_descriptions():
+    undocumented = EnumClass(name=enum_AttributeEnum.name, values=list(enum_AttributeEnum.values))
+    reordered = EnumClass(name=enum_AttributeEnum.name, values=list(reversed(enum_AttributeEnum.values)))
+
+    assert fingerprint(undocumented) == fingerprint(enum_AttributeEnum)
+    assert fingerprint(reordered) != fingerprint(enum_AttributeEnum)
+
+
+def test_rename_types():
+    renames = {"AttributeEnum": "GetVariablesAttributeEnum"}
+    assert rename_types("List<AttributeEnum>", renames) == "List<GetVariablesAttributeEnum>"
+    assert rename_types("AttributeEnumType", renames) == "AttributeEnumType"
+
+
+def test_identical_definitions_registered_once():
+    values = ["Actual", "Target", "MinSet", "MaxSet"]
+    registry = TypeRegistry()
+
+    types = registry.resolve([
+        ("GetVariablesRequest.json", _message("GetVariablesRequest", values, "Type of attribute.")),
+        ("SetVariablesRequest.json", _message("SetVariablesRequest", values))
+    ])
+
+    assert [registered.name for registered in types] == ["AttributeEnum", "GetVariablesRequest", "SetVariablesRequest"]
+    assert types[0].sources == ["GetVariablesRequest.json", "SetVariablesRequest.json"]
+    assert types[0].model.description == "Type of attribute."
+    assert registry.conflicts == []
+
+
+def test_conflicting_definitions_renamed_with_dependents():
+    registry = TypeRegistry()
+
+    types = registry.resolve([
+        ("GetVariablesRequest.json", _message("GetVariablesRequest", ["Actual", "Target"])),
+        ("v16/SetVariablesRequest.json", _message("SetVariablesRequest", ["Actual"]))
+    ])
+
+    by_name = {registered.name: registered for registered in types}
+    assert set(by_name) == {"AttributeEnum", "SetVariablesRequestAttributeEnum", "GetVariablesRequest",
+                            "SetVariablesRequest"}
+    assert by_name["SetVariablesRequest"].model.fields == [
+        Field(name="attributeType", type="List<SetVariablesRequestAttributeEnum>")]
+    assert by_name["GetVariablesRequest"].model.fields == [Field(name="attributeType", type="List<AttributeEnum>")]
+    assert [str(conflict) for conflict in registry.conflicts] == [
+        "'AttributeEnum' has conflicting definitions in GetVariablesRequest.json, v16/SetVariablesRequest.json; "
+        "renamed to 'SetVariablesRequestAttributeEnum' in v16/SetVariablesRequest.json"]
+
+
+def test_conflicting_definitions_error_reports_all():
+    registry = TypeRegistry(on_conflict=ON_CONFLICT_ERROR)
+    documents = [
+        ("A.json", SchemaModels(enums=[EnumClass("XEnum", ["a"]), EnumClass("YEnum", ["a"])])),
+        ("B.json", SchemaModels(enums=[EnumClass("XEnum", ["b"]), EnumClass("YEnum", ["b"])]))
+    ]
+
+    with pytest.raises(ValueError) as error:
+        registry.resolve(documents)
+
+    assert "'XEnum'" in str(error.value) and "'YEnum'" in str(error.value)
+
+
+def test_unknown_conflict_policy():
+    with pytest.raises(ValueError):
+        TypeRegistry(on_conflict="ignore")
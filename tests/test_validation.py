@@ -0,0 +1,85 @@
+from src.java_model import EnumClass, Field, JavaClass
+from src.validation import ModelIndex, ValidationIssue
+
+LINK = JavaClass(name="Link", fields=[Field(name="url", type="String"), Field(name="Url", type="String")])
+
+
+def test_accessor_collision():
+    index = ModelIndex()
+    index.add_model("ocpp", LINK)
+
+    assert index.conflicts() == [
+        ValidationIssue("ocpp.Link", "fields 'url' and 'Url' both generate 'getUrl'"),
+        ValidationIssue("ocpp.Link", "fields 'url' and 'Url' both generate 'setUrl'")
+    ]
+    assert index.accessors["ocpp.Link"] == {"getUrl": "url", "setUrl": "url"}
+
+
+def test_accessor_names_follow_class_style():
+    records = ModelIndex()
+    records.add_model("ocpp", LINK, "record")
+    immutable = ModelIndex()
+    immutable.add_model("ocpp", LINK, "immutable")
+
+    assert records.conflicts() == []
+    assert [str(issue) for issue in immutable.conflicts()] == [
+        "ocpp.Link: fields 'url' and 'Url' both generate 'getUrl'"
+    ]
+
+
+def test_duplicate_field():
+    index = ModelIndex()
+    index.add_model("ocpp", JavaClass(name="Meter", fields=[Field(name="value", type="int")] * 2))
+
+    assert [str(issue) for issue in index.conflicts()] == ["ocpp.Meter: field 'value' is defined more than once"]
+
+
+def test_duplicate_class_across_packages():
+    index = ModelIndex()
+    index.add_type("ocpp.v16", "Reason")
+    index.add_type("ocpp.v201", "Reason")
+    index.add_type("ocpp.v201", "Status")
+
+    assert index.packages == {"ocpp.v16", "ocpp.v201"}
+    assert [str(issue) for issue in index.conflicts()] == [
+        "Reason: class is defined more than once: ocpp.v16.Reason, ocpp.v201.Reason"
+    ]
+
+
+def test_enum_constants():
+    index = ModelIndex()
+    index.add_model("ocpp", EnumClass(name="ModeEnum", values=["kitKat", "kit-kat", "Kit_Kat", "9", "On"]))
+
+    assert [str(issue) for issue in index.conflicts()] == [
+        "ocpp.ModeEnum: enum values 'kitKat', 'kit-kat', 'Kit_Kat' all map to the constant 'KIT_KAT'",
+        "ocpp.ModeEnum: Invalid Java identifier: '9'"
+    ]
+    assert index.constants["ocpp.ModeEnum"] == {"ON": "On"}
+    assert "ocpp.ModeEnum" not in index.constant_names
+
+
+def test_enum_constant_names():
+    index = ModelIndex()
+    index.add_model("ocpp", EnumClass(name="ModeEnum", values=["On", "kitKat", "On"]))
+
+    assert index.conflicts() == []
+    assert index.constant_names["ocpp.ModeEnum"] == ["ON", "KIT_KAT", "ON"]
+
+
+def test_invalid_package_reported_once():
+    index = ModelIndex()
+    for name in ("First", "Second", "Third"):
+        index.add_type("ocpp.2", name)
+
+    assert [str(issue) for issue in index.conflicts()] == ["ocpp.2: Invalid package: 'ocpp.2'"]
+
+
+def test_reports_every_issue():
+    index = ModelIndex()
+    index.add_model("ocpp", LINK, "immutable")
+    index.add_model("ocpp", JavaClass(name="class", fields=[Field(name="int", type="int")]))
+    index.add_model("ocpp.v201", EnumClass(name="Link", values=["A", "a"]))
+
+    assert [issue.subject for issue in index.conflicts()] == [
+        "ocpp.Link", "ocpp.class", "ocpp.class", "ocpp.v201.Link", "Link"
+    ]
@@ -0,0 +1,220 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.compiler import compile_directory
+from src.manifest import MANIFEST_NAME
+from src.schema_parser import SchemaParser
+from src.watcher import InotifyWatcher, PollingWatcher, WatchSession, WatchUpdate, create_watcher, watch
+from tests.schema_reference_data import *
+
+schema_Common = {
+    "definitions": {
+        "CustomDataType": {"javaType": "CustomData", "type": "object",
+                           "properties": {"vendorId": {"type": "string"}}}
+    }
+}
+schema_Heartbeat = {
+    "type": "object",
+    "properties": {"customData": {"$ref": "common.json#/definitions/CustomDataType"}}
+}
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    directory = tmp_path / "schemas"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "BootNotificationRequest.json").write_text(json.dumps(schema_BootNotificationRequest))
+    (directory / "nested" / "CancelReservationResponse.json").write_text(json.dumps(schema_CancelReservationResponse))
+    (directory / "common.json").write_text(json.dumps(schema_Common))
+    (directory / "HeartbeatRequest.json").write_text(json.dumps(schema_Heartbeat))
+    return directory
+
+
+def _java_files(directory):
+    return {path.relative_to(directory).as_posix(): path.read_text() for path in directory.rglob("*.java")}
+
+
+def test_watch_session_build_matches_compile_directory(schema_dir, tmp_path):
+    update = WatchSession(schema_dir, tmp_path / "watch", "ocpp.v201").build()
+    compile_directory(schema_dir, tmp_path / "batch", "ocpp.v201", workers=1)
+
+    assert len(update.changed) == 4
+    assert _java_files(tmp_path / "watch") == _java_files(tmp_path / "batch")
+    assert json.loads((tmp_path / "watch" / MANIFEST_NAME).read_text()) == \
+        json.loads((tmp_path / "batch" / MANIFEST_NAME).read_text())
+
+
+def test_watch_session_update_renders_affected_units(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+
+    common = dict(schema_Common)
+    common["definitions"] = {"CustomDataType": {"javaType": "CustomData", "type": "object",
+                                                "properties": {"vendorId": {"type": "integer"}}}}
+    (schema_dir / "common.json").write_text(json.dumps(common))
+    update = session.update([schema_dir / "common.json", schema_dir / "BootNotificationRequest.json"])
+
+    assert update.changed == ["common.json"]
+    assert update.affected == ["HeartbeatRequest.json", "common.json"]
+    assert [path.name for path in update.result.written] == ["CustomData.java"]
+    assert "private Integer vendorId;" in (tmp_path / "java" / "ocpp" / "v201" / "CustomData.java").read_text()
+
+
+def test_watch_session_update_parses_affected_schemas(schema_dir, tmp_path, monkeypatch):
+    session = WatchSession(schema_dir, tmp_path / "watch", "ocpp.v201")
+    session.build()
+    parsed = []
+    parse_document = SchemaParser.parse_document
+    monkeypatch.setattr(SchemaParser, "parse_document", lambda parser, uri, *args: parsed.append(
+        Path(uri).relative_to(schema_dir).as_posix()) or parse_document(parser, uri, *args))
+
+    common = {"definitions": {"CustomDataType": {"javaType": "VendorData", "type": "object",
+                                                 "properties": {"vendorId": {"type": "string"}}}}}
+    (schema_dir / "common.json").write_text(json.dumps(common))
+    session.update([schema_dir / "common.json"])
+    assert parsed == ["HeartbeatRequest.json", "common.json"]
+
+    parsed.clear()
+    (schema_dir / "BootNotificationRequest.json").write_text(json.dumps(
+        dict(schema_BootNotificationRequest, description="Changed")))
+    update = session.update([schema_dir / "BootNotificationRequest.json"])
+    assert parsed == ["BootNotificationRequest.json"]
+    assert [path.name for path in update.result.written] == ["BootNotificationRequest.java"]
+
+    compile_directory(schema_dir, tmp_path / "batch", "ocpp.v201", workers=1)
+    assert _java_files(tmp_path / "watch") == _java_files(tmp_path / "batch")
+
+
+def test_watch_session_update_unchanged_content(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    os.utime(schema_dir / "common.json")
+
+    update = session.update([schema_dir / "common.json"])
+
+    assert update.changed == []
+    assert update.result.written == []
+
+
+def test_watch_session_update_removed_schema(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    (schema_dir / "nested" / "CancelReservationResponse.json").unlink()
+
+    update = session.update([schema_dir / "nested" / "CancelReservationResponse.json"])
+
+    assert update.changed == ["nested/CancelReservationResponse.json"]
+    assert sorted(path.name for path in update.result.removed) == [
+        "CancelReservationResponse.java", "CancelReservationStatusEnum.java", "Note.java"]
+
+
+def test_watch_session_update_invalid_json(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    (schema_dir / "HeartbeatRequest.json").write_text("{")
+
+    update = session.update([schema_dir / "HeartbeatRequest.json"])
+    assert update.changed == []
+    assert update.errors and "HeartbeatRequest.json" in update.errors[0]
+
+    schema = dict(schema_Heartbeat, description="Heartbeat")
+    (schema_dir / "HeartbeatRequest.json").write_text(json.dumps(schema))
+    update = session.update([schema_dir / "HeartbeatRequest.json"])
+    assert update.errors == []
+    assert [path.name for path in update.result.written] == ["HeartbeatRequest.java"]
+
+
+def test_watch_session_update_unreadable_schema(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    (schema_dir / "Broken.json").mkdir()
+
+    update = session.update([schema_dir / "Broken.json"])
+
+    assert update.changed == []
+    assert update.errors and "Broken.json" in update.errors[0]
+
+
+def test_watch_session_update_reports_parse_errors(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    (schema_dir / "HeartbeatRequest.json").write_text(json.dumps({"properties": {"interval": {"type": 5}}}))
+
+    update = session.update([schema_dir / "HeartbeatRequest.json"])
+    assert update.changed == ["HeartbeatRequest.json"]
+    assert update.errors and "HeartbeatRequest.json" in update.errors[0]
+
+    (schema_dir / "HeartbeatRequest.json").write_text(json.dumps(dict(schema_Heartbeat, description="Ping")))
+    update = session.update([schema_dir / "HeartbeatRequest.json"])
+    assert update.errors == []
+    assert [path.name for path in update.result.written] == ["HeartbeatRequest.java"]
+
+
+def test_polling_watcher(schema_dir):
+    watcher = PollingWatcher(schema_dir, interval=0.01)
+    assert watcher.wait(0) == set()
+
+    (schema_dir / "nested" / "Added.json").write_text("{}")
+    assert watcher.wait(1) == {os.path.join(str(schema_dir), "nested", "Added.json")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher(schema_dir):
+    watcher = InotifyWatcher(schema_dir)
+    try:
+        assert watcher.wait(0) == set()
+        (schema_dir / "nested" / "deeper").mkdir()
+        (schema_dir / "common.json").write_text(json.dumps(schema_Common))
+
+        changed = watcher.wait(1)
+        assert os.path.join(str(schema_dir), "common.json") in changed
+
+        (schema_dir / "nested" / "deeper" / "Added.json").write_text("{}")
+        assert os.path.join(str(schema_dir), "nested", "deeper", "Added.json") in watcher.wait(1)
+    finally:
+        watcher.close()
+
+
+def test_create_watcher_polling(schema_dir):
+    assert isinstance(create_watcher(schema_dir, polling=True), PollingWatcher)
+
+
+def test_watch_loop(schema_dir, tmp_path):
+    session = WatchSession(schema_dir, tmp_path / "java", "ocpp.v201")
+    session.build()
+    stop = threading.Event()
+    updates = []
+
+    class OneShotWatcher:
+        def wait(self, timeout):
+            stop.set()
+            (schema_dir / "HeartbeatRequest.json").write_text(json.dumps(dict(schema_Heartbeat, description="Ping")))
+            return {str(schema_dir / "HeartbeatRequest.json")}
+
+    watch(session, OneShotWatcher(), updates.append, pytest.fail, stop)
+
+    assert len(updates) == 1 and isinstance(updates[0], WatchUpdate)
+    assert updates[0].changed == ["HeartbeatRequest.json"]
+
+
+def test_watch_loop_survives_os_errors(schema_dir):
+    stop = threading.Event()
+    errors = []
+
+    class FailingSession:
+        def update(self, paths):
+            stop.set()
+            raise PermissionError("Permission denied")
+
+    class OneShotWatcher:
+        def wait(self, timeout):
+            return {str(schema_dir / "HeartbeatRequest.json")}
+
+    watch(FailingSession(), OneShotWatcher(), pytest.fail, errors.append, stop)
+
+    assert [type(error) for error in errors] == [PermissionError]